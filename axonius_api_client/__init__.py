@@ -38,11 +38,24 @@ POST_DOTENV: dict = setup_env.get_env_ax()
 """AX.* env variables after loading dotenv."""
 
 try:
-    from . import api, auth, cert_human, cli, constants, data, exceptions, http, logs, tools
+    from . import (
+        api,
+        auth,
+        cert_human,
+        cli,
+        constants,
+        data,
+        exceptions,
+        http,
+        json_codec,
+        logs,
+        tools,
+    )
     from .api import (
         ActivityLogs,
         Adapters,
         ApiEndpoints,
+        AsyncAssets,
         Cnx,
         Dashboard,
         Devices,
@@ -62,9 +75,10 @@ try:
         WizardText,
     )
     from .auth import ApiKey
+    from .async_connect import AsyncConnect
     from .connect import Connect
     from .features import Features
-    from .http import Http
+    from .http import AsyncHttp, Http
 except Exception:  # pragma: no cover
     raise
 
@@ -74,8 +88,10 @@ LOG = logs.LOG
 __all__ = (
     # API client
     "Connect",
+    "AsyncConnect",
     # HTTP client
     "Http",
+    "AsyncHttp",
     # API authentication
     "ApiKey",
     # API
@@ -102,6 +118,7 @@ __all__ = (
     "WizardText",
     "ActivityLogs",
     "ApiEndpoints",
+    "AsyncAssets",
     "Features",
     # modules
     "api",
@@ -111,6 +128,7 @@ __all__ = (
     "data",
     "exceptions",
     "http",
+    "json_codec",
     "logs",
     "tools",
     "version",
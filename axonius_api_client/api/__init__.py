@@ -4,7 +4,7 @@ from . import api_endpoints, json_api
 from .adapters import Adapters, Cnx
 from .api_endpoint import ApiEndpoint
 from .api_endpoints import ApiEndpoints
-from .assets import Devices, Users
+from .assets import AsyncAssets, Devices, Users
 from .enforcements import Enforcements
 from .openapi import OpenAPISpec
 from .system import (
@@ -25,6 +25,7 @@ from .wizards import Wizard, WizardCsv, WizardText
 
 __all__ = (
     "Adapters",
+    "AsyncAssets",
     "Cnx",
     "Dashboard",
     "Devices",
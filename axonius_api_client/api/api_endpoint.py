@@ -7,6 +7,7 @@ from typing import List, Optional, Tuple, Type, Union
 
 import requests
 
+from .. import json_codec
 from ..constants.general import JSON_TYPES
 from ..exceptions import (
     InvalidCredentials,
@@ -19,7 +20,7 @@ from ..exceptions import (
     ResponseLoadObjectError,
     ResponseNotOk,
 )
-from ..http import Http
+from ..http import AsyncHttp, Http
 from ..logs import get_obj_log
 from ..tools import combo_dicts, get_cls_path, json_log
 from .json_api.base import BaseModel, BaseSchema, BaseSchemaJson
@@ -134,6 +135,28 @@ class ApiEndpoint:
         )
         return response if raw else self.handle_response(http=http, **kwargs)
 
+    async def perform_request_async(
+        self, http: AsyncHttp, request_obj: Optional[BaseModel] = None, raw: bool = False, **kwargs
+    ) -> Union[BaseModel, JSON_TYPES]:
+        """Perform a request to this endpoint using an asyncio http object.
+
+        Args:
+            http (AsyncHttp): asyncio HTTP object to use to send request
+            request_obj (Optional[BaseModel], optional): dataclass containing
+                object to serialize for the request
+            raw (bool): return the raw requests.Response object
+            **kwargs: passed to :meth:`get_http_args` and :meth:`handle_response`
+
+        Returns:
+            Union[BaseModel, JSON_TYPES]: the data loaded from the response received
+        """
+        self.log.debug(f"{self!r} Performing async request, request_obj type {type(request_obj)}")
+        http_args = self.get_http_args(request_obj=request_obj, **kwargs)
+        kwargs["response"] = response = await http(**http_args)
+        if raw:
+            return response
+        return await http.run(self.handle_response, http=http.http, **kwargs)
+
     def perform_request_raw(
         self, http: Http, request_obj: Optional[BaseModel] = None, **kwargs
     ) -> Union[BaseModel, JSON_TYPES]:
@@ -247,6 +270,11 @@ class ApiEndpoint:
     def get_response_json(self, response: requests.Response) -> JSON_TYPES:
         """Get the JSON from a response.
 
+        Notes:
+            The JSON is decoded from the bytes of the response using
+            :func:`axonius_api_client.json_codec.loads` instead of building the text of the
+            response first.
+
         Args:
             response (requests.Response): response to handle
 
@@ -257,7 +285,7 @@ class ApiEndpoint:
             JSON_TYPES: deserialized JSON from response
         """
         try:
-            data = response.json()
+            data = json_codec.loads(response.content)
         except Exception as exc:
             raise JsonInvalidError(
                 msg=f"Response has invalid JSON\nWhile in {self}", response=response, exc=exc
@@ -37,6 +37,7 @@ class Assets(ApiEndpointGroup):
         request_model_cls=json_api.assets.AssetRequest,
         response_schema_cls=None,
         response_model_cls=json_api.assets.AssetsPage,
+        http_args={"idempotent": True},
     )
     # PBUG: include_notes=True ignored if fields are specified
 
@@ -57,6 +58,7 @@ class Assets(ApiEndpointGroup):
         request_model_cls=json_api.assets.CountRequest,
         response_schema_cls=None,
         response_model_cls=json_api.assets.Count,
+        http_args={"idempotent": True},
     )
     # PBUG: returns None until celery finished, want a blocking return until celery returns
 
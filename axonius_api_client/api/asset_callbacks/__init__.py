@@ -4,7 +4,10 @@ from .base import Base
 from .base_csv import Csv
 from .base_json import Json
 from .base_json_to_csv import JsonToCsv
+from .base_parquet import Parquet
+from .base_sqlite import Sqlite
 from .base_table import Table
+from .base_tee import Tee
 from .base_xlsx import Xlsx
 from .base_xml import Xml
 from .tools import CB_MAP, get_callbacks_cls
@@ -17,6 +20,9 @@ __all__ = (
     "Xlsx",
     "Xml",
     "JsonToCsv",
+    "Parquet",
+    "Sqlite",
+    "Tee",
     "get_callbacks_cls",
     "CB_MAP",
 )
@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 """Base callbacks."""
+import concurrent.futures
 import logging
 import pathlib
-import re
 import sys
-from typing import IO, Generator, List, Optional, Tuple, Union
+from typing import IO, Generator, List, Optional, Set, Tuple, Union
 
 from ... import DEFAULT_PATH
-from ...constants.api import FIELD_JOINER, FIELD_TRIM_LEN, FIELD_TRIM_STR
+from ...constants.api import FIELD_JOINER, FIELD_TRIM_LEN, TAGS_CHUNK_SIZE
 from ...constants.fields import AGG_ADAPTER_NAME, SCHEMAS_CUSTOM
 from ...exceptions import ApiError
 from ...parsers.fields import schema_custom
@@ -29,6 +29,17 @@ from ...tools import (
     path_backup_file,
     strip_right,
 )
+from .compress import COMPRESSIONS, get_compression, open_compressed
+from .plan import (
+    EXCLUDED_KEYS_TYPE,
+    CallbackPlan,
+    ComplexSpec,
+    NullSpec,
+    get_excluded_keys,
+    is_excluded,
+)
+from .rotate import ROTATE_CHECK_ROWS, get_manifest_path, get_part_path, write_manifest
+from .workers import CallbackWorkers
 
 
 class Base:
@@ -97,10 +108,21 @@ class Base:
 
             >>> assets = apiobj.get(tags_add=["tag1", "tag2"], tags_remove=["tag3", "tag4"])
 
+            Add tags to all assets returned, sending a request for every 500 assets from a
+            background thread while the fetch is running.
+
+            >>> assets = apiobj.get(tags_add=["tag1"], tags_chunk_size=500, tags_background=True)
+
             Generate a report of adapters that are missing from each asset.
 
             >>> assets = apiobj.get(report_adapters_missing=True)
 
+            Get the number of assets missing each adapter across the whole fetch, which is
+            also echoed when the fetch is finished.
+
+            >>> apiobj.LAST_CALLBACKS.get_report_adapters_missing_summary()
+            {'rows': 2, 'adapters': {'aws_adapter': 2, 'tanium_adapter': 1}}
+
             Generate a report of installed software that does not match a list of regex for each
             asset.
 
@@ -126,6 +148,11 @@ class Base:
             ...
             >>> assets = apiobj.get(custom_cbs=[custom_cb1])
 
+            Run the field callbacks (excludes, null values, flatten, explode, join, titles,
+            compress, and replace) for each page across 4 processes.
+
+            >>> assets = apiobj.get(field_flatten=True, field_join=True, callback_workers=4)
+
         See Also:
             * :meth:`args_map_custom` for callback specific arguments to format and export data.
 
@@ -170,12 +197,15 @@ class Base:
             "field_null_value_complex": [],
             "tags_add": [],
             "tags_remove": [],
+            "tags_chunk_size": TAGS_CHUNK_SIZE,
+            "tags_background": False,
             "report_adapters_missing": False,
             "report_software_whitelist": [],
             "page_progress": 10000,
             "do_echo": False,
             "custom_cbs": [],
             "debug_timing": False,
+            "callback_workers": 1,
         }
 
     def get_arg_value(self, arg: str) -> Union[str, list, bool, int]:
@@ -184,7 +214,12 @@ class Base:
         Args:
             arg: key to get from :attr:`GETARGS` with a default value from :meth:`args_map`
         """
-        return self.GETARGS.get(arg, self.args_map()[arg])
+        if arg in self.GETARGS:
+            return self.GETARGS[arg]
+
+        if not hasattr(self, "_args_map"):
+            self._args_map = self.args_map()
+        return self._args_map[arg]
 
     def set_arg_value(self, arg: str, value: Union[str, list, bool, int]):
         """Set an argument value.
@@ -222,6 +257,9 @@ class Base:
         self.GETARGS: dict = getargs or {}
         self.TAG_ROWS_ADD: List[dict] = []
         self.TAG_ROWS_REMOVE: List[dict] = []
+        self.TAG_IDS_ADD: Set[str] = set()
+        self.TAG_IDS_REMOVE: Set[str] = set()
+        self.TAG_FUTURES: List[concurrent.futures.Future] = []
         self.CUSTOM_CB_EXC: List[dict] = []
         self._init()
 
@@ -265,10 +303,17 @@ class Base:
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         self.do_tagging()
+        self.close_callback_workers()
+        self.echo_report_adapters_missing_summary()
         self.echo(msg=f"Stopping {self}")
 
-    def echo_page_progress(self):
-        """Echo progress per N rows using an echo method."""
+    def echo_page_progress(self, row_count: int = 1):
+        """Echo progress per N rows using an echo method.
+
+        Args:
+            row_count: number of rows just processed, progress is echoed if any of them
+                would have been echoed when processed one at a time
+        """
         page_progress = self.get_arg_value("page_progress")
         if not page_progress or not isinstance(page_progress, int):
             return
@@ -278,8 +323,9 @@ class Base:
         taken = self.STATE.get("fetch_seconds_total", 0) or 0
         page_total = self.STATE.get("pages_to_fetch_total", 0) or 0
         page_num = self.STATE.get("page_number", 0) or 0
+        prev = proc - max(row_count, 1)
 
-        if not ((proc % page_progress == 0) or (proc >= total) or (proc <= 1)):
+        if not ((proc // page_progress > prev // page_progress) or (proc >= total) or (prev < 1)):
             return
 
         percent = calc_percent(part=proc, whole=total)
@@ -310,17 +356,47 @@ class Base:
         self.echo_page_progress()
         return rows
 
+    def do_pre_page(self, rows: Union[List[dict], dict]) -> List[dict]:
+        """Pre-processing callbacks for current page of rows.
+
+        Args:
+            rows: rows to process
+        """
+        rows = listify(rows)
+        self.CURRENT_ROWS = rows
+        self.STATE.setdefault("rows_processed_total", 0)
+        self.STATE["rows_processed_total"] += len(rows)
+        self.echo_columns()
+        if rows:
+            self.echo_page_progress(row_count=len(rows))
+        return rows
+
     def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
         """Process the callbacks for current row.
 
         Args:
             row: row to process
         """
-        rows = listify(row)
-        rows = self.do_pre_row(rows=rows)
+        return self.process_page(rows=listify(row))
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows.
+
+        Notes:
+            Each callback in :attr:`callbacks` (and each custom callback) is called once with
+            all of the rows of the page.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
         rows = self.do_row(rows=rows)
         return rows
 
+    def check_stop(self):
+        """Check if the fetch should be stopped after a page has been processed."""
+        pass
+
     @property
     def callbacks(self) -> list:
         """Get order of callbacks to run."""
@@ -340,28 +416,105 @@ class Base:
             self.do_change_field_replace,
         ]
 
+    @property
+    def plan(self) -> CallbackPlan:
+        """Get the plan compiled from the arguments and selected schemas of this object.
+
+        Notes:
+            The plan is compiled the first time rows are processed, since the selected schemas
+            include any fields returned in the first rows. Arguments changed after that point
+            will not be used by the callbacks.
+        """
+        if not hasattr(self, "_plan"):
+            self._plan = CallbackPlan.from_callbacks(callbacks=self)
+        return self._plan
+
+    @property
+    def callbacks_enabled(self) -> list:
+        """Get the callbacks from :attr:`callbacks` that are not disabled by :attr:`plan`."""
+        if not hasattr(self, "_callbacks_enabled"):
+            disabled = self.plan.callbacks_disabled
+            self._callbacks_enabled = [
+                x for x in self.callbacks if getattr(x, "__name__", None) not in disabled
+            ]
+        return self._callbacks_enabled
+
+    @property
+    def callback_workers(self) -> Optional[CallbackWorkers]:
+        """Get the process pool to run callbacks in if callback_workers is more than 1."""
+        if not hasattr(self, "_callback_workers"):
+            workers = coerce_int(
+                self.get_arg_value("callback_workers") or 1,
+                min_value=1,
+                errmsg="Invalid value for callback_workers",
+            )
+            self._callback_workers = (
+                CallbackWorkers(callbacks=self, workers=workers) if workers > 1 else None
+            )
+        return self._callback_workers
+
+    def process_pending(self) -> List[dict]:
+        """Process the pages that are still being run by :attr:`callback_workers`.
+
+        Notes:
+            With callback_workers, :meth:`process_page` returns (and writes) the rows of the
+            pages that the workers have finished, which may be the rows of previous pages.
+            This must be called after the last page and before :meth:`stop` to wait for the
+            rest of the pages and process them the same way.
+
+        Returns:
+            List[dict]: rows returned by :meth:`process_page` for the pending pages
+        """
+        callback_workers = getattr(self, "_callback_workers", None)
+        if not callback_workers or not callback_workers.pending:
+            return []
+
+        callback_workers.draining = True
+        try:
+            return listify(self.process_page(rows=[]))
+        finally:
+            callback_workers.draining = False
+
+    @property
+    def callback_workers_draining(self) -> bool:
+        """Check if :meth:`process_pending` is processing the pages of callback_workers."""
+        callback_workers = getattr(self, "_callback_workers", None)
+        return bool(callback_workers and callback_workers.draining)
+
+    def close_callback_workers(self):
+        """Stop the process pool from :attr:`callback_workers` if it was started."""
+        callback_workers = getattr(self, "_callback_workers", None)
+        if callback_workers:
+            callback_workers.close()
+
     def do_row(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Execute the callbacks for current row.
 
         Args:
             rows: rows to process
         """
-        debug_timing = self.get_arg_value("debug_timing")
-        p_start = dt_now()
+        callbacks = self.callbacks_enabled
+        callback_workers = self.callback_workers
 
-        for cb in self.callbacks:
-            cb_start = dt_now()
-            rows = cb(rows=rows)
+        if callback_workers and (len(listify(rows)) > 1 or callback_workers.pending):
+            callbacks = [*callback_workers.callbacks_local, callback_workers.run]
 
-            if debug_timing:  # pragma: no cover
-                cb_delta = dt_now() - cb_start
-                self.LOG.debug(f"CALLBACK {cb} took {cb_delta} for {len(rows)} rows")
+        if not self.get_arg_value("debug_timing"):
+            for cb in callbacks:
+                rows = cb(rows=rows)
+            return rows
 
-        if debug_timing:  # pragma: no cover
-            p_delta = dt_now() - p_start
-            self.LOG.debug(f"CALLBACKS TOOK {p_delta} for {len(rows)} rows")
+        p_start = dt_now()  # pragma: no cover
 
-        return rows
+        for cb in callbacks:  # pragma: no cover
+            cb_start = dt_now()
+            rows = cb(rows=rows)
+            cb_delta = dt_now() - cb_start
+            self.LOG.debug(f"CALLBACK {cb} took {cb_delta} for {len(rows)} rows")
+
+        p_delta = dt_now() - p_start  # pragma: no cover
+        self.LOG.debug(f"CALLBACKS TOOK {p_delta} for {len(rows)} rows")  # pragma: no cover
+        return rows  # pragma: no cover
 
     def do_custom_cbs(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Execute any custom callbacks for current row.
@@ -392,36 +545,34 @@ class Base:
         if not self.get_arg_value("field_null"):
             return rows
 
+        specs = self.plan.nulls
         for row in rows:
-            for schema in self.schemas_selected:
-                self._do_add_null_values(row=row, schema=schema)
+            self._do_add_null_values(row=row, specs=specs)
         return rows
 
-    def _do_add_null_values(self, row: dict, schema: dict, key: str = "name_qual"):
+    def _do_add_null_values(self, row: dict, specs: Tuple[NullSpec, ...]):
         """Null out missing fields.
 
         Args:
-            row: row being processed
-            schema: field schema to add null values for
-            key: key of field schema to add null value for in row
+            row: row (or item of a complex field) being processed
+            specs: fields from :attr:`plan` to add null values for
         """
-        if self.is_excluded(schema=schema):
-            return row
+        plan = self.plan
 
-        null_value = self.get_arg_value("field_null_value")
-        complex_null_value = self.get_arg_value("field_null_value_complex")
+        for spec in specs:
+            field = spec.key
 
-        field = schema[key]
+            if spec.is_complex:
+                if field in row:
+                    row[field] = listify(row[field])
+                else:
+                    row[field] = list(listify(plan.null_value_complex))
 
-        if schema["is_complex"]:
-
-            row[field] = listify(row.get(field, complex_null_value))
-
-            for item in row[field]:
-                for sub_schema in self.get_sub_schemas(schema=schema):
-                    self._do_add_null_values(schema=sub_schema, row=item, key="name")
-        else:
-            row[field] = row.get(field, null_value)
+                if spec.sub_specs:
+                    for item in row[field]:
+                        self._do_add_null_values(row=item, specs=spec.sub_specs)
+            elif field not in row:
+                row[field] = plan.null_value
 
     def do_excludes(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Asset callback to remove fields from row.
@@ -443,17 +594,15 @@ class Base:
         Args:
             row: row being processed
         """
-        for schema in self.schemas_selected:
-            if self.is_excluded(schema=schema):
-                row.pop(schema["name_qual"], None)
-                continue
+        plan = self.plan
 
-            if schema["is_complex"]:
-                items = listify(row.get(schema["name_qual"], []))
-                for sub_schema in schema["sub_fields"]:
-                    if self.is_excluded(schema=sub_schema):
-                        for item in items:
-                            item.pop(sub_schema["name"], None)
+        for field in plan.excludes:
+            row.pop(field, None)
+
+        for field, sub_fields in plan.excludes_sub:
+            for item in listify(row.get(field, [])):
+                for sub_field in sub_fields:
+                    item.pop(sub_field, None)
 
     def do_join_values(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Join values.
@@ -475,9 +624,10 @@ class Base:
         Args:
             row: row being processed
         """
-        joiner = str(self.get_arg_value("field_join_value"))
-        trim_len = coerce_int(self.get_arg_value("field_join_trim"))
-        trim_str = FIELD_TRIM_STR
+        plan = self.plan
+        joiner = plan.join_value
+        trim_len = plan.join_trim
+        trim_str = plan.join_trim_str
 
         for field in row:
             if isinstance(row[field], list):
@@ -498,7 +648,12 @@ class Base:
         if not self.field_replacements:
             return rows
 
-        rows = [{self._field_replace(key=k): v for k, v in row.items()} for row in rows]
+        renames = self.plan.renames_replace
+        replace = self._field_replace
+        rows = [
+            {(renames[k] if k in renames else replace(key=k)): v for k, v in row.items()}
+            for row in rows
+        ]
         return rows
 
     def _field_replace(self, key: str) -> str:
@@ -539,7 +694,13 @@ class Base:
         rows = listify(rows)
         if not self.get_arg_value("field_compress"):
             return rows
-        rows = [{self._field_compress(key=k): v for k, v in row.items()} for row in rows]
+
+        renames = self.plan.renames_compress
+        compress = self._field_compress
+        rows = [
+            {(renames[k] if k in renames else compress(key=k)): v for k, v in row.items()}
+            for row in rows
+        ]
         return rows
 
     def _field_compress(self, key: str) -> str:
@@ -584,12 +745,9 @@ class Base:
         Args:
             row: row being processed
         """
-        null_value = self.get_arg_value("field_null_value")
+        null_value = self.plan.null_value
 
-        for schema in self.final_schemas:
-            title = schema["column_title"]
-            name = schema["name_qual"]
-            is_complex = schema["is_complex"]
+        for name, title, is_complex in self.plan.titles:
             default = [] if is_complex else null_value
             row[title] = row.pop(name, default)
 
@@ -603,38 +761,37 @@ class Base:
         if not self.get_arg_value("field_flatten"):
             return rows
 
+        specs = self.plan.flattens
         for row in rows:
-            for schema in self.schemas_selected:
-                if self.schema_to_explode != schema:
-                    self._do_flatten_fields(row=row, schema=schema)
+            for spec in specs:
+                self._do_flatten_fields(row=row, spec=spec)
 
         return rows
 
-    def _do_flatten_fields(self, row: dict, schema: dict):
+    def _do_flatten_fields(self, row: dict, spec: Optional[ComplexSpec]):
         """Asset callback to flatten complex fields.
 
         Args:
             row: row being processed
-            schema: schema to use when flattening
+            spec: complex field from :attr:`plan` to flatten
         """
-        if self.is_excluded(schema=schema):
-            return
-
-        if not schema["is_complex"]:
+        if not spec or not spec.is_complex:
             return
 
-        null_value = self.get_arg_value("field_null_value")
+        null_value = self.plan.null_value
 
-        items = listify(row.pop(schema["name_qual"], []))
+        items = listify(row.pop(spec.name_qual, []))
 
-        for sub_schema in self.get_sub_schemas(schema=schema):
-            row[sub_schema["name_qual"]] = []
+        for name, name_qual in spec.sub_fields:
+            row[name_qual] = values = []
             # TBD: handle complex sub-fields
 
             for item in items:
-                value = item.pop(sub_schema["name"], null_value)
-                value = value if isinstance(value, list) else [value]
-                row[sub_schema["name_qual"]] += value
+                value = item.pop(name, null_value)
+                if isinstance(value, list):
+                    values += value
+                else:
+                    values.append(value)
 
     def do_explode_field(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Explode a field into multiple rows.
@@ -645,7 +802,7 @@ class Base:
         rows = listify(rows)
         explode = self.get_arg_value("field_explode")
 
-        if not explode or self.is_excluded(schema=self.schema_to_explode):
+        if not explode or not self.plan.explode:
             return rows
 
         new_rows = []
@@ -659,50 +816,140 @@ class Base:
         Args:
             row: row being processed
         """
-        null_value = self.get_arg_value("field_null_value")
+        null_value = self.plan.null_value
 
-        schema = self.schema_to_explode
-        field = schema["name_qual"]
+        spec = self.plan.explode
+        field = spec.name_qual
 
         if len(listify(row.get(field, []))) <= 1:  # pragma: no cover
-            self._do_flatten_fields(row=row, schema=schema)
+            self._do_flatten_fields(row=row, spec=spec)
             return [row]
 
         items = listify(row.pop(field, []))
-        new_rows_map = {}
+        new_rows = []
 
-        for idx, item in enumerate(items):
-            new_rows_map[idx] = dict(row)
+        for item in items:
+            new_row = dict(row)
 
-            if schema["is_complex"]:
-                for sub_schema in self.get_sub_schemas(schema=schema):
-                    value = item.pop(sub_schema["name"], null_value)
-                    new_rows_map[idx][sub_schema["name_qual"]] = value
+            if spec.is_complex:
+                for name, name_qual in spec.sub_fields:
+                    new_row[name_qual] = item.pop(name, null_value)
             else:
-                new_rows_map[idx][schema["name_qual"]] = item
+                new_row[field] = item
 
-        return [new_rows_map[idx] for idx in new_rows_map]
+            new_rows.append(new_row)
+
+        return new_rows
 
     def do_tagging(self):
-        """Add or remove tags to assets."""
+        """Add or remove tags to assets not sent yet and wait for any background requests."""
         self.do_tag_add()
         self.do_tag_remove()
+        self.do_tag_wait()
 
     def do_tag_add(self):
-        """Add tags to assets."""
+        """Add tags to the assets in :attr:`TAG_ROWS_ADD` and clear it."""
         tags_add = listify(self.get_arg_value("tags_add"))
         rows_add = self.TAG_ROWS_ADD
         if tags_add and rows_add:
+            self.TAG_ROWS_ADD = []
             self.echo(msg=f"Adding tags {tags_add} to {len(rows_add)} assets")
-            self.APIOBJ.labels.add(rows=rows_add, labels=tags_add)
+            self._do_tag_send(method="add", tags=tags_add, rows=rows_add)
 
     def do_tag_remove(self):
-        """Remove tags from assets."""
+        """Remove tags from the assets in :attr:`TAG_ROWS_REMOVE` and clear it."""
         tags_remove = listify(self.get_arg_value("tags_remove"))
         rows_remove = self.TAG_ROWS_REMOVE
         if tags_remove and rows_remove:
+            self.TAG_ROWS_REMOVE = []
             self.echo(msg=f"Removing tags {tags_remove} from {len(rows_remove)} assets")
-            self.APIOBJ.labels.remove(rows=rows_remove, labels=tags_remove)
+            self._do_tag_send(method="remove", tags=tags_remove, rows=rows_remove)
+
+    def do_tag_wait(self):
+        """Wait for any tag requests sent in the background and stop the background thread."""
+        futures, self.TAG_FUTURES = self.TAG_FUTURES, []
+        for future in futures:
+            self._add_tag_result(*future.result())
+
+        executor = getattr(self, "_tag_executor", None)
+        if executor:
+            executor.shutdown(wait=True)
+            del self._tag_executor
+            self._tag_http.close()
+            del self._tag_http
+
+    def _do_tag_send(self, method: str, tags: List[str], rows: List[dict]):
+        """Send the requests to add or remove tags, in the background if tags_background.
+
+        Args:
+            method: 'add' or 'remove'
+            tags: tags to add or remove
+            rows: assets to add or remove tags from
+        """
+        for key in ["flushes", "assets", "processed"]:
+            self.STATE.setdefault(f"tags_{method}_{key}", 0)
+
+        if not self.get_arg_value("tags_background"):
+            self._add_tag_result(*self._do_tag_request(method=method, tags=tags, rows=rows))
+            return
+
+        if not hasattr(self, "_tag_executor"):
+            self._tag_http = self.APIOBJ.auth.http.clone()
+            self._tag_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{self.__class__.__name__}Tags"
+            )
+
+        for future in [x for x in self.TAG_FUTURES if x.done()]:
+            self.TAG_FUTURES.remove(future)
+            self._add_tag_result(*future.result())
+
+        self.TAG_FUTURES.append(
+            self._tag_executor.submit(
+                self._do_tag_request, method=method, tags=tags, rows=rows, http=self._tag_http
+            )
+        )
+
+    def _do_tag_request(
+        self, method: str, tags: List[str], rows: List[dict], http=None
+    ) -> Tuple[str, int, int]:
+        """Add or remove tags in chunks of tags_chunk_size.
+
+        Notes:
+            This may be run in the background thread, so it does not change :attr:`STATE`.
+            The result is added to :attr:`STATE` by :meth:`_add_tag_result` on the thread
+            processing pages.
+
+        Args:
+            method: 'add' or 'remove'
+            tags: tags to add or remove
+            rows: assets to add or remove tags from
+            http: HTTP client to use instead of the one from the API object
+
+        Returns:
+            Tuple[str, int, int]: method, number of assets sent, number of assets processed
+        """
+        labels_method = getattr(self.APIOBJ.labels, method)
+        processed = labels_method(
+            rows=rows, labels=tags, chunk_size=self.get_arg_value("tags_chunk_size"), http=http
+        )
+        return method, len(rows), processed
+
+    def _add_tag_result(self, method: str, assets: int, processed: int):
+        """Add the result of a request from :meth:`_do_tag_request` to the state counts.
+
+        Args:
+            method: 'add' or 'remove'
+            assets: number of assets sent
+            processed: number of assets processed
+        """
+        self.STATE[f"tags_{method}_flushes"] += 1
+        self.STATE[f"tags_{method}_assets"] += assets
+        self.STATE[f"tags_{method}_processed"] += processed
+
+    def _tag_chunk_full(self, rows: List[dict]) -> bool:
+        """Check if the rows waiting for tags have reached tags_chunk_size."""
+        chunk_size = self.get_arg_value("tags_chunk_size")
+        return bool(chunk_size) and len(rows) >= chunk_size
 
     def process_tags_to_add(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Add assets to tracker for adding tags.
@@ -716,10 +963,13 @@ class Base:
             return rows
 
         for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
+            row_id = row["internal_axon_id"]
+            if row_id not in self.TAG_IDS_ADD:
+                self.TAG_IDS_ADD.add(row_id)
+                self.TAG_ROWS_ADD.append({"internal_axon_id": row_id})
 
-            if tag_row not in self.TAG_ROWS_ADD:
-                self.TAG_ROWS_ADD.append(tag_row)
+        if self._tag_chunk_full(rows=self.TAG_ROWS_ADD):
+            self.do_tag_add()
         return rows
 
     def process_tags_to_remove(self, rows: Union[List[dict], dict]) -> List[dict]:
@@ -734,11 +984,13 @@ class Base:
             return rows
 
         for row in rows:
-            tag_row = {"internal_axon_id": row["internal_axon_id"]}
-
-            if tag_row not in self.TAG_ROWS_REMOVE:
-                self.TAG_ROWS_REMOVE.append(tag_row)
+            row_id = row["internal_axon_id"]
+            if row_id not in self.TAG_IDS_REMOVE:
+                self.TAG_IDS_REMOVE.add(row_id)
+                self.TAG_ROWS_REMOVE.append({"internal_axon_id": row_id})
 
+        if self._tag_chunk_full(rows=self.TAG_ROWS_REMOVE):
+            self.do_tag_remove()
         return rows
 
     def add_report_software_whitelist(self, rows: Union[List[dict], dict]) -> List[dict]:
@@ -750,9 +1002,15 @@ class Base:
         rows = listify(rows)
         whitelists = listify(self.get_arg_value("report_software_whitelist"))
 
-        if not whitelists:
+        if not whitelists or not rows:
             return rows
 
+        sw_field = "specific_data.data.installed_software"
+
+        if sw_field not in self.fields_selected:
+            msg = f"Must include field (column) {sw_field!r}"
+            self.echo(msg=msg, error=ApiError, level="error")
+
         for row in rows:
             self._add_report_software_whitelist(row=row)
         return rows
@@ -760,27 +1018,25 @@ class Base:
     def _add_report_software_whitelist(self, row: dict):
         """Process report: Software whitelist.
 
+        Notes:
+            Software missing is the entries of the whitelist that do not match the name of any
+            installed software, and software extra is the names of the installed software that
+            do not match any entry of the whitelist.
+
         Args:
             row: row being processed
         """
-        whitelists = listify(self.get_arg_value("report_software_whitelist"))
-
+        matcher = self.plan.software_whitelist
         sw_field = "specific_data.data.installed_software"
 
-        if sw_field not in self.fields_selected:
-            msg = f"Must include field (column) {sw_field!r}"
-            self.echo(msg=msg, error=ApiError, level="error")
-
         sws = listify(row.get(sw_field, []))
-        names = [x.get("name") for x in sws if x.get("name") and isinstance(x.get("name"), str)]
-
-        extras = [n for n in names if any([re.search(x, n, re.I)] for x in whitelists)]
-        missing = [x for x in whitelists if any([re.search(x, n, re.I) for n in names])]
+        names = [x.get("name") for x in sws if isinstance(x, dict)]
+        missing, extras = matcher.get_report(names=[x for x in names if x and isinstance(x, str)])
 
         schemas = SCHEMAS_CUSTOM["report_software_whitelist"]
-        row[schemas["software_missing"]["name_qual"]] = sorted(list(set(missing)))
-        row[schemas["software_whitelist"]["name_qual"]] = whitelists
-        row[schemas["software_extra"]["name_qual"]] = sorted(list(set(extras)))
+        row[schemas["software_missing"]["name_qual"]] = missing
+        row[schemas["software_whitelist"]["name_qual"]] = list(matcher.whitelist)
+        row[schemas["software_extra"]["name_qual"]] = extras
 
     def add_report_adapters_missing(self, rows: Union[List[dict], dict]) -> List[dict]:
         """Process report: Missing adapters.
@@ -808,21 +1064,42 @@ class Base:
 
         field_name = schema["name_qual"]
 
-        adapters_row = row.get("adapters", [])
         adapter_map = self.adapter_map
-        missing = []
+        missing = adapter_map["expected"].difference(listify(row.get("adapters", [])))
+        missing = sorted(missing, key=adapter_map["order"].__getitem__)
 
-        for adapter in adapter_map["all"]:
-            if adapter in adapters_row:
-                continue
+        counts = self.STATE.setdefault("adapters_missing_counts", {})
+        for adapter in missing:
+            counts[adapter] = counts.get(adapter, 0) + 1
+        self.STATE["adapters_missing_rows"] = self.STATE.get("adapters_missing_rows", 0) + 1
 
-            if adapter not in adapter_map["all_fields"]:
-                continue
+        row[field_name] = missing
 
-            if adapter not in missing:
-                missing.append(adapter)
+    def get_report_adapters_missing_summary(self) -> dict:
+        """Get the number of assets missing each adapter across all rows processed so far.
 
-        row[field_name] = missing
+        Returns:
+            dict: number of rows checked and a map of adapter name -> number of assets
+            missing that adapter, ordered by the most missing
+        """
+        rows = self.STATE.get("adapters_missing_rows", 0)
+        counts = self.STATE.get("adapters_missing_counts", {})
+        adapters = sorted(counts.items(), key=lambda x: (-x[1], x[0]))
+        return {"rows": rows, "adapters": dict(adapters)}
+
+    def echo_report_adapters_missing_summary(self):
+        """Echo the number of assets missing each adapter if report_adapters_missing is True."""
+        summary = self.get_report_adapters_missing_summary()
+        if not self.get_arg_value("report_adapters_missing") or not summary["rows"]:
+            return
+
+        join = "\n   - "
+        items = [
+            f"{k}: {v} ({calc_percent(part=v, whole=summary['rows']):.2f}%)"
+            for k, v in summary["adapters"].items()
+        ]
+        items = join + join.join(items) if items else " none"
+        self.echo(msg=f"Assets missing adapters out of {summary['rows']} assets:{items}")
 
     # TBD: make this support normal field selection concepts
     def is_excluded(self, schema: dict) -> bool:
@@ -831,13 +1108,16 @@ class Base:
         Args:
             schema: field schema
         """
-        for excluded_schema in self.excluded_schemas:
-            for key in self.FIND_KEYS:
-                schema_key = schema.get(key, None)
-                excluded_key = excluded_schema.get(key, None)
-                if (schema_key and excluded_schema) and (schema_key == excluded_key):
-                    return True
-        return False
+        return is_excluded(schema=schema, excluded_keys=self.excluded_keys)
+
+    @property
+    def excluded_keys(self) -> EXCLUDED_KEYS_TYPE:
+        """Map of FIND_KEYS to the set of names of :attr:`excluded_schemas` for each key."""
+        if not hasattr(self, "_excluded_keys"):
+            self._excluded_keys = get_excluded_keys(
+                excluded_schemas=self.excluded_schemas, find_keys=self.FIND_KEYS
+            )
+        return self._excluded_keys
 
     @property
     def excluded_schemas(self) -> List[dict]:
@@ -1041,7 +1321,7 @@ class Base:
 
     @property
     def adapter_map(self) -> dict:
-        """Build a map of adapters that have connections."""
+        """Build a map of adapters that have connections and adapters an asset can be missing."""
         if getattr(self, "_adapter_map", None):
             return self._adapter_map
 
@@ -1052,7 +1332,7 @@ class Base:
         self._adapter_map = {}
         self._adapter_map["has_cnx"] = has_cnx = []
         self._adapter_map["all"] = all_adapters = []
-        self._adapter_map["all_fields"] = [f"{x}_adapter" for x in self.ALL_SCHEMAS]
+        self._adapter_map["all_fields"] = all_fields = [f"{x}_adapter" for x in self.ALL_SCHEMAS]
 
         for adapter in self._adapters_meta:
             name_raw = adapter["name_raw"]
@@ -1064,6 +1344,10 @@ class Base:
             if cnt and name_raw not in has_cnx:
                 has_cnx.append(name_raw)
 
+        # adapters with fields, which are the adapters an asset can be missing
+        self._adapter_map["expected"] = frozenset(all_adapters).intersection(all_fields)
+        self._adapter_map["order"] = {x: i for i, x in enumerate(all_adapters)}
+
         # self._adapter_map = {k: list(v) for k, v in self._adapter_map.items()}
         return self._adapter_map
 
@@ -1083,6 +1367,27 @@ class Base:
             lines.append(f"{desc:{longest}}{value}")
         return lines
 
+    def get_checkpoint(self) -> dict:
+        """Get the info needed by this object to resume a fetch from a checkpoint."""
+        return {}
+
+    @property
+    def resumable(self) -> bool:
+        """Check if this object can resume a fetch from a checkpoint.
+
+        Notes:
+            With callback_workers, the pages written when a checkpoint is saved are not the
+            pages that have been fetched.
+        """
+        if coerce_int(self.get_arg_value("callback_workers") or 1) > 1:
+            return False
+        return self.CB_RESUMABLE
+
+    @property
+    def resume_info(self) -> dict:
+        """Get the info saved by :meth:`get_checkpoint` if a fetch is being resumed."""
+        return (self.STORE.get("resume") or {}).get("callbacks") or {}
+
     def __str__(self) -> str:
         """Show info for this object."""
         return f"{self.CB_NAME.upper()} processor"
@@ -1094,6 +1399,9 @@ class Base:
     CB_NAME: str = "base"
     """name for this callback"""
 
+    CB_RESUMABLE: bool = True
+    """callback supports resuming a fetch from a checkpoint"""
+
     FIND_KEYS: List[str] = ["name", "name_qual", "column_title", "name_base"]
     """field schema keys to use when finding a fields schema"""
 
@@ -1116,10 +1424,19 @@ class Base:
     """original kwargs supplied to get assets method."""
 
     TAG_ROWS_ADD: List[dict] = None
-    """tracker of assets to add tags to in :meth:`do_tagging`."""
+    """tracker of assets to add tags to in the next :meth:`do_tag_add`."""
 
     TAG_ROWS_REMOVE: List[dict] = None
-    """tracker of assets to remove tags from in :meth:`do_tagging`."""
+    """tracker of assets to remove tags from in the next :meth:`do_tag_remove`."""
+
+    TAG_IDS_ADD: Set[str] = None
+    """internal_axon_id of every asset added to :attr:`TAG_ROWS_ADD`."""
+
+    TAG_IDS_REMOVE: Set[str] = None
+    """internal_axon_id of every asset added to :attr:`TAG_ROWS_REMOVE`."""
+
+    TAG_FUTURES: List[concurrent.futures.Future] = None
+    """requests to add or remove tags that were sent in the background."""
 
     CUSTOM_CB_EXC: List[dict] = None
     """tracker of custom callbacks that have been executed by :meth:`do_custom_cbs`"""
@@ -1128,6 +1445,12 @@ class Base:
 class ExportMixins(Base):
     """Export mixins for callbacks."""
 
+    CB_RESUMABLE: bool = False
+    """callback supports resuming a fetch from a checkpoint"""
+
+    CB_ROTATE: bool = False
+    """callback supports rotating export_file into parts"""
+
     @classmethod
     def args_map_export(cls) -> dict:
         """Get the export argument names and their defaults for this callbacks object.
@@ -1146,14 +1469,20 @@ class ExportMixins(Base):
             "export_schema": False,
             "export_fd": None,
             "export_fd_close": True,
+            "export_compress": None,
+            "export_compress_level": None,
+            "export_rotate_rows": 0,
+            "export_rotate_bytes": 0,
         }
 
     def open_fd(self) -> IO:
         """Open a file descriptor."""
         if self.arg_export_fd:
             return self.open_fd_arg()
+        elif self.resume_info.get("export_file"):
+            return self.open_fd_resume()
         elif self.arg_export_file:
-            return self.open_fd_path()
+            return self.open_fd_path(compress=True)
         else:
             return self.open_fd_stdout()
 
@@ -1167,16 +1496,33 @@ class ExportMixins(Base):
 
     @property
     def export_full_path(self) -> pathlib.Path:
-        """Pass."""
+        """Get the path of export_file, or of the current part if export_file is rotated."""
+        path = self.export_base_path
+        if self.export_rotate:
+            path = get_part_path(path=path, number=self._part_number)
+        return path
+
+    @property
+    def export_base_path(self) -> pathlib.Path:
+        """Get the path of export_file."""
         return get_paths_format(
             self.arg_export_path, self.arg_export_file, mapping=self.export_templates
         )
 
-    def open_fd_path(self) -> IO:
-        """Open a file descriptor for a path."""
+    def open_fd_path(self, compress: bool = False) -> IO:
+        """Open a file descriptor for a path.
+
+        Args:
+            compress: compress the file if ``export_compress`` is supplied or ``export_file``
+                ends with a suffix from :data:`COMPRESSIONS`
+        """
         export_fd_close = self.arg_export_fd_close
         export_backup = self.arg_export_backup
         export_overwrite = self.arg_export_overwrite
+        compression = self.arg_export_compress if compress else None
+
+        if compression and not str(self.arg_export_file).endswith(COMPRESSIONS[compression]):
+            self.set_arg_value("export_file", f"{self.arg_export_file}{COMPRESSIONS[compression]}")
 
         self._file_path: pathlib.Path = self.export_full_path
         self._file_path_backup: Optional[pathlib.Path] = None
@@ -1208,10 +1554,53 @@ class ExportMixins(Base):
             self._file_path.touch(mode=0o600)
             self.echo(msg=f"Created new file {str(self._file_path)!r}", debug=True)
 
+        if compression:
+            # a compressed stream is only valid once it is closed
+            self._fd_close: bool = True
+            self._file_mode += f", compressed with {compression}"
+
+        if self.export_rotate:
+            # each part is closed before the next part is opened
+            self._fd_close: bool = True
+            self._file_mode += f", part {self._part_number}"
+
+        self._fd_info: str = f"file {str(self._file_path)!r} ({self._file_mode})"
+        self.echo(msg=f"Exporting to {self._fd_info}")
+
+        if compression:
+            self._fd: IO = open_compressed(
+                path=self._file_path, name=compression, level=self.arg_export_compress_level
+            )
+        else:
+            self._fd: IO = self._file_path.open(mode="w", encoding="utf-8")
+        return self._fd
+
+    def open_fd_resume(self) -> IO:
+        """Open a file descriptor to append to the export file of a resumed fetch.
+
+        Notes:
+            The file is truncated to the position saved in the checkpoint, which removes any
+            rows written after the last checkpoint was saved.
+        """
+        position = self.resume_info["export_position"]
+
+        self._file_path: pathlib.Path = get_path(obj=self.resume_info["export_file"])
+        self._file_path_backup: Optional[pathlib.Path] = None
+        self._fd_close: bool = self.arg_export_fd_close
+
+        if not self._file_path.is_file():
+            msg = f"Export file {str(self._file_path)!r} to resume from does not exist!"
+            self.echo(msg=msg, error=ApiError, level="error")
+
+        with self._file_path.open(mode="r+b") as fd:
+            fd.truncate(position)
+
+        self._resumed: bool = True
+        self._file_mode: str = f"Resumed existing file at position {position}"
         self._fd_info: str = f"file {str(self._file_path)!r} ({self._file_mode})"
         self.echo(msg=f"Exporting to {self._fd_info}")
 
-        self._fd: IO = self._file_path.open(mode="w", encoding="utf-8")
+        self._fd: IO = self._file_path.open(mode="a", encoding="utf-8")
         return self._fd
 
     def open_fd_stdout(self) -> IO:
@@ -1222,8 +1611,12 @@ class ExportMixins(Base):
         self.echo(msg="Exporting to {self._fd_info}")
         return self._fd
 
-    def close_fd(self):
-        """Close a file descriptor."""
+    def close_fd(self, finished: bool = True):
+        """Close a file descriptor.
+
+        Args:
+            finished: this is the last part of a rotated export_file
+        """
         self._fd.write("\n")
         close = getattr(self, "_fd_close", False)
         closer = getattr(self._fd, "close", None)
@@ -1233,6 +1626,129 @@ class ExportMixins(Base):
 
         self.echo(msg=f"Finished exporting to {self._fd_info}")
 
+        if self.export_rotate:
+            self.add_part(finished=finished)
+
+    def write_begin(self):
+        """Write what is needed at the start of each export file or part."""
+        pass
+
+    def write_end(self):
+        """Write what is needed at the end of each export file or part."""
+        pass
+
+    def write_parts(self, rows: Union[List[dict], dict]):
+        """Write rows to the file descriptor, rotating export_file into parts if needed.
+
+        Notes:
+            If export_rotate_rows or export_rotate_bytes is supplied, export_file is written
+            in parts named like ``name.part0001.csv``. Each part is a complete file that has
+            the start and end written by :meth:`write_begin` and :meth:`write_end`. Each time
+            a part is closed, ``name.manifest.json`` is rewritten with the name, row count, and
+            size of each part closed so far, so the parts can be loaded while the export is
+            still running. The manifest has ``finished`` set to True once the last part is
+            closed.
+
+            The size of a part is checked every :data:`ROTATE_CHECK_ROWS` rows, so a part can
+            be larger than export_rotate_bytes by the size of that many rows. For compressed
+            parts, the size of the compressed data written to the file so far is used.
+
+        Args:
+            rows: rows to write
+        """
+        rows = listify(rows)
+        if not self.export_rotate:
+            self.write_rows(rows=rows)
+            return
+
+        rotate_rows = self.arg_export_rotate_rows
+        rotate_bytes = self.arg_export_rotate_bytes
+
+        while rows:
+            if self.part_full:
+                self.rotate_part()
+
+            count = len(rows)
+            if rotate_rows:
+                count = min(count, rotate_rows - self._part_rows)
+            if rotate_bytes:
+                count = min(count, ROTATE_CHECK_ROWS)
+
+            chunk, rows = rows[:count], rows[count:]
+            self.write_rows(rows=chunk)
+            self._part_rows += len(chunk)
+
+    @property
+    def part_full(self) -> bool:
+        """Check if the current part has reached export_rotate_rows or export_rotate_bytes."""
+        if not self._part_rows:
+            return False
+
+        rotate_rows = self.arg_export_rotate_rows
+        if rotate_rows and self._part_rows >= rotate_rows:
+            return True
+
+        rotate_bytes = self.arg_export_rotate_bytes
+        if rotate_bytes:
+            self._fd.flush()
+            return self._file_path.stat().st_size >= rotate_bytes
+        return False
+
+    def rotate_part(self):
+        """Close the current part and open the next part."""
+        self.write_end()
+        self.close_fd(finished=False)
+        self._part_number += 1
+        self._part_rows = 0
+        self.open_fd()
+        self.write_begin()
+
+    def add_part(self, finished: bool):
+        """Add the part that was just closed to the manifest and write the manifest.
+
+        Args:
+            finished: this is the last part of the export
+        """
+        self._parts.append(
+            {
+                "number": self._part_number,
+                "file": self._file_path.name,
+                "rows": self._part_rows,
+                "bytes": self._file_path.stat().st_size,
+            }
+        )
+        manifest_path = get_manifest_path(path=self.export_base_path)
+        write_manifest(
+            path=manifest_path, export=self.CB_NAME, parts=self._parts, finished=finished
+        )
+        self.echo(msg=f"Updated manifest {str(manifest_path)!r} with {len(self._parts)} parts")
+
+    @property
+    def export_rotate(self) -> bool:
+        """Check if export_file is rotated into parts."""
+        if not hasattr(self, "_export_rotate"):
+            self._export_rotate: bool = bool(
+                self.CB_ROTATE
+                and self.arg_export_file
+                and not self.arg_export_fd
+                and (self.arg_export_rotate_rows or self.arg_export_rotate_bytes)
+            )
+            self._part_number: int = 1
+            self._part_rows: int = 0
+            self._parts: List[dict] = []
+        return self._export_rotate
+
+    def get_checkpoint(self) -> dict:
+        """Get the info needed by this object to resume a fetch from a checkpoint."""
+        ret = super(ExportMixins, self).get_checkpoint()
+        file_path = getattr(self, "_file_path", None)
+        fd = getattr(self, "_fd", None)
+
+        if file_path and fd and not fd.closed:
+            fd.flush()
+            ret.update({"export_file": str(file_path), "export_position": fd.tell()})
+        return ret
+
     @property
     def export_templates(self) -> dict:
         """Pass."""
@@ -1272,6 +1788,50 @@ class ExportMixins(Base):
         """Pass."""
         return self.get_arg_value("export_fd_close")
 
+    @property
+    def arg_export_compress(self) -> Optional[str]:
+        """Get the name of the compression to use for export_file, if any."""
+        return get_compression(
+            value=self.get_arg_value("export_compress"), path=self.arg_export_file
+        )
+
+    @property
+    def arg_export_compress_level(self) -> Optional[int]:
+        """Pass."""
+        value = self.get_arg_value("export_compress_level")
+        return None if value is None else coerce_int(value)
+
+    @property
+    def arg_export_rotate_rows(self) -> int:
+        """Get the number of rows to write to each part of export_file, 0 for no limit."""
+        return coerce_int(
+            self.get_arg_value("export_rotate_rows") or 0,
+            min_value=0,
+            errmsg="Invalid value for export_rotate_rows",
+        )
+
+    @property
+    def arg_export_rotate_bytes(self) -> int:
+        """Get the size in bytes to start a new part of export_file at, 0 for no limit."""
+        return coerce_int(
+            self.get_arg_value("export_rotate_bytes") or 0,
+            min_value=0,
+            errmsg="Invalid value for export_rotate_bytes",
+        )
+
+    @property
+    def resumable(self) -> bool:
+        """Check if this object can resume a fetch from a checkpoint.
+
+        Notes:
+            Compressed export files can not be truncated to the position of a checkpoint, and
+            the parts of a rotated export file are not tracked by a checkpoint.
+        """
+        if self.arg_export_file and not self.arg_export_fd:
+            if self.arg_export_compress or self.export_rotate:
+                return False
+        return super(ExportMixins, self).resumable
+
 
 ARG_DESCRIPTIONS: dict = {
     "field_excludes": "Fields to exclude from output",
@@ -1288,6 +1848,8 @@ ARG_DESCRIPTIONS: dict = {
     "field_null_value_complex": "Null value to use for missing complex fields",
     "tags_add": "Tags to add to assets",
     "tags_remove": "Tags to remove from assets",
+    "tags_chunk_size": "Assets to add or remove tags from per request (0 = All at end)",
+    "tags_background": "Add or remove tags using a background thread",
     "report_adapters_missing": "Add Missing Adapters calculation",
     "report_software_whitelist": "Missing Software to calculate",
     "page_progress": "Echo page progress every N assets",
@@ -1298,6 +1860,7 @@ ARG_DESCRIPTIONS: dict = {
     "csv_key_extras": "For CSV Export: What to do with extra CSV columns",
     "csv_dialect": "For CSV Export: CSV Dialect to use",
     "csv_quoting": "For CSV Export: CSV quoting style",
+    "json_to_csv_compress": "For JSON to CSV Export: Compression to use for the temporary file",
     "export_file": "File to export data to",
     "export_path": "Directory to export data to",
     "export_overwrite": "Overwrite export_file if it exists",
@@ -1305,11 +1868,23 @@ ARG_DESCRIPTIONS: dict = {
     "export_fd": "Export to a file descriptor",
     "export_fd_close": "Close the file descriptor when done",
     "export_backup": "If export_file exists, rename it with the datetime",
+    "export_compress": "Compression to use for export_file (None = Use export_file suffix)",
+    "export_compress_level": "Compression level to use for export_file (None = Default)",
+    "export_rotate_rows": "Rows to write to each part of export file (0 = No parts)",
+    "export_rotate_bytes": "Bytes to start a new part of export file at (0 = No parts)",
     "table_format": "For Table export: Table format to use",
     "table_max_rows": "For Table export: Maximum rows to output",
+    "table_block_rows": "For Table export: Rows to render in each table (None = All at end)",
+    "tee_exports": "For Tee export: Exports to write from one fetch",
+    "tee_queue_size": "For Tee export: Pages that can be waiting for each export",
     "table_api_fields": "For Table export: Include API fields in output",
     "xlsx_column_length": "For XLSX export: Length to use for every column",
     "xlsx_cell_format": "For XLSX Export: Formatting to apply to every cell",
+    "xlsx_max_rows": "For XLSX Export: Rows per worksheet before adding a new worksheet",
+    "parquet_compression": "For Parquet export: Compression codec to use",
+    "sqlite_table": "For SQLite export: Table to upsert assets into (None = Asset type)",
+    "sqlite_indexes": "For SQLite export: Columns to create indexes for",
     "debug_timing": "Enable logging of time taken for each callback",
+    "callback_workers": "Number of processes to run field callbacks in",
 }
 """Descriptions of all arguments for all callbacks"""
@@ -2,7 +2,8 @@
 """CSV export callbacks."""
 import codecs
 import csv
-from typing import List, Union
+import operator
+from typing import Callable, List, Sequence, Set, Union
 
 from ...constants.api import FIELD_TRIM_LEN
 from ...tools import listify
@@ -127,6 +128,37 @@ class Csv(ExportMixins):
         if getattr(self, "_stream", None):
             return
 
+        columns = self.csv_columns
+        self._columns_known: Set[str] = set(columns)
+        self._stream = self.get_stream(fieldnames=columns)
+
+        if not getattr(self, "_resumed", False):
+            self.write_begin()
+            self.do_export_schema()
+
+    def write_begin(self):
+        """Write the UTF8 BOM and the column headers."""
+        try:
+            self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
+        except Exception:  # pragma: no cover
+            # only happens on windows sometimes
+            self.LOG.error("Unable to write UTF8 BOM!")
+
+        # the file descriptor changes for each part of a rotated export_file
+        fieldnames = self._stream.fieldnames
+        self._stream = self.get_stream(fieldnames=fieldnames)
+        self._stream.writerow(dict(zip(fieldnames, fieldnames)))
+
+    def write_end(self):
+        """Write the end of the CSV."""
+        self._fd.write("\n")
+
+    def get_stream(self, fieldnames: List[str]) -> csv.DictWriter:
+        """Create the CSV writer for the file descriptor.
+
+        Args:
+            fieldnames: columns to write for each row
+        """
         restval = self.get_arg_value("csv_key_miss")
 
         extras = self.get_arg_value("csv_key_extras")
@@ -140,23 +172,20 @@ class Csv(ExportMixins):
 
         quote = getattr(csv, f"QUOTE_{quote.upper()}")
 
-        try:
-            self._fd.write(codecs.BOM_UTF8.decode("utf-8"))
-        except Exception:  # pragma: no cover
-            # only happens on windows sometimes
-            self.LOG.error("Unable to write UTF8 BOM!")
-
-        self._stream = csv.DictWriter(
+        return csv.DictWriter(
             self._fd,
-            fieldnames=self.final_columns,
+            fieldnames=fieldnames,
             quoting=quote,
             lineterminator="\n",
             restval=restval,
             dialect=dialect,
             extrasaction=extras,
         )
-        self._stream.writerow(dict(zip(self.final_columns, self.final_columns)))
-        self.do_export_schema()
+
+    @property
+    def csv_columns(self) -> List[str]:
+        """Get the columns to write in the header row."""
+        return self.final_columns
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
@@ -165,7 +194,7 @@ class Csv(ExportMixins):
 
     def do_stop(self, **kwargs):
         """Close the file descriptor."""
-        self._fd.write("\n")
+        self.write_end()
         self.close_fd()
 
     def write_rows(self, rows: Union[List[dict], dict]):
@@ -175,24 +204,54 @@ class Csv(ExportMixins):
             rows: rows to process
         """
         rows = listify(rows)
+        fieldnames = self._stream.fieldnames
+        restval = self._stream.restval
+        known = self._columns_known
+        getter = self.get_row_getter()
+        values = []
+
         for row in rows:
-            self._stream.fieldnames += [x for x in row if x not in self._stream.fieldnames]
-            self._stream.writerow(row)
+            if len(row) == len(known) and known.issuperset(row):
+                values.append(getter(row))
+                continue
+
+            new_fieldnames = [x for x in row if x not in known]
+            if new_fieldnames:
+                fieldnames += new_fieldnames
+                known.update(new_fieldnames)
+                getter = self.get_row_getter()
+            values.append([row.get(x, restval) for x in fieldnames])
+
+        self._stream.writer.writerows(values)
+
+    def get_row_getter(self) -> Callable[[dict], Sequence]:
+        """Get a function that returns the values of a row that has every column in order."""
+        fieldnames = self._stream.fieldnames
+        size = len(fieldnames)
+        if size != getattr(self, "_row_getter_size", None):
+            if size > 1:
+                self._row_getter = operator.itemgetter(*fieldnames)
+            else:
+                # itemgetter returns a single value instead of a tuple for one key
+                keys = list(fieldnames)
+                self._row_getter = lambda row: [row[x] for x in keys]
+            self._row_getter_size: int = size
+        return self._row_getter
 
-    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
-        """Process the callbacks for current row.
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows.
 
         Args:
-            row: row to process
+            rows: rows to process
         """
-        rows = listify(row)
+        rows = listify(rows)
         self.do_start()
 
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
-        rows = self.do_pre_row(rows=rows)
+        rows = self.do_pre_page(rows=rows)
         rows = self.do_row(rows=rows)
-        self.write_rows(rows=rows)
-        del rows, row
+        self.write_parts(rows=rows)
+        del rows
         return row_return
 
     def do_export_schema(self):
@@ -213,3 +272,9 @@ class Csv(ExportMixins):
 
     CB_NAME: str = "csv"
     """name for this callback"""
+
+    CB_RESUMABLE: bool = True
+    """callback supports resuming a fetch from a checkpoint"""
+
+    CB_ROTATE: bool = True
+    """callback supports rotating export_file into parts"""
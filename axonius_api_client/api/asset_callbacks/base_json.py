@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 """JSON export callbacks."""
-import json
 import textwrap
 from typing import List, Union
 
+from ...json_codec import get_codec
 from ...tools import listify
 from .base import ExportMixins
 
@@ -72,35 +72,44 @@ class Json(ExportMixins):
     def start(self, **kwargs):
         """Start this callbacks object."""
         super(Json, self).start(**kwargs)
-        flat = self.get_arg_value("json_flat")
-
-        self._first_row = True
         self.open_fd()
-        begin = "" if flat else "["
-        self._fd.write(begin)
+
+        if getattr(self, "_resumed", False):
+            self._first_row = self.resume_info.get("json_first_row", False)
+        else:
+            self.write_begin()
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         super(Json, self).stop(**kwargs)
+        self.do_export_schema()
+        self.write_end()
+        self.close_fd()
+
+    def write_begin(self):
+        """Write the start of the JSON array, unless json_flat."""
         flat = self.get_arg_value("json_flat")
+        self._first_row = True
+        begin = "" if flat else "["
+        self._fd.write(begin)
 
-        self.do_export_schema()
+    def write_end(self):
+        """Write the end of the JSON array, unless json_flat."""
+        flat = self.get_arg_value("json_flat")
         end = "" if flat else "\n]"
         self._fd.write(end)
-        self.close_fd()
 
-    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
-        """Process the callbacks for current row.
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows.
 
         Args:
-            row: row to process
+            rows: rows to process
         """
-        rows = listify(row)
-        rows = self.do_pre_row(rows=rows)
+        rows = self.do_pre_page(rows=rows)
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_row(rows=rows)
-        self.write_rows(rows=rows)
-        del rows, row
+        self.write_parts(rows=rows)
+        del rows
         return row_return
 
     def write_rows(self, rows: Union[List[dict], dict]):
@@ -114,6 +123,8 @@ class Json(ExportMixins):
 
         indent = None if flat else 2
         prefix = " " * indent if indent else ""
+        codec = get_codec()
+        values = []
 
         for row in rows:
             if self._first_row:
@@ -122,13 +133,21 @@ class Json(ExportMixins):
                 pre = "\n" if flat else ",\n"
 
             self._first_row = False
-            self._fd.write(pre)
+            values.append(pre)
 
-            value = json.dumps(row, indent=indent)
+            value = codec.dumps(row, indent=indent)
             value = textwrap.indent(value, prefix=prefix) if indent else value
-            self._fd.write(value)
+            values.append(value)
             del value, row
 
+        self._fd.write("".join(values))
+
+    def get_checkpoint(self) -> dict:
+        """Get the info needed by this object to resume a fetch from a checkpoint."""
+        ret = super(Json, self).get_checkpoint()
+        ret["json_first_row"] = getattr(self, "_first_row", True)
+        return ret
+
     def do_export_schema(self):
         """Add schema rows to the output."""
         export_schema = self.get_arg_value("export_schema")
@@ -140,3 +159,9 @@ class Json(ExportMixins):
 
     CB_NAME: str = "json"
     """name for this callback"""
+
+    CB_RESUMABLE: bool = True
+    """callback supports resuming a fetch from a checkpoint"""
+
+    CB_ROTATE: bool = True
+    """callback supports rotating export_file into parts"""
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 """JSON to CSV export callbacks."""
-import json
+import pathlib
 import tempfile
-from typing import List, Union
+from typing import IO, Dict, List, Optional
 
+from ...json_codec import get_codec
 from ...tools import listify
 from .base_csv import Csv
+from .compress import get_compression, open_compressed, open_decompressed
+
+JSON_TO_CSV_BATCH_SIZE: int = 1000
+"""number of rows to read from the temporary file before writing them to the CSV file"""
 
 
 class JsonToCsv(Csv):
@@ -89,6 +94,12 @@ class JsonToCsv(Csv):
             ...     export="json_to_csv", export_file="test.csv", csv_quoting='all'
             ... )
 
+            Compress the temporary JSON file to use less disk space for large exports.
+
+            >>> assets = apiobj.get(
+            ...     export="json_to_csv", export_file="test.csv", json_to_csv_compress='gzip'
+            ... )
+
         See Also:
             * :meth:`args_map` for callback generic arguments to format assets.
 
@@ -97,6 +108,12 @@ class JsonToCsv(Csv):
             output usable in the exported format: ``field_null``, ``field_flatten``,
             and ``field_join``
 
+            The callbacks are run for each page of assets as it is fetched, and the rows are
+            written to a temporary JSON file with one row per line. Once all assets have been
+            fetched, the header row is written with the final columns and any other columns
+            seen in the rows, then the temporary file is read one line at a time and written
+            to the CSV file.
+
             These arguments can be supplied as extra kwargs passed to
             :meth:`axonius_api_client.api.assets.users.Users.get` or
             :meth:`axonius_api_client.api.assets.devices.Devices.get`
@@ -114,6 +131,7 @@ class JsonToCsv(Csv):
                 "csv_key_extras": "ignore",
                 "csv_dialect": "excel",
                 "csv_quoting": "nonnumeric",
+                "json_to_csv_compress": None,
             }
         )
         return args
@@ -122,45 +140,73 @@ class JsonToCsv(Csv):
         """Start this callbacks object."""
         super(Csv, self).start(**kwargs)
         self.open_fd()
-        self._temp_file = tempfile.NamedTemporaryFile(mode="w+", encoding="utf-8")
-        self.echo(msg=f"Writing JSON to temporary file {self._temp_file.name!r}")
+        self._columns_seen: Dict[str, None] = {}
+        self._temp_compress: Optional[str] = get_compression(
+            value=self.get_arg_value("json_to_csv_compress"), path=None
+        )
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="axonius_json_to_csv_")
+        self._temp_path: pathlib.Path = pathlib.Path(self._temp_dir.name) / "rows.jsonl"
+
+        if self._temp_compress:
+            self._temp_fd: IO = open_compressed(path=self._temp_path, name=self._temp_compress)
+        else:
+            self._temp_fd: IO = self._temp_path.open(mode="w", encoding="utf-8")
+        self.echo(msg=f"Writing JSON to temporary file {str(self._temp_path)!r}")
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
-        self.STATE["rows_processed_total"] = 0
+        self._temp_fd.close()
         self.do_start(**kwargs)
 
         self.echo(msg="Re-reading temporary file and converting to CSV")
-        self._temp_file.file.seek(0)
-
-        for line in self._temp_file.file.readlines():
-            row = json.loads(line.strip())
-            rows = listify(row)
-            rows = self.do_pre_row(rows=rows)
-            rows = self.do_row(rows=rows)
-            self.write_rows(rows=rows)
-            del rows, row, line
-
-        self.echo(msg=f"Closing and deleting temporary file {self._temp_file.name!r}")
-        self._temp_file.file.close()
+        codec = get_codec()
+        rows = []
+
+        with open_decompressed(path=self._temp_path, name=self._temp_compress) as fd:
+            for line in fd:
+                rows.append(codec.loads(line))
+                if len(rows) >= JSON_TO_CSV_BATCH_SIZE:
+                    self.write_parts(rows=rows)
+                    rows = []
+        self.write_parts(rows=rows)
+        del rows
+
+        self.echo(msg=f"Closing and deleting temporary file {str(self._temp_path)!r}")
+        self._temp_dir.cleanup()
         super(JsonToCsv, self).stop(**kwargs)
 
-    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
-        """Process the callbacks for current row.
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows and write them to the temporary file.
 
         Args:
-            row: row to process
+            rows: rows to process
         """
-        rows = listify(row)
-
+        rows = self.do_pre_page(rows=rows)
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
-        rows = self.do_pre_row(rows=rows)
+        rows = listify(self.do_row(rows=rows))
+
+        columns_seen = self._columns_seen
         for row in rows:
-            value = json.dumps(row)
-            self._temp_file.file.write(f"{value}\n")
-            del row, value
+            for key in row:
+                if key not in columns_seen:
+                    columns_seen[key] = None
+
+        codec = get_codec()
+        self._temp_fd.write("".join(f"{codec.dumps(row)}\n" for row in rows))
+        del rows
 
         return row_return
 
+    @property
+    def csv_columns(self) -> List[str]:
+        """Get the final columns and any other columns seen in rows to write in the header row."""
+        columns = list(self.final_columns)
+        final = set(columns)
+        columns += [x for x in getattr(self, "_columns_seen", {}) if x not in final]
+        return columns
+
     CB_NAME: str = "json_to_csv"
     """name for this callback"""
+
+    CB_RESUMABLE: bool = False
+    """callback supports resuming a fetch from a checkpoint"""
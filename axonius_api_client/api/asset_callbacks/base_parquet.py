@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""Apache Parquet export callbacks class."""
+from typing import Any, List, Tuple
+
+from ...exceptions import ApiError
+from ...tools import listify
+from .base import ExportMixins
+
+PARQUET_TYPES: dict = {
+    "boolean": "bool_",
+    "integer": "int64",
+    "number": "float64",
+}
+"""map of type_norm (without array_ or list_ prefix) -> pyarrow type function name, any type_norm
+not in this map is written as a string"""
+
+PARQUET_LIST_PREFIXES: Tuple[str, ...] = ("array_", "list_")
+"""prefixes of type_norm that are written as lists"""
+
+
+class ParquetColumn:
+    """Arrow type and value conversion for a field schema."""
+
+    def __init__(self, pa, schema: dict, is_list: bool, subs: List["ParquetColumn"]):
+        """Arrow type and value conversion for a field schema.
+
+        Args:
+            pa: pyarrow module
+            schema: field schema to get the arrow type of
+            is_list: write values of this field as a list
+            subs: columns for the sub fields of a complex field
+        """
+        type_norm = str(schema.get("type_norm") or "")
+        for prefix in PARQUET_LIST_PREFIXES:
+            if type_norm.startswith(prefix):
+                type_norm = type_norm.replace(prefix, "", 1)
+                is_list = True
+
+        self.name: str = schema["name"]
+        """name of the field in the items of a complex field"""
+
+        self.subs: List["ParquetColumn"] = subs
+        """columns for the sub fields of a complex field"""
+
+        self.is_complex: bool = bool(schema.get("is_complex")) and bool(subs)
+        """values are written as a list of structs"""
+
+        self.is_list: bool = is_list or self.is_complex
+        """values are written as a list"""
+
+        self.base: str = "struct" if self.is_complex else PARQUET_TYPES.get(type_norm, "string")
+        """name of the pyarrow type function for a single value"""
+
+        if self.is_complex:
+            value_type = pa.struct([pa.field(x.name, x.arrow_type) for x in subs])
+        else:
+            value_type = getattr(pa, self.base)()
+
+        self.arrow_type = pa.list_(value_type) if self.is_list else value_type
+        """arrow type of this column"""
+
+    def convert(self, value: Any) -> Any:
+        """Convert a value to match the arrow type of this column.
+
+        Args:
+            value: value from a row or an item of a complex field
+        """
+        if value is None:
+            return None
+
+        if self.is_list:
+            return [self.convert_item(x) for x in listify(value)]
+
+        if isinstance(value, (list, tuple)):
+            value = [x for x in value if x is not None]
+            if not value:
+                return None
+            if len(value) > 1 and self.base == "string":
+                return ", ".join(str(x) for x in value)
+            value = value[0]
+        return self.convert_item(value)
+
+    def convert_item(self, value: Any) -> Any:
+        """Convert a single value to match the arrow type of this column.
+
+        Notes:
+            Values that can not be converted to the type of this column are written as null.
+
+        Args:
+            value: single value
+        """
+        if value is None:
+            return None
+
+        if self.is_complex:
+            if not isinstance(value, dict):
+                return None
+            return {x.name: x.convert(value.get(x.name)) for x in self.subs}
+
+        try:
+            if self.base == "bool_":
+                return value if isinstance(value, bool) else None
+            if self.base == "int64":
+                return int(value)
+            if self.base == "float64":
+                return float(value)
+        except (TypeError, ValueError):
+            return None
+
+        return value if isinstance(value, str) else str(value)
+
+
+class Parquet(ExportMixins):
+    """Callbacks for formatting asset data and exporting it in Apache Parquet format.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Export the output to a file in the default path
+            :attr:`axonius_api_client.setup_env.DEFAULT_PATH`.
+
+            >>> assets = apiobj.get(export="parquet", export_file="test.parquet")
+
+            Export the output to an absolute path file (ignoring ``export_path``) and overwrite
+            the file if it exists.
+
+            >>> assets = apiobj.get(
+            ...     export="parquet",
+            ...     export_file="/tmp/output.parquet",
+            ...     export_overwrite=True,
+            ... )
+
+            Use a different compression codec.
+
+            >>> assets = apiobj.get(
+            ...     export="parquet",
+            ...     export_file="test.parquet",
+            ...     parquet_compression="snappy",
+            ... )
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+
+        Notes:
+            Requires the ``pyarrow`` package to be installed.
+
+            If ``export_file`` does not end with ``.parquet``, it will be appended to the
+            filename.
+
+            The type of each column is based on the ``type_norm`` of the schema for each field.
+            Complex fields are written as a list of structs, and list fields are written as
+            lists. Fields of the aggregated adapter and of each adapter can have a value from
+            each adapter connection, so they are written as lists unless they are always
+            returned by the REST API as a single value. Values that can not be converted to the
+            type of the column are written as null.
+
+            Each page of assets is written as a row group, so only one page of assets is held
+            in memory at a time.
+
+            This callbacks object forces the following arguments in order to make the
+            output usable in the exported format: ``field_null`` to True, and
+            ``field_flatten`` and ``field_join`` to False
+
+            These arguments can be supplied as extra kwargs passed to
+            :meth:`axonius_api_client.api.assets.users.Users.get` or
+            :meth:`axonius_api_client.api.assets.devices.Devices.get`
+
+        """
+        args = {}
+        args.update(cls.args_map_export())
+        args.update(
+            {
+                "field_null": True,
+                "field_flatten": False,
+                "field_join": False,
+                "parquet_compression": "zstd",
+            }
+        )
+        return args
+
+    def _init(self, **kwargs):
+        """Override defaults to make export usable."""
+        self.set_arg_value("field_null", True)
+        self.set_arg_value("field_flatten", False)
+        self.set_arg_value("field_join", False)
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Parquet, self).start(**kwargs)
+        self.do_start(**kwargs)
+
+    def do_start(self, **kwargs):
+        """Start this callbacks object."""
+        export_file = self.get_arg_value("export_file")
+
+        if export_file:
+            if not str(export_file).endswith(".parquet"):
+                self.set_arg_value("export_file", f"{export_file}.parquet")
+            self.open_fd_path()
+            self._fd.close()
+        else:
+            self.echo(
+                msg="Must supply export_file for this export method", error=ApiError, level="error"
+            )
+
+        pa, pq = self.get_pyarrow()
+        self._pa = pa
+        self._writer = pq.ParquetWriter(
+            str(self._file_path),
+            schema=self.arrow_schema,
+            compression=self.get_arg_value("parquet_compression") or "none",
+        )
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Parquet, self).stop(**kwargs)
+        self.do_stop(**kwargs)
+
+    def do_stop(self, **kwargs):
+        """Stop this callbacks object."""
+        writer = getattr(self, "_writer", None)
+        if writer:
+            writer.close()
+            self._writer = None
+            self.echo(msg=f"Finished exporting to {self._fd_info}")
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows and write them as a row group.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = listify(self.do_row(rows=rows))
+
+        if rows:
+            arrays = [
+                self._pa.array(
+                    [column.convert(row.get(key)) for row in rows], type=column.arrow_type
+                )
+                for key, column in zip(self.final_columns, self.parquet_columns)
+            ]
+            table = self._pa.Table.from_arrays(arrays, schema=self.arrow_schema)
+            self._writer.write_table(table)
+            del arrays, table
+
+        del rows
+        return row_return
+
+    @staticmethod
+    def get_pyarrow() -> tuple:
+        """Import the pyarrow and pyarrow.parquet modules.
+
+        Raises:
+            :exc:`ApiError`: if pyarrow is not installed
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as exc:  # pragma: no cover
+            raise ApiError(
+                "The pyarrow package is required for Parquet exports "
+                f"(pip install axonius_api_client[parquet]): {exc}"
+            )
+        return pyarrow, pyarrow.parquet
+
+    def get_parquet_column(self, schema: dict, is_root: bool = True) -> ParquetColumn:
+        """Get the arrow type and value conversion for a field schema.
+
+        Args:
+            schema: field schema
+            is_root: schema is a column of the output instead of a sub field of a complex field
+        """
+        pa, _ = self.get_pyarrow()
+        subs = [
+            self.get_parquet_column(schema=x, is_root=False)
+            for x in self.get_sub_schemas(schema=schema)
+        ]
+        is_list = bool(schema.get("is_list"))
+        if is_root and schema.get("parent", "root") == "root" and not schema.get("is_custom"):
+            is_list = is_list or schema["name_qual"] not in self.APIOBJ.FIELDS_API
+        return ParquetColumn(pa=pa, schema=schema, is_list=is_list, subs=subs)
+
+    @property
+    def parquet_columns(self) -> List[ParquetColumn]:
+        """Get the arrow type and value conversion for each of the final schemas."""
+        if not hasattr(self, "_parquet_columns"):
+            self._parquet_columns = [self.get_parquet_column(x) for x in self.final_schemas]
+        return self._parquet_columns
+
+    @property
+    def arrow_schema(self) -> Any:
+        """Get the arrow schema for the final columns."""
+        if not hasattr(self, "_arrow_schema"):
+            pa, _ = self.get_pyarrow()
+            self._arrow_schema = pa.schema(
+                [
+                    pa.field(key, column.arrow_type)
+                    for key, column in zip(self.final_columns, self.parquet_columns)
+                ]
+            )
+        return self._arrow_schema
+
+    CB_NAME: str = "parquet"
+    """name for this callback"""
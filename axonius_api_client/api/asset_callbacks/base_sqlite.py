@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""SQLite export callbacks class."""
+import pathlib
+import sqlite3
+from typing import Any, List, Optional
+
+from ...exceptions import ApiError
+from ...json_codec import get_codec
+from ...tools import listify, path_backup_file
+from .base import ExportMixins
+
+SQLITE_TYPES: dict = {
+    "boolean": "INTEGER",
+    "integer": "INTEGER",
+    "number": "REAL",
+}
+"""map of type_norm -> SQLite column type, any type_norm not in this map is stored as TEXT"""
+
+SQLITE_SUFFIXES: List[str] = [".sqlite", ".sqlite3", ".db"]
+"""file suffixes that are not changed, ``.sqlite`` is appended to any other export_file"""
+
+SQLITE_UPSERT_VERSION: tuple = (3, 24, 0)
+"""SQLite version that supports ``INSERT ... ON CONFLICT DO UPDATE``"""
+
+
+def quote(name: str) -> str:
+    """Quote a SQLite identifier.
+
+    Args:
+        name: table, column, or index name
+    """
+    name = str(name).replace('"', '""')
+    return f'"{name}"'
+
+
+class Sqlite(ExportMixins):
+    """Callbacks for formatting asset data and exporting it to a SQLite database.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Export the output to a database in the default path
+            :attr:`axonius_api_client.setup_env.DEFAULT_PATH`. If the database already exists,
+            assets that are already in the table are updated and new assets are added.
+
+            >>> assets = apiobj.get(export="sqlite", export_file="assets.db")
+
+            Replace the database instead of updating it.
+
+            >>> assets = apiobj.get(
+            ...     export="sqlite",
+            ...     export_file="assets.db",
+            ...     export_overwrite=True,
+            ... )
+
+            Use a different table name and index some columns.
+
+            >>> assets = apiobj.get(
+            ...     export="sqlite",
+            ...     export_file="assets.db",
+            ...     sqlite_table="inventory",
+            ...     sqlite_indexes=["specific_data.data.hostname"],
+            ... )
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+
+        Notes:
+            If ``export_file`` does not end with ``.sqlite``, ``.sqlite3``, or ``.db``,
+            ``.sqlite`` will be appended to the filename.
+
+            If ``export_file`` exists, it is updated unless ``export_overwrite`` or
+            ``export_backup`` is True. Rows are upserted on ``internal_axon_id``, so assets
+            that are already in the table are updated and new assets are added. Columns that
+            are missing from an existing table are added to it.
+
+            The table has one column for each of the final columns. List values and complex
+            values are stored as JSON text. Each page of assets is inserted in one transaction.
+
+            ``sqlite_table`` defaults to the asset type, and ``sqlite_indexes`` can be column
+            names or field names of the final columns.
+
+            This callbacks object forces the following arguments in order to make the
+            output usable in the exported format: ``field_null`` to True, and
+            ``field_flatten`` and ``field_join`` to False. ``field_explode`` can not be used,
+            as each asset is stored in one row.
+
+            These arguments can be supplied as extra kwargs passed to
+            :meth:`axonius_api_client.api.assets.users.Users.get` or
+            :meth:`axonius_api_client.api.assets.devices.Devices.get`
+
+        """
+        args = {}
+        args.update(cls.args_map_export())
+        args.update(
+            {
+                "field_null": True,
+                "field_flatten": False,
+                "field_join": False,
+                "sqlite_table": None,
+                "sqlite_indexes": [],
+            }
+        )
+        return args
+
+    def _init(self, **kwargs):
+        """Override defaults to make export usable."""
+        self.set_arg_value("field_null", True)
+        self.set_arg_value("field_flatten", False)
+        self.set_arg_value("field_join", False)
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Sqlite, self).start(**kwargs)
+        self.do_start(**kwargs)
+
+    def do_start(self, **kwargs):
+        """Start this callbacks object."""
+        if self.get_arg_value("field_explode"):
+            self.echo(
+                msg="Can not use field_explode with this export method, assets are upserted",
+                error=ApiError,
+                level="error",
+            )
+
+        self.open_db()
+        self.create_table()
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Sqlite, self).stop(**kwargs)
+        self.do_stop(**kwargs)
+
+    def do_stop(self, **kwargs):
+        """Stop this callbacks object."""
+        conn = getattr(self, "_conn", None)
+        if conn:
+            conn.close()
+            self._conn = None
+            self.echo(msg=f"Finished exporting to {self._fd_info}")
+
+    def open_db(self) -> sqlite3.Connection:
+        """Open a connection to the database in export_file."""
+        export_file = self.arg_export_file
+        if not export_file:
+            self.echo(
+                msg="Must supply export_file for this export method", error=ApiError, level="error"
+            )
+
+        if not any(str(export_file).endswith(x) for x in SQLITE_SUFFIXES):
+            self.set_arg_value("export_file", f"{export_file}{SQLITE_SUFFIXES[0]}")
+
+        self._file_path: pathlib.Path = self.export_full_path
+        self._file_path_backup: Optional[pathlib.Path] = None
+
+        if self._file_path.is_dir():
+            self.echo(
+                msg=f"Export file {str(self._file_path)!r} is a directory!",
+                error=ApiError,
+                level="error",
+            )
+
+        if self._file_path.exists():
+            if self.arg_export_backup:
+                self._file_path_backup = path_backup_file(path=self._file_path)
+                self._file_mode: str = "Renamed existing database and created new database"
+            elif self.arg_export_overwrite:
+                self._file_path.unlink()
+                self._file_mode: str = "Replaced existing database"
+            else:
+                self._file_mode: str = "Updated existing database"
+        else:
+            self._file_mode: str = "Created new database"
+
+        if not self._file_path.parent.is_dir():
+            self._file_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self.echo(msg=f"Created directory {str(self._file_path.parent)!r}", debug=True)
+
+        self._fd_info: str = f"file {str(self._file_path)!r} ({self._file_mode})"
+        self.echo(msg=f"Exporting to {self._fd_info}")
+
+        self._conn: sqlite3.Connection = sqlite3.connect(str(self._file_path))
+        return self._conn
+
+    def create_table(self):
+        """Create the table and indexes, and add any missing columns to an existing table."""
+        table = quote(self.sqlite_table)
+        key = quote(self.sqlite_key)
+        columns = self.sqlite_columns
+
+        with self._conn:
+            definitions = [f"{quote(k)} {v}" for k, v in columns.items()]
+            definitions.append(f"PRIMARY KEY ({key})")
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(definitions)})")
+
+            existing = [x[1] for x in self._conn.execute(f"PRAGMA table_info({table})")]
+            for name, sqlite_type in columns.items():
+                if name not in existing:
+                    self._conn.execute(
+                        f"ALTER TABLE {table} ADD COLUMN {quote(name)} {sqlite_type}"
+                    )
+                    self.echo(msg=f"Added column {name!r} to table {self.sqlite_table!r}")
+
+            for name in self.sqlite_indexes:
+                index = quote(f"ix_{self.sqlite_table}_{name}")
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({quote(name)})")
+
+        names = [quote(x) for x in columns]
+        values = ", ".join(["?"] * len(names))
+        insert = f"INTO {table} ({', '.join(names)}) VALUES ({values})"
+
+        if sqlite3.sqlite_version_info >= SQLITE_UPSERT_VERSION:
+            updates = ", ".join(f"{x} = excluded.{x}" for x in names if x != key)
+            action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+            self._sql_upsert: str = f"INSERT {insert} ON CONFLICT ({key}) {action}"
+        else:  # pragma: no cover
+            self._sql_upsert: str = f"INSERT OR REPLACE {insert}"
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows and upsert them in one transaction.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = listify(self.do_row(rows=rows))
+
+        if rows:
+            columns = list(self.sqlite_columns)
+            values = [[self.get_sqlite_value(row.get(x)) for x in columns] for row in rows]
+            with self._conn:
+                self._conn.executemany(self._sql_upsert, values)
+            del values
+
+        del rows
+        return row_return
+
+    @staticmethod
+    def get_sqlite_value(value: Any) -> Any:
+        """Convert a value to a value that can be stored in SQLite.
+
+        Args:
+            value: value from a row
+        """
+        if isinstance(value, (list, tuple, dict)):
+            return get_codec().dumps(value)
+        return value
+
+    @property
+    def sqlite_table(self) -> str:
+        """Get the name of the table to store assets in."""
+        return self.get_arg_value("sqlite_table") or self.APIOBJ.__class__.__name__.lower()
+
+    @property
+    def sqlite_columns(self) -> dict:
+        """Get a map of final column name -> SQLite column type."""
+        if not hasattr(self, "_sqlite_columns"):
+            self._sqlite_columns = {}
+            for name, schema in zip(self.final_columns, self.final_schemas):
+                is_list = schema.get("is_complex") or schema.get("is_list")
+                sqlite_type = "TEXT" if is_list else SQLITE_TYPES.get(schema["type_norm"], "TEXT")
+                self._sqlite_columns.setdefault(name, sqlite_type)
+        return self._sqlite_columns
+
+    @property
+    def sqlite_key(self) -> str:
+        """Get the name of the final column for internal_axon_id."""
+        for name, schema in zip(self.final_columns, self.final_schemas):
+            if schema["name_qual"] == "internal_axon_id":
+                return name
+        self.echo(
+            msg="Can not use this export method without internal_axon_id",
+            error=ApiError,
+            level="error",
+        )
+
+    @property
+    def sqlite_indexes(self) -> List[str]:
+        """Get the final column names of the columns to create indexes for."""
+        names = {}
+        for name, schema in zip(self.final_columns, self.final_schemas):
+            names[name] = name
+            for key in self.FIND_KEYS:
+                if schema.get(key):
+                    names.setdefault(schema[key], name)
+
+        indexes = []
+        for value in listify(self.get_arg_value("sqlite_indexes")):
+            if value not in names:
+                self.echo(
+                    msg=f"Column {value!r} in sqlite_indexes not found, valid: {list(names)}",
+                    error=ApiError,
+                    level="error",
+                )
+            if names[value] not in indexes:
+                indexes.append(names[value])
+        return indexes
+
+    CB_NAME: str = "sqlite"
+    """name for this callback"""
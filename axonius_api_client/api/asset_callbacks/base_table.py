@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 """Table export callbacks."""
-from typing import List, Union
+from typing import List
 
 import tabulate
 
-from ...constants.api import TABLE_FORMAT, TABLE_MAX_ROWS
+from ...constants.api import TABLE_BLOCK_ROWS, TABLE_FORMAT, TABLE_MAX_ROWS
 from ...exceptions import ApiError, StopFetch
 from ...tools import listify
 from .base import ExportMixins
@@ -68,6 +68,15 @@ class Table(ExportMixins):
             ...     table_max_rows=20,
             ... )
 
+            Render all rows without a row limit, 500 rows per table.
+
+            >>> assets = apiobj.get(
+            ...     export="table",
+            ...     export_file="test.txt",
+            ...     table_max_rows=0,
+            ...     table_block_rows=500,
+            ... )
+
             Do not exclude API internal fields from table output.
 
             >>> assets = apiobj.get(
@@ -82,6 +91,12 @@ class Table(ExportMixins):
         Notes:
             If ``export_file`` is not supplied, the default is to print the output to STDOUT.
 
+            By default all rows are held in memory and rendered in one table once the fetch is
+            finished, so ``table_max_rows`` limits the memory used. If ``table_block_rows`` is
+            supplied, rows are rendered and written as a table each time that many rows have
+            been processed, so only one block of rows is held in memory. This changes the
+            output to multiple tables, each with its own column headers and column widths.
+
             This callbacks object forces the following arguments to True in order to make the
             output usable in the exported format: ``field_null``, ``field_flatten``,
             and ``field_join``
@@ -101,6 +116,7 @@ class Table(ExportMixins):
                 "field_null": True,
                 "table_format": TABLE_FORMAT,
                 "table_max_rows": TABLE_MAX_ROWS,
+                "table_block_rows": TABLE_BLOCK_ROWS,
                 "table_api_fields": False,
             }
         )
@@ -124,13 +140,26 @@ class Table(ExportMixins):
         """Start this callbacks object."""
         super(Table, self).start(**kwargs)
         self._rows = []
+        self._tables_written = 0
         self.open_fd()
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         super(Table, self).stop(**kwargs)
+        if getattr(self, "_rows", []) or not getattr(self, "_tables_written", 0):
+            self.write_table()
+        self.close_fd()
+
+    def write_table(self, count: int = 0):
+        """Render the rows that have been processed as a table and write it.
+
+        Args:
+            count: number of rows to render, 0 to render all rows that have been processed
+        """
         tablefmt = self.get_arg_value("table_format") or TABLE_FORMAT
         rows = getattr(self, "_rows", [])
+        count = count or len(rows)
+        rows, self._rows = rows[:count], rows[count:]
 
         table = tabulate.tabulate(
             tabular_data=rows,
@@ -141,21 +170,42 @@ class Table(ExportMixins):
 
         self._fd.write(table)
         self._fd.write("\n")
-        self.close_fd()
+        self._tables_written = getattr(self, "_tables_written", 0) + 1
 
-    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
-        """Process the callbacks for current row.
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows.
+
+        Notes:
+            The row that brings the rows processed up to table_max_rows is counted but not
+            added to the table. Any rows after it in the page are skipped and the fetch is
+            stopped by :meth:`check_stop` once the page has been returned.
 
         Args:
-            row: row to process
+            rows: rows to process
         """
-        rows = listify(row)
-        rows = self.do_pre_row(rows=rows)
-        self.check_stop()
+        rows = listify(rows)
+        max_rows = self.get_arg_value("table_max_rows")
+        rows_processed = self.STATE.get("rows_processed_total", 0) or 0
+        keep = len(rows)
+
+        if max_rows and rows_processed + keep >= max_rows:
+            keep = max(0, max_rows - rows_processed - 1)
+            rows = rows[: keep + 1]
+
+        rows = self.do_pre_page(rows=rows)[:keep]
+        if not rows and not self.callback_workers_draining:
+            self.check_stop()
+
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_row(rows=rows)
         # TBD textwrap key/values
         self._rows += rows
-        return rows
+
+        block_rows = self.get_arg_value("table_block_rows")
+        while block_rows and len(self._rows) >= block_rows:
+            self.write_table(count=block_rows)
+        del rows
+        return row_return
 
     def check_stop(self):
         """Check if rows processed is greater than table_max_rows."""
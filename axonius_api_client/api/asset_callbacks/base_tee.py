@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""Tee export callbacks class."""
+import copy
+import queue
+import threading
+from typing import List, Optional, Union
+
+from ...exceptions import ApiError, StopFetch
+from ...tools import coerce_int, listify
+from .base import Base
+
+TEE_QUEUE_SIZE: int = 4
+"""default number of pages that can be waiting for each export of a tee"""
+
+TEE_ARGS_SKIP: List[str] = ["tags_add", "tags_remove", "page_progress"]
+"""arguments that are handled by the tee and are not passed to each export"""
+
+
+def get_tee_spec(value: Union[str, dict]) -> dict:
+    """Parse an export spec for a tee.
+
+    Args:
+        value: export name, ``export=export_file`` string, or dict with an ``export`` key and
+            any arguments for that export
+
+    Raises:
+        :exc:`ApiError`: if value does not have an export name
+    """
+    if isinstance(value, str):
+        export, _, export_file = value.partition("=")
+        value = {"export": export.strip()}
+        if export_file.strip():
+            value["export_file"] = export_file.strip()
+
+    if not isinstance(value, dict) or not value.get("export"):
+        raise ApiError(f"Invalid tee export {value!r}, must be a str or a dict with an 'export'")
+    return dict(value)
+
+
+class TeeWriter:
+    """Run the callbacks object of one export of a tee in a background thread.
+
+    Notes:
+        Each page is put on a bounded queue and processed by a background thread, so an export
+        that is slow to write only blocks the fetch once its queue is full. Any error raised
+        by the callbacks object is raised by the next call to :meth:`put` or :meth:`close`.
+    """
+
+    def __init__(self, callbacks: Base, queue_size: int = TEE_QUEUE_SIZE):
+        """Run the callbacks object of one export of a tee in a background thread.
+
+        Args:
+            callbacks: callbacks object for this export
+            queue_size: number of pages that can be waiting for this export
+        """
+        self.callbacks: Base = callbacks
+        """callbacks object for this export"""
+
+        self.error: Optional[Exception] = None
+        """error raised by the callbacks object in the background thread"""
+
+        self.stopped: bool = False
+        """the callbacks object raised StopFetch and will not get any more pages"""
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the callbacks object and the background thread."""
+        self.callbacks.start()
+        self._thread = threading.Thread(target=self._run, name=f"tee_{self.name}", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Process pages from the queue until None is received, then stop the callbacks."""
+        while True:
+            rows = self._queue.get()
+            if rows is None:
+                break
+            if self.error is None and not self.stopped:
+                try:
+                    self.callbacks.process_page(rows=rows)
+                    self.callbacks.check_stop()
+                except StopFetch as exc:
+                    self.stopped = True
+                    self.callbacks.LOG.debug(f"Received {type(exc)}: {exc.reason}")
+                except Exception as exc:
+                    self.error = exc
+
+        if self.error is None:
+            try:
+                self.callbacks.process_pending()
+                self.callbacks.stop()
+            except Exception as exc:
+                self.error = exc
+
+    def _check_error(self):
+        """Raise the error from the background thread if one happened."""
+        if self.error is not None:
+            raise ApiError(f"Error in tee export {self.name!r}: {self.error}")
+
+    def put(self, rows: List[dict]):
+        """Hand a page of rows to the background thread.
+
+        Args:
+            rows: rows to process
+        """
+        self._check_error()
+        if not self.stopped:
+            self._queue.put(rows)
+
+    def finish(self):
+        """Tell the background thread to stop the callbacks object once the queue is empty."""
+        if self._thread:
+            self._queue.put(None)
+
+    def close(self):
+        """Wait for the background thread to stop the callbacks object."""
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self._check_error()
+
+    @property
+    def name(self) -> str:
+        """Get the name of the export."""
+        return self.callbacks.CB_NAME
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return f"{self.__class__.__name__}(name={self.name!r}, stopped={self.stopped})"
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
+
+
+class Tee(Base):
+    """Callbacks for exporting asset data to several formats from one fetch.
+
+    Examples:
+        Create a ``client`` using :obj:`axonius_api_client.connect.Connect` and assume
+        ``apiobj`` is either ``client.devices`` or ``client.users``
+
+        >>> apiobj = client.devices  # or client.users
+
+        * :meth:`args_map` for callback generic arguments to format assets.
+        * :meth:`args_map_custom` for callback specific arguments to format and export data.
+
+    """
+
+    @classmethod
+    def args_map_custom(cls) -> dict:
+        """Get the custom argument names and their defaults for this callbacks object.
+
+        Examples:
+            Export the output to a CSV file and a JSON lines file from one fetch.
+
+            >>> assets = apiobj.get(
+            ...     export="tee",
+            ...     tee_exports=["csv=assets.csv", "json=assets.ndjson"],
+            ...     json_flat=True,
+            ... )
+
+            Supplying a list of exports as ``export`` does the same thing.
+
+            >>> assets = apiobj.get(export=["csv=assets.csv", "json=assets.ndjson"])
+
+            Supply arguments for each export.
+
+            >>> assets = apiobj.get(
+            ...     export="tee",
+            ...     tee_exports=[
+            ...         {"export": "csv", "export_file": "assets.csv"},
+            ...         {"export": "json", "export_file": "assets.ndjson", "json_flat": True},
+            ...         {"export": "xlsx", "export_file": "assets.xlsx", "field_titles": True},
+            ...     ],
+            ... )
+
+        See Also:
+            * :meth:`args_map` for callback generic arguments to format assets.
+
+        Notes:
+            Each item of ``tee_exports`` is an export name, an ``export=export_file`` string,
+            or a dict with an ``export`` key and the arguments for that export. Each export
+            gets all of the arguments supplied to the get method except ``tags_add``,
+            ``tags_remove``, and ``page_progress``, and the arguments of the item are used
+            instead of them. Tags are added and removed once by this callbacks object.
+
+            Each export gets its own copy of each page of rows and processes it in its own
+            thread. Up to ``tee_queue_size`` pages can be waiting for each export, so an
+            export that is slow to write only slows down the fetch once that many pages are
+            waiting for it.
+
+            If an export stops the fetch (e.g. ``table_max_rows``), it gets no more rows and
+            the fetch continues until every export has stopped it.
+
+            These arguments can be supplied as extra kwargs passed to
+            :meth:`axonius_api_client.api.assets.users.Users.get` or
+            :meth:`axonius_api_client.api.assets.devices.Devices.get`
+
+        """
+        return {"tee_exports": [], "tee_queue_size": TEE_QUEUE_SIZE}
+
+    def start(self, **kwargs):
+        """Start this callbacks object."""
+        super(Tee, self).start(**kwargs)
+        self.writers: List[TeeWriter] = [
+            TeeWriter(callbacks=x, queue_size=self.tee_queue_size) for x in self.get_exports()
+        ]
+        for writer in self.writers:
+            writer.start()
+
+    def stop(self, **kwargs):
+        """Stop this callbacks object."""
+        super(Tee, self).stop(**kwargs)
+        writers = getattr(self, "writers", [])
+        for writer in writers:
+            writer.finish()
+        for writer in writers:
+            writer.close()
+
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows and hand a copy to each export.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_row(rows=rows)
+
+        writers = [x for x in self.writers if not x.stopped]
+        for idx, writer in enumerate(writers, 1):
+            writer.put(rows=rows if idx == len(writers) else copy.deepcopy(rows))
+
+        del rows
+        return row_return
+
+    def check_stop(self):
+        """Stop the fetch if every export has stopped it."""
+        writers = getattr(self, "writers", [])
+        if writers and all(x.stopped for x in writers):
+            reason = "every tee export has stopped the fetch"
+            self.STATE["stop_fetch"] = True
+            self.STATE["stop_msg"] = reason
+            raise StopFetch(reason=reason, state=self.STATE)
+
+    def get_exports(self) -> List[Base]:
+        """Create a callbacks object for each export in :attr:`tee_exports`."""
+        from .tools import get_callbacks_cls
+
+        skips = [*TEE_ARGS_SKIP, *self.args_map_custom()]
+        shared = {k: v for k, v in self.GETARGS.items() if k not in skips}
+        shared["page_progress"] = 0
+
+        exports = []
+        for spec in self.tee_exports:
+            spec = dict(spec)
+            cbcls = get_callbacks_cls(export=spec.pop("export"))
+            if issubclass(cbcls, Tee):
+                raise ApiError("Can not use a tee export inside of a tee export")
+
+            getargs = {**shared, **spec}
+            exports.append(
+                cbcls(apiobj=self.APIOBJ, getargs=getargs, state=dict(self.STATE), store=self.STORE)
+            )
+        return exports
+
+    @property
+    def callbacks(self) -> list:
+        """Get order of callbacks to run, the field callbacks are run by each export."""
+        return [self.process_tags_to_add, self.process_tags_to_remove]
+
+    @property
+    def tee_exports(self) -> List[dict]:
+        """Get the spec of each export from tee_exports or the list supplied as export."""
+        exports = self.get_arg_value("tee_exports")
+        if not exports and isinstance(self.STORE.get("export"), (list, tuple)):
+            exports = self.STORE["export"]
+
+        exports = [get_tee_spec(x) for x in listify(exports)]
+        if not exports:
+            raise ApiError("Must supply at least one export in tee_exports")
+        return exports
+
+    @property
+    def tee_queue_size(self) -> int:
+        """Get the number of pages that can be waiting for each export."""
+        return coerce_int(
+            self.get_arg_value("tee_queue_size") or TEE_QUEUE_SIZE,
+            min_value=1,
+            errmsg="Invalid value for tee_queue_size",
+        )
+
+    def __str__(self) -> str:
+        """Show info for this object."""
+        names = [x.name for x in getattr(self, "writers", [])]
+        return (
+            f"{self.CB_NAME.upper()} processor for {names}" if names else super(Tee, self).__str__()
+        )
+
+    CB_NAME: str = "tee"
+    """name for this callback"""
+
+    CB_RESUMABLE: bool = False
+    """callback supports resuming a fetch from a checkpoint"""
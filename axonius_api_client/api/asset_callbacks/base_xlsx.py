@@ -6,9 +6,12 @@ import xlsxwriter
 
 from ...constants.api import FIELD_TRIM_LEN
 from ...exceptions import ApiError
-from ...tools import listify
+from ...tools import coerce_int, listify
 from .base import ExportMixins
 
+XLSX_MAX_ROWS: int = 1048576
+"""maximum number of rows in a worksheet, including the column headers"""
+
 
 class Xlsx(ExportMixins):
     """Callbacks for formatting asset data and exporting it in Excel format.
@@ -71,12 +74,24 @@ class Xlsx(ExportMixins):
             ...     xlsx_cell_format=fmt,
             ... )
 
+            Start a new worksheet every 100,000 rows.
+
+            >>> assets = apiobj.get(
+            ...     export="xlsx",
+            ...     export_file="test.xlsx",
+            ...     xlsx_max_rows=100000,
+            ... )
+
         See Also:
             * :meth:`args_map` for callback generic arguments to format assets.
 
         Notes:
             If ``export_file`` does not end with ``.xlsx``, it will be appended to the filename.
 
+            When a worksheet has ``xlsx_max_rows`` rows (including the column headers), a new
+            worksheet is added with the column headers and the next rows are written to it.
+            ``xlsx_max_rows`` can not be more than the Excel limit of 1,048,576 rows.
+
             This callbacks object forces the following arguments to True in order to make the
             output usable in the exported format: ``field_null``, ``field_flatten``,
             and ``field_join``
@@ -97,6 +112,7 @@ class Xlsx(ExportMixins):
                 "field_null": True,
                 "xlsx_column_length": 50,
                 "xlsx_cell_format": {"text_wrap": True},
+                "xlsx_max_rows": XLSX_MAX_ROWS,
             }
         )
         return args
@@ -116,7 +132,6 @@ class Xlsx(ExportMixins):
         """Start this callbacks object."""
         export_file = self.get_arg_value("export_file")
         cell_format = self.get_arg_value("xlsx_cell_format")
-        column_length = self.get_arg_value("xlsx_column_length")
 
         if export_file:
             if not str(export_file).endswith(".xlsx"):
@@ -130,13 +145,26 @@ class Xlsx(ExportMixins):
 
         self._workbook = xlsxwriter.Workbook(str(self._file_path), {"constant_memory": True})
         self._cell_format = self._workbook.add_format(cell_format)
+        self._worksheet_count = 0
+        self.add_worksheet()
+
+    def add_worksheet(self):
+        """Add a worksheet, set the format of each column, and write the column headers."""
+        column_length = self.get_arg_value("xlsx_column_length")
 
+        self._worksheet_count += 1
         worksheet = f"{self.APIOBJ.__class__.__name__}"
+        if self._worksheet_count > 1:
+            worksheet = f"{worksheet} {self._worksheet_count}"
+            self.echo(msg=f"Reached {self.xlsx_max_rows} rows, adding worksheet {worksheet!r}")
+
         self._worksheet = self._workbook.add_worksheet(worksheet)
 
-        for idx, column_name in enumerate(self.final_columns):
-            self._worksheet.write(0, idx, column_name, self._cell_format)
-            self._worksheet.set_column(idx, idx, column_length)
+        # cells written without a format use the format of their column
+        final_columns = self.final_columns
+        for idx in range(len(final_columns)):
+            self._worksheet.set_column(idx, idx, column_length, self._cell_format)
+        self._worksheet.write_row(0, 0, final_columns, self._cell_format)
         self._rowtracker = 1
 
     def stop(self, **kwargs):
@@ -148,20 +176,24 @@ class Xlsx(ExportMixins):
         """Stop this callbacks object."""
         self._workbook.close()
 
-    def process_row(self, row: dict) -> List[dict]:
-        """Write row to dictwriter and delete it."""
-        rows = listify(row)
-        rows = self.do_pre_row(rows=rows)
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows and write them to the worksheet.
+
+        Args:
+            rows: rows to process
+        """
+        rows = self.do_pre_page(rows=rows)
 
         row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
         rows = self.do_row(rows=rows)
+        final_columns = self.final_columns
+        max_rows = self.xlsx_max_rows
 
         for row in listify(rows):
-            for idx, column_name in enumerate(self.final_columns):
-                self._worksheet.write(
-                    self._rowtracker, idx, row.get(column_name), self._cell_format
-                )
+            if self._rowtracker >= max_rows:
+                self.add_worksheet()
 
+            self._worksheet.write_row(self._rowtracker, 0, [row.get(x) for x in final_columns])
             self._rowtracker += 1
             del row
 
@@ -169,5 +201,11 @@ class Xlsx(ExportMixins):
 
         return row_return
 
+    @property
+    def xlsx_max_rows(self) -> int:
+        """Get the number of rows to write to a worksheet before adding a new worksheet."""
+        value = coerce_int(self.get_arg_value("xlsx_max_rows"), min_value=2)
+        return min(value, XLSX_MAX_ROWS)
+
     CB_NAME: str = "xlsx"
     """name for this callback"""
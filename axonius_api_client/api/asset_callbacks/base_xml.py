@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 """XML export callbacks."""
-from typing import List, Union
+from typing import List
 
 from ...tools import listify
 from .base import ExportMixins
 
+XML_ROOT: str = "assets"
+"""name of the root element"""
+
 
 class Xml(ExportMixins):
     """Callbacks for formatting asset data and exporting it in XML format.
@@ -93,30 +96,65 @@ class Xml(ExportMixins):
     def start(self, **kwargs):
         """Start this callbacks object."""
         super(Xml, self).start(**kwargs)
-        self._rows = []
         self.open_fd()
+        self.write_begin()
 
     def stop(self, **kwargs):
         """Stop this callbacks object."""
         super(Xml, self).stop(**kwargs)
-        rows = getattr(self, "_rows", [])
+        self.write_end()
+        self.close_fd()
+
+    def write_begin(self):
+        """Write the XML declaration and the opening tag of the root element."""
+        self._rows_written = 0
+        self._fd.write(f'<?xml version="1.0" encoding="utf-8"?>\n<{XML_ROOT}>')
+
+    def write_end(self):
+        """Write the closing tag of the root element."""
+        self._fd.write(f"</{XML_ROOT}>")
+
+    def write_rows(self, rows: List[dict]):
+        """Write an element for each row inside the root element.
+
+        Notes:
+            The rows are rendered inside a root element by ``xmltodict.unparse`` and the root
+            element tags are removed, so the output is the same as rendering all rows at once.
+
+        Args:
+            rows: rows to write
+        """
+        if not rows:
+            return
 
         asset_type = self.APIOBJ.__class__.__name__.lower()
-        xml_obj = {"assets": {asset_type: rows}}
-        self._xmltodict.unparse(xml_obj, output=self._fd, pretty=True)
-        self.close_fd()
+        xml_obj = {XML_ROOT: {asset_type: rows}}
+        xml = self._xmltodict.unparse(xml_obj, full_document=False, pretty=True)
+        start = len(f"<{XML_ROOT}>")
+        stop = len(xml) - len(f"</{XML_ROOT}>")
+        body = xml[start:stop]
+
+        if self._rows_written:
+            body = body.lstrip("\n")
+        self._fd.write(body)
+        self._rows_written += len(rows)
 
-    def process_row(self, row: Union[List[dict], dict]) -> List[dict]:
-        """Process the callbacks for current row.
+    def process_page(self, rows: List[dict]) -> List[dict]:
+        """Process the callbacks for current page of rows.
 
         Args:
-            row: row to process
+            rows: rows to process
         """
-        rows = listify(row)
-        rows = self.do_pre_row(rows=rows)
+        rows = listify(rows)
+        row_return = [{"internal_axon_id": row["internal_axon_id"]} for row in rows]
+        rows = self.do_pre_page(rows=rows)
         rows = self.do_row(rows=rows)
-        self._rows += rows
-        return rows
+        self.write_parts(rows=rows)
+        del rows
+        return row_return
 
     CB_NAME: str = "xml"
     """name for this callback"""
+
+    CB_ROTATE: bool = True
+    """callback supports rotating export_file into parts"""
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""Streaming compression for export files."""
+import bz2
+import gzip
+import io
+import lzma
+import pathlib
+import queue
+import threading
+from typing import IO, Dict, Optional, Union
+
+from ...exceptions import ApiError
+
+COMPRESSIONS: Dict[str, str] = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "xz": ".xz",
+    "zstd": ".zst",
+}
+"""map of compression name -> file suffix"""
+
+COMPRESS_NONE: str = "none"
+"""compression name to disable compression even if the file suffix is in :data:`COMPRESSIONS`"""
+
+COMPRESS_BUFFER_SIZE: int = 1024 * 1024
+"""size of the chunks of data that are handed to the compression thread"""
+
+COMPRESS_QUEUE_SIZE: int = 16
+"""number of chunks of data that can be waiting for the compression thread"""
+
+
+def get_compression(value: Optional[str], path: Union[str, pathlib.Path, None]) -> Optional[str]:
+    """Get the name of the compression to use for an export file.
+
+    Args:
+        value: name or file suffix of a compression from :data:`COMPRESSIONS`,
+            :data:`COMPRESS_NONE`, or None to use the suffix of path
+        path: export file to check the suffix of if value is None
+
+    Raises:
+        :exc:`ApiError`: if value is not a valid compression name
+    """
+    if value is None or value == "":
+        suffix = pathlib.Path(str(path or "")).suffix.lower()
+        return next((k for k, v in COMPRESSIONS.items() if v == suffix), None)
+
+    name = str(value).strip().lower().lstrip(".")
+    if name == COMPRESS_NONE:
+        return None
+
+    for key, suffix in COMPRESSIONS.items():
+        if name in [key, suffix.lstrip(".")]:
+            return key
+
+    valid = [COMPRESS_NONE, *COMPRESSIONS]
+    raise ApiError(f"Invalid export compression {value!r}, valid: {valid}")
+
+
+def get_compressor(fd: IO, name: str, level: Optional[int] = None) -> IO:
+    """Create a binary writer that compresses data written to it into a file descriptor.
+
+    Args:
+        fd: binary file descriptor to write compressed data to
+        name: name of compression from :data:`COMPRESSIONS`
+        level: compression level, None to use the default level of the compression
+
+    Raises:
+        :exc:`ApiError`: if name is zstd and the zstandard package is not installed
+    """
+    if name == "gzip":
+        return gzip.GzipFile(fileobj=fd, mode="wb", compresslevel=9 if level is None else level)
+    if name == "bz2":
+        return bz2.BZ2File(fd, mode="wb", compresslevel=9 if level is None else level)
+    if name == "xz":
+        return lzma.LZMAFile(fd, mode="wb", preset=level)
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:  # pragma: no cover
+            raise ApiError(
+                "The zstandard package is required for zstd compression "
+                f"(pip install axonius_api_client[zstd]): {exc}"
+            )
+
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.stream_writer(fd)
+    raise ApiError(f"Invalid export compression {name!r}, valid: {list(COMPRESSIONS)}")
+
+
+class CompressWriter(io.RawIOBase):
+    """Binary writer that compresses data in a background thread.
+
+    Notes:
+        Each write is put on a queue and written to the compressor by a background thread,
+        so the callbacks object does not wait for the compression of one chunk before
+        processing the next rows. The queue is bounded so memory use is bounded if the
+        compression can not keep up. Any error raised by the compressor is raised by the
+        next call to :meth:`write` or :meth:`close`.
+    """
+
+    def __init__(self, fd: IO, name: str, level: Optional[int] = None):
+        """Binary writer that compresses data in a background thread.
+
+        Args:
+            fd: binary file descriptor to write compressed data to
+            name: name of compression from :data:`COMPRESSIONS`
+            level: compression level, None to use the default level of the compression
+        """
+        super().__init__()
+        self.fd: IO = fd
+        """binary file descriptor to write compressed data to"""
+
+        self.name: str = name
+        """name of compression from :data:`COMPRESSIONS`"""
+
+        self.compressor: IO = get_compressor(fd=fd, name=name, level=level)
+        """binary writer that compresses data into :attr:`fd`"""
+
+        self.error: Optional[Exception] = None
+        """error raised by the compressor in the background thread"""
+
+        self._queue: queue.Queue = queue.Queue(maxsize=COMPRESS_QUEUE_SIZE)
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name=f"compress_{name}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        """Write chunks from the queue to the compressor until None is received."""
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            if self.error is None:
+                try:
+                    self.compressor.write(data)
+                except Exception as exc:
+                    self.error = exc
+
+    def _check_error(self):
+        """Raise the error from the background thread if one happened."""
+        if self.error is not None:
+            raise ApiError(f"Error compressing export with {self.name}: {self.error}")
+
+    def writable(self) -> bool:
+        """Pass."""
+        return True
+
+    def write(self, data: bytes) -> int:
+        """Hand a chunk of data to the background thread to compress.
+
+        Args:
+            data: data to compress
+        """
+        self._check_error()
+        self._queue.put(bytes(data))
+        return len(data)
+
+    def close(self):
+        """Wait for the background thread, then close the compressor and file descriptor."""
+        if self.closed:
+            return
+
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            if self.error is None:
+                self.compressor.close()
+        finally:
+            self.fd.close()
+            super().close()
+        self._check_error()
+
+
+def open_compressed(path: pathlib.Path, name: str, level: Optional[int] = None) -> IO:
+    """Open a text file descriptor that compresses data written to it in a background thread.
+
+    Args:
+        path: path to write compressed data to
+        name: name of compression from :data:`COMPRESSIONS`
+        level: compression level, None to use the default level of the compression
+    """
+    fd = path.open(mode="wb")
+    try:
+        writer = CompressWriter(fd=fd, name=name, level=level)
+    except Exception:
+        fd.close()
+        raise
+
+    buffered = io.BufferedWriter(writer, buffer_size=COMPRESS_BUFFER_SIZE)
+    return io.TextIOWrapper(buffered, encoding="utf-8")
+
+
+def open_decompressed(path: pathlib.Path, name: Optional[str] = None) -> IO:
+    """Open a text file descriptor that reads a file written by :func:`open_compressed`.
+
+    Args:
+        path: path to read compressed data from
+        name: name of compression from :data:`COMPRESSIONS`, None to read a plain text file
+    """
+    if not name:
+        return path.open(mode="r", encoding="utf-8")
+    if name == "gzip":
+        return gzip.open(path, mode="rt", encoding="utf-8")
+    if name == "bz2":
+        return bz2.open(path, mode="rt", encoding="utf-8")
+    if name == "xz":
+        return lzma.open(path, mode="rt", encoding="utf-8")
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:  # pragma: no cover
+            raise ApiError(
+                "The zstandard package is required for zstd compression "
+                f"(pip install axonius_api_client[zstd]): {exc}"
+            )
+
+        return zstandard.open(path, mode="rt", encoding="utf-8")
+    raise ApiError(f"Invalid export compression {name!r}, valid: {list(COMPRESSIONS)}")
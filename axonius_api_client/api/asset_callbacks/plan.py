@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""Compiled execution plan for asset callbacks."""
+import dataclasses
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+from ...constants.api import FIELD_TRIM_STR
+from ...exceptions import ApiError
+from ...tools import coerce_int, listify
+
+EXCLUDED_KEYS_TYPE = Dict[str, FrozenSet[str]]
+
+SOFTWARE_CACHE_SIZE: int = 100000
+"""number of software names to cache the whitelist matches of before the cache is cleared"""
+
+
+def get_excluded_keys(excluded_schemas: List[dict], find_keys: List[str]) -> EXCLUDED_KEYS_TYPE:
+    """Build a map of schema key -> set of values of that key from the excluded schemas.
+
+    Args:
+        excluded_schemas: schemas of fields supplied to field_excludes
+        find_keys: schema keys to use when matching a schema to an excluded schema
+    """
+    return {key: frozenset(x[key] for x in excluded_schemas if x.get(key)) for key in find_keys}
+
+
+def is_excluded(schema: dict, excluded_keys: EXCLUDED_KEYS_TYPE) -> bool:
+    """Check if any of the keys of a schema match the same key of an excluded schema.
+
+    Args:
+        schema: field schema to check
+        excluded_keys: map returned by :func:`get_excluded_keys`
+    """
+    for key, values in excluded_keys.items():
+        if values:
+            value = schema.get(key)
+            if value and value in values:
+                return True
+    return False
+
+
+@dataclasses.dataclass(frozen=True)
+class NullSpec:
+    """Field to add a null value for if it is missing from a row (or an item of a row)."""
+
+    key: str
+    """key of the field in the row or item"""
+
+    is_complex: bool
+    """field is complex, null values are added for sub_specs in each item"""
+
+    sub_specs: Tuple["NullSpec", ...] = ()
+    """specs for the sub fields of a complex field"""
+
+
+@dataclasses.dataclass(frozen=True)
+class ComplexSpec:
+    """Field to flatten or explode."""
+
+    name_qual: str
+    """fully qualified name of the field"""
+
+    is_complex: bool
+    """field is complex"""
+
+    sub_fields: Tuple[Tuple[str, str], ...] = ()
+    """tuples of (name, name_qual) for the root sub fields that are not excluded"""
+
+
+@dataclasses.dataclass(frozen=True)
+class SoftwareWhitelist:
+    """Regexes of report_software_whitelist compiled once for matching every software name.
+
+    Notes:
+        All of the regexes are also compiled into one alternation, so a software name that
+        does not match any of them is found with a single search. Only the names that match
+        the alternation are searched with each regex to find which whitelist entries they
+        match. The matches of each name are cached, since the same software is installed on
+        many assets.
+    """
+
+    whitelist: Tuple[str, ...]
+    """regexes supplied to report_software_whitelist"""
+
+    patterns: Tuple[Pattern, ...]
+    """compiled regex for each entry of :attr:`whitelist`"""
+
+    combined: Optional[Pattern] = None
+    """alternation of every regex, None if the regexes can not be combined"""
+
+    cache: Dict[str, FrozenSet[int]] = dataclasses.field(default_factory=dict, compare=False)
+    """map of software name -> indexes of the entries of :attr:`whitelist` it matches"""
+
+    @classmethod
+    def from_whitelist(cls, whitelist: Iterable[str]) -> "SoftwareWhitelist":
+        """Compile the regexes of report_software_whitelist.
+
+        Args:
+            whitelist: regexes to match against software names (case insensitive)
+
+        Raises:
+            :exc:`ApiError`: if an entry of whitelist is not a valid regex
+        """
+        whitelist = tuple(str(x) for x in listify(whitelist))
+        patterns = []
+        for value in whitelist:
+            try:
+                patterns.append(re.compile(value, re.I))
+            except re.error as exc:
+                raise ApiError(f"Invalid regex {value!r} in report_software_whitelist: {exc}")
+
+        combined = None
+        # backreferences in regexes with groups would refer to the wrong group once combined
+        if not any(x.groups for x in patterns):
+            try:
+                combined = re.compile("|".join(f"(?:{x})" for x in whitelist), re.I)
+            except re.error:  # pragma: no cover
+                pass  # e.g. inline global flags that are not at the start of a regex
+
+        return cls(whitelist=whitelist, patterns=tuple(patterns), combined=combined)
+
+    def get_matches(self, name: str) -> FrozenSet[int]:
+        """Get the indexes of the entries of :attr:`whitelist` that match a software name.
+
+        Args:
+            name: name of installed software
+        """
+        matches = self.cache.get(name)
+        if matches is None:
+            if self.combined is not None and not self.combined.search(name):
+                matches = frozenset()
+            else:
+                matches = frozenset(i for i, x in enumerate(self.patterns) if x.search(name))
+
+            if len(self.cache) >= SOFTWARE_CACHE_SIZE:
+                self.cache.clear()
+            self.cache[name] = matches
+        return matches
+
+    def get_report(self, names: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """Get the missing and extra software for the installed software of an asset.
+
+        Args:
+            names: names of the installed software of an asset
+
+        Returns:
+            Tuple[List[str], List[str]]: entries of :attr:`whitelist` that do not match any
+            of names, and names that do not match any entry of :attr:`whitelist`
+        """
+        matched = set()
+        extras = set()
+        for name in set(names):
+            matches = self.get_matches(name=name)
+            if matches:
+                matched.update(matches)
+            else:
+                extras.add(name)
+
+        missing = {x for i, x in enumerate(self.whitelist) if i not in matched}
+        return sorted(missing), sorted(extras)
+
+
+@dataclasses.dataclass(frozen=True)
+class CallbackPlan:
+    """Callback arguments and selected schemas compiled once for processing every row.
+
+    Notes:
+        A plan only holds strings, tuples, frozensets, and dicts so it can be pickled and
+        sent to other processes.
+    """
+
+    callbacks_disabled: FrozenSet[str]
+    """names of the callbacks methods that have nothing to do for these arguments"""
+
+    excluded_keys: EXCLUDED_KEYS_TYPE
+    """map returned by :func:`get_excluded_keys`"""
+
+    excludes: Tuple[str, ...]
+    """names of the selected fields to remove from rows"""
+
+    excludes_sub: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    """tuples of (name_qual, sub field names) of sub fields to remove from complex fields"""
+
+    nulls: Tuple[NullSpec, ...]
+    """fields to add null values for"""
+
+    flattens: Tuple[ComplexSpec, ...]
+    """complex fields to flatten"""
+
+    explode: Optional[ComplexSpec]
+    """field to explode"""
+
+    titles: Tuple[Tuple[str, str, bool], ...]
+    """tuples of (name_qual, column_title, is_complex) for renaming fields to titles"""
+
+    renames_compress: Dict[str, str]
+    """map of field name -> compressed field name for the final schemas"""
+
+    renames_replace: Dict[str, str]
+    """map of field name -> field name with replacements for the final schemas"""
+
+    null_value: Any = None
+    """value to use for missing fields"""
+
+    null_value_complex: Any = dataclasses.field(default_factory=list)
+    """value to use for missing complex fields"""
+
+    join_value: str = ""
+    """value to use when joining list values"""
+
+    join_trim: int = 0
+    """trim joined values to this length, 0 for no trimming"""
+
+    join_trim_str: str = FIELD_TRIM_STR
+    """message to add to joined values that were trimmed"""
+
+    software_whitelist: Optional[SoftwareWhitelist] = None
+    """compiled regexes of report_software_whitelist"""
+
+    def is_excluded(self, schema: dict) -> bool:
+        """Check if a schema is excluded using :func:`is_excluded`."""
+        return is_excluded(schema=schema, excluded_keys=self.excluded_keys)
+
+    @classmethod
+    def from_callbacks(cls, callbacks) -> "CallbackPlan":
+        """Compile a plan from the arguments and selected schemas of a callbacks object.
+
+        Args:
+            callbacks (:obj:`axonius_api_client.api.asset_callbacks.base.Base`): callbacks
+                object to compile a plan for
+        """
+        get_arg = callbacks.get_arg_value
+        excluded_keys = callbacks.excluded_keys
+        schemas = callbacks.schemas_selected
+        explode_schema = callbacks.schema_to_explode if get_arg("field_explode") else {}
+
+        def excluded(schema):
+            return is_excluded(schema=schema, excluded_keys=excluded_keys)
+
+        def sub_schemas(schema):
+            return [
+                x for x in listify(schema.get("sub_fields")) if not excluded(x) and x["is_root"]
+            ]
+
+        def null_spec(schema, key):
+            subs = tuple(null_spec(x, "name") for x in sub_schemas(schema))
+            is_complex = schema["is_complex"]
+            return NullSpec(key=schema[key], is_complex=is_complex, sub_specs=subs)
+
+        def complex_spec(schema):
+            subs = tuple((x["name"], x["name_qual"]) for x in sub_schemas(schema))
+            return ComplexSpec(
+                name_qual=schema["name_qual"], is_complex=schema["is_complex"], sub_fields=subs
+            )
+
+        excludes = []
+        excludes_sub = []
+        for schema in schemas:
+            if excluded(schema):
+                excludes.append(schema["name_qual"])
+            elif schema["is_complex"]:
+                subs = tuple(x["name"] for x in schema["sub_fields"] if excluded(x))
+                if subs:
+                    excludes_sub.append((schema["name_qual"], subs))
+
+        final_schemas = callbacks.final_schemas
+        final_keys = [x["name_qual"] for x in final_schemas]
+        final_keys += [x["column_title"] for x in final_schemas]
+        renames_compress = {k: callbacks._field_compress(key=k) for k in final_keys}
+
+        compress = get_arg("field_compress")
+        join = get_arg("field_join")
+        replacements = callbacks.field_replacements
+        explode_excluded = not explode_schema or excluded(explode_schema)
+        software_whitelist = listify(get_arg("report_software_whitelist"))
+
+        enabled = {
+            "do_custom_cbs": listify(get_arg("custom_cbs")),
+            "process_tags_to_add": listify(get_arg("tags_add")),
+            "process_tags_to_remove": listify(get_arg("tags_remove")),
+            "add_report_adapters_missing": get_arg("report_adapters_missing"),
+            "add_report_software_whitelist": software_whitelist,
+            "do_excludes": get_arg("field_excludes"),
+            "do_add_null_values": get_arg("field_null"),
+            "do_flatten_fields": get_arg("field_flatten"),
+            "do_explode_field": not explode_excluded,
+            "do_join_values": join,
+            "do_change_field_titles": get_arg("field_titles"),
+            "do_change_field_compress": compress,
+            "do_change_field_replace": replacements,
+        }
+
+        return cls(
+            callbacks_disabled=frozenset(k for k, v in enabled.items() if not v),
+            excluded_keys=excluded_keys,
+            excludes=tuple(excludes),
+            excludes_sub=tuple(excludes_sub),
+            nulls=tuple(null_spec(x, "name_qual") for x in schemas if not excluded(x)),
+            flattens=tuple(
+                complex_spec(x)
+                for x in schemas
+                if x != explode_schema and x["is_complex"] and not excluded(x)
+            ),
+            explode=None if explode_excluded else complex_spec(explode_schema),
+            titles=tuple(
+                (x["name_qual"], x["column_title"], x["is_complex"]) for x in final_schemas
+            ),
+            renames_compress=renames_compress,
+            renames_replace={
+                k: callbacks._field_replace(key=k)
+                for k in [*final_keys, *renames_compress.values()]
+            },
+            null_value=get_arg("field_null_value"),
+            null_value_complex=get_arg("field_null_value_complex"),
+            join_value=str(get_arg("field_join_value")),
+            join_trim=coerce_int(get_arg("field_join_trim")) if join else 0,
+            software_whitelist=(
+                SoftwareWhitelist.from_whitelist(whitelist=software_whitelist)
+                if software_whitelist
+                else None
+            ),
+        )
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Rotation of export files into parts."""
+import pathlib
+from typing import List, Tuple
+
+from ...json_codec import get_codec
+from .compress import COMPRESSIONS
+
+ROTATE_CHECK_ROWS: int = 100
+"""number of rows written between checks of the size of a part if export_rotate_bytes is used"""
+
+ROTATE_PART_FORMAT: str = "part{number:04d}"
+"""format of the part number that is added to the name of each part"""
+
+ROTATE_MANIFEST: str = "manifest.json"
+"""suffix of the manifest that lists the parts of an export"""
+
+
+def split_export_name(name: str) -> Tuple[str, str, str]:
+    """Split the name of an export file into stem, suffix, and compression suffix.
+
+    Args:
+        name: name of an export file, e.g. ``assets.csv.gz``
+    """
+    compress = next((x for x in COMPRESSIONS.values() if name.endswith(x)), "")
+    if compress:
+        name = name[: -len(compress)]
+
+    path = pathlib.Path(name)
+    return path.stem, path.suffix, compress
+
+
+def get_part_path(path: pathlib.Path, number: int) -> pathlib.Path:
+    """Get the path of a part of an export file.
+
+    Examples:
+        >>> get_part_path(pathlib.Path("/tmp/assets.csv.gz"), 2)
+        PosixPath('/tmp/assets.part0002.csv.gz')
+
+    Args:
+        path: path of the export file
+        number: number of the part
+    """
+    stem, suffix, compress = split_export_name(name=path.name)
+    part = ROTATE_PART_FORMAT.format(number=number)
+    return path.parent / f"{stem}.{part}{suffix}{compress}"
+
+
+def get_manifest_path(path: pathlib.Path) -> pathlib.Path:
+    """Get the path of the manifest of an export file.
+
+    Examples:
+        >>> get_manifest_path(pathlib.Path("/tmp/assets.csv.gz"))
+        PosixPath('/tmp/assets.manifest.json')
+
+    Args:
+        path: path of the export file
+    """
+    stem, _, _ = split_export_name(name=path.name)
+    return path.parent / f"{stem}.{ROTATE_MANIFEST}"
+
+
+def write_manifest(path: pathlib.Path, export: str, parts: List[dict], finished: bool):
+    """Write the manifest of the parts of an export file.
+
+    Notes:
+        The manifest is written to a temporary file that is then renamed, so a reader never
+        sees a partially written manifest.
+
+    Args:
+        path: path of the manifest
+        export: name of the export format
+        parts: info for each part that has been closed
+        finished: all parts have been written
+    """
+    manifest = {
+        "export": export,
+        "finished": finished,
+        "parts_total": len(parts),
+        "rows_total": sum(x["rows"] for x in parts),
+        "parts": parts,
+    }
+    temp_path = path.parent / f".{path.name}.tmp"
+    temp_path.write_text(get_codec().dumps(manifest, indent=2), encoding="utf-8")
+    temp_path.replace(path)
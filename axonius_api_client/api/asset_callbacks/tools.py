@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Tools for loading callbacks."""
-from typing import Dict
+from typing import Dict, List, Union
 
 from ...exceptions import ApiError
 from ...tools import get_subcls
@@ -15,13 +15,17 @@ CB_MAP: Dict[str, Base] = {
 CB_DEF: str = Base.CB_NAME
 
 
-def get_callbacks_cls(export: str = CB_DEF) -> Base:
+def get_callbacks_cls(export: Union[str, List[Union[str, dict]]] = CB_DEF) -> Base:
     """Get a callback class.
 
     Args:
         export: export format from asset object get method to map to a callback object
-            must be one of :data:`CB_MAP`
+            must be one of :data:`CB_MAP`, or a list of exports to write from one fetch with
+            :obj:`axonius_api_client.api.asset_callbacks.base_tee.Tee`
     """
+    if isinstance(export, (list, tuple)):
+        return CB_MAP["tee"]
+
     export = export or CB_DEF
     if export in CB_MAP:
         return CB_MAP[export]
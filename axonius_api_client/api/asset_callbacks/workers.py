@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""Run asset callbacks across a pool of processes."""
+import collections
+import concurrent.futures
+import logging
+from typing import Callable, List, Optional, Type
+
+from ...tools import listify
+from .plan import CallbackPlan
+
+WORKER_CALLBACKS: List[str] = [
+    "do_excludes",
+    "do_add_null_values",
+    "do_flatten_fields",
+    "do_explode_field",
+    "do_join_values",
+    "do_change_field_titles",
+    "do_change_field_compress",
+    "do_change_field_replace",
+]
+"""callbacks that only use the plan and the field arguments, so they can run in a worker"""
+
+WORKER_ARGS_PREFIX: str = "field_"
+"""prefix of the arguments that are sent to each worker"""
+
+WORKER: Optional[object] = None
+"""callbacks object created by :func:`init_worker` in each worker process"""
+
+WORKER_NAMES: List[str] = []
+"""names of the callbacks run by :func:`run_worker` in each worker process"""
+
+
+def init_worker(cbcls: Type, getargs: dict, plan: CallbackPlan, names: List[str]):
+    """Create the callbacks object used by :func:`run_worker` in a worker process.
+
+    Notes:
+        The object is not connected to an API object. It only has the arguments and the plan
+        needed by the callbacks in :data:`WORKER_CALLBACKS`.
+
+    Args:
+        cbcls: callbacks class to create the object from
+        getargs: field arguments of the callbacks object in the parent process
+        plan: plan compiled by the callbacks object in the parent process
+        names: names of the callbacks to run for each chunk of rows
+    """
+    global WORKER, WORKER_NAMES
+    worker = cbcls.__new__(cbcls)
+    worker.GETARGS = getargs
+    worker.STATE = {}
+    worker.LOG = logging.getLogger(f"{cbcls.__module__}.{cbcls.__name__}")
+    worker._plan = plan
+    WORKER = worker
+    WORKER_NAMES = names
+
+
+def run_worker(rows: List[dict]) -> List[dict]:
+    """Run the callbacks set up by :func:`init_worker` for a page of rows.
+
+    Args:
+        rows: rows to process
+    """
+    for name in WORKER_NAMES:
+        rows = getattr(WORKER, name)(rows=rows)
+    return rows
+
+
+class CallbackWorkers:
+    """Run the callbacks that can run in another process across a pool of processes.
+
+    Notes:
+        The callbacks are split into the callbacks that run in this process (custom callbacks,
+        tagging, and reports, which need the API object or change the callbacks object) and the
+        callbacks at the end of :attr:`axonius_api_client.api.asset_callbacks.base.Base.callbacks`
+        that are in :data:`WORKER_CALLBACKS`.
+
+        The plan and field arguments are sent to each worker once when the pool is started.
+        Each page is sent to the pool as one task and :meth:`run` returns without waiting for
+        it, so the next page can be fetched while the workers process the previous pages.
+        :meth:`run` returns the rows of the pages that are done, always in the order the pages
+        were sent, and only waits for a page once there are more than ``workers`` pages
+        pending. The rows of any pages still pending must be collected with
+        :meth:`run` while :attr:`draining` is True, which is done by
+        :meth:`axonius_api_client.api.asset_callbacks.base.Base.process_pending`.
+    """
+
+    def __init__(self, callbacks, workers: int):
+        """Run the callbacks that can run in another process across a pool of processes.
+
+        Args:
+            callbacks (:obj:`axonius_api_client.api.asset_callbacks.base.Base`): callbacks
+                object to run callbacks for
+            workers: number of processes to start
+        """
+        self.callbacks = callbacks
+        """callbacks object to run callbacks for"""
+
+        self.workers: int = workers
+        """number of processes to start"""
+
+        self.callbacks_local: List[Callable] = list(callbacks.callbacks_enabled)
+        """callbacks to run in this process before the rows are sent to the workers"""
+
+        self.names: List[str] = []
+        """names of the callbacks to run in the workers"""
+
+        while self.callbacks_local:
+            name = getattr(self.callbacks_local[-1], "__name__", None)
+            if name not in WORKER_CALLBACKS:
+                break
+            self.names.insert(0, name)
+            self.callbacks_local.pop()
+
+        self.executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        """process pool started on first use by :meth:`run`"""
+
+        self.pending: collections.deque = collections.deque()
+        """futures of the pages sent to the pool that have not been returned yet, in order"""
+
+        self.draining: bool = False
+        """:meth:`run` waits for all pending pages instead of only the ones that are done"""
+
+    def start(self):
+        """Start the process pool and send the plan and field arguments to each worker."""
+        if self.executor:
+            return
+
+        getargs = {
+            k: v for k, v in self.callbacks.GETARGS.items() if k.startswith(WORKER_ARGS_PREFIX)
+        }
+        self.callbacks.LOG.debug(
+            f"Starting {self.workers} callback workers for callbacks {self.names}"
+        )
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker,
+            initargs=(self.callbacks.__class__, getargs, self.callbacks.plan, self.names),
+        )
+
+    def run(self, rows: List[dict]) -> List[dict]:
+        """Send a page of rows to the process pool and get the rows of the pages that are done.
+
+        Args:
+            rows: rows of the page to process, may be empty to only get pending pages
+
+        Returns:
+            List[dict]: processed rows of the oldest pages that are done, in page order
+        """
+        rows = listify(rows)
+        if not self.names:
+            return rows
+
+        if rows:
+            self.start()
+            self.pending.append(self.executor.submit(run_worker, rows))
+
+        ready = []
+        while self.pending and (
+            self.draining or len(self.pending) > self.workers or self.pending[0].done()
+        ):
+            ready += self.pending.popleft().result()
+        return ready
+
+    def close(self):
+        """Stop the process pool, discarding any pages that are still pending."""
+        for future in self.pending:
+            future.cancel()
+        self.pending.clear()
+
+        if self.executor:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return (
+            f"{self.__class__.__name__}(workers={self.workers}, names={self.names}, "
+            f"pending={len(self.pending)})"
+        )
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
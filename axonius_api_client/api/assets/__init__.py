@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """APIs for working with assets, saved queries, fields, and tags."""
+from .asset_async import AsyncAssets
 from .asset_mixin import AssetMixin
 from .devices import Devices
 from .fields import Fields
@@ -11,6 +12,7 @@ __all__ = (
     "Users",
     "Devices",
     "AssetMixin",
+    "AsyncAssets",
     "SavedQuery",
     "Fields",
     "Labels",
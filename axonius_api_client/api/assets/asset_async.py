@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Asyncio API for working with assets."""
+import asyncio
+from typing import AsyncGenerator, Callable, List, Optional, Tuple
+
+from ...exceptions import ApiError, StopFetch
+from ...http import AsyncHttp
+from ...tools import dt_now
+from .. import json_api
+from ..api_endpoints import ApiEndpoints
+from .asset_mixin import AssetMixin
+
+
+class AsyncAssets:
+    """Asyncio API for working with assets of a given type.
+
+    Notes:
+        Wraps an :obj:`axonius_api_client.api.assets.asset_mixin.AssetMixin` object. Requests
+        for pages and counts are awaited using :obj:`axonius_api_client.http.AsyncHttp`, and
+        each page is processed using the same callbacks pipeline as
+        :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get_generator`.
+
+        Parsing each response, processing each page through the callbacks (including writing
+        to export files), and any other blocking calls (field validation, saved queries,
+        tagging, and so on) are run in the thread pool of
+        :obj:`axonius_api_client.http.AsyncHttp`, so the event loop is not blocked by them.
+
+        Limitations: requests are sent by :obj:`requests.Session` objects in threads, not by
+        an asyncio transport, so concurrency is limited by the number of threads of
+        :obj:`axonius_api_client.http.AsyncHttp`. :meth:`aget` fetches one page at a time and
+        only fetches the next page after the current page has been processed.
+
+    Examples:
+        >>> import asyncio
+        >>> import axonius_api_client as axonapi
+        >>> async def main():
+        ...     async with axonapi.AsyncConnect(url=url, key=key, secret=secret) as client:
+        ...         count = await client.devices.count()
+        ...         async for row in client.devices.aget(fields="hostname"):
+        ...             print(row)
+        >>> asyncio.run(main())
+    """
+
+    NOT_ASYNC_ARGS: dict = {
+        "workers": 1,
+        "prefetch_pages": 0,
+        "page_size_adaptive": False,
+    }
+    """arguments of get_generator that use threads and are not supported by :meth:`aget`"""
+
+    def __init__(self, apiobj: AssetMixin, http: AsyncHttp):
+        """Asyncio API for working with assets of a given type.
+
+        Args:
+            apiobj: asset object to wrap
+            http: asyncio HTTP object to use to send requests
+        """
+        self.apiobj: AssetMixin = apiobj
+        """asset object used to build requests and process pages"""
+
+        self.http: AsyncHttp = http
+        """asyncio HTTP object used to send requests"""
+
+    @property
+    def ASSET_TYPE(self) -> str:
+        """Type of assets."""
+        return self.apiobj.ASSET_TYPE
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run a blocking method of :attr:`apiobj` in a thread and await the result."""
+        return await self.http.run(func, *args, **kwargs)
+
+    async def count(self, use_cache_entry: bool = False, **kwargs) -> int:
+        """Get the count of assets from a query.
+
+        Examples:
+            >>> count = await apiobj.count(query='(specific_data.data.name == "test")')
+
+        Args:
+            use_cache_entry: use a cached count if one exists
+            **kwargs: passed to
+                :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin._get_count_args`
+        """
+        count_args = await self.run(self.apiobj._get_count_args, **kwargs)
+        value = None
+
+        while value is None:
+            value = (await self._count(use_cache_entry=use_cache_entry, **count_args)).value
+            use_cache_entry = True
+
+        return value
+
+    async def aget(self, **kwargs) -> AsyncGenerator[dict, None]:
+        """Get assets from a query.
+
+        Examples:
+            >>> async for row in apiobj.aget(query=query, export="csv", export_file="x.csv"):
+            ...     pass
+
+        Args:
+            **kwargs: passed to
+                :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get_generator`
+        """
+        for key, value in self.NOT_ASYNC_ARGS.items():
+            if kwargs.get(key, value) != value:
+                raise ApiError(f"Can not use {key}={kwargs[key]!r} with {self.aget.__name__}")
+
+        apiobj = self.apiobj
+        store, state, callbacks = await self.run(apiobj._get_setup, **kwargs)
+
+        while not state["stop_fetch"]:
+            start_dt = dt_now()
+            page = await self._get_page(
+                store=store,
+                cursor_id=state["page_cursor"],
+                offset=state["rows_offset"],
+                limit=state["page_size"],
+            )
+
+            rows, stopped = await self.run(
+                self._process_page,
+                page=page,
+                start_dt=start_dt,
+                store=store,
+                state=state,
+                callbacks=callbacks,
+            )
+
+            for row in rows:
+                yield row
+
+            if stopped:
+                break
+
+            await asyncio.sleep(state["page_sleep"])
+
+        for row in await self.run(callbacks.process_pending):
+            yield row
+
+        await self.run(apiobj._get_finish, store=store, state=state, callbacks=callbacks)
+
+    def _process_page(self, **kwargs) -> Tuple[List[dict], bool]:
+        """Process a page of assets through the callbacks in a thread.
+
+        Returns:
+            Tuple[List[dict], bool]: rows to yield, and True if the fetch should be stopped
+        """
+        rows = []
+        try:
+            for row in self.apiobj._process_page(**kwargs):
+                rows.append(row)
+        except StopFetch as exc:
+            self.apiobj.LOG.debug(f"Received {type(exc)}: {exc.reason}")
+            return rows, True
+        return rows, False
+
+    async def _get_page(self, store: dict, **kwargs) -> json_api.assets.AssetsPage:
+        """Fetch a single page of assets for the query in a store from :meth:`aget`."""
+        get_args = self.apiobj._get_page_args(store=store, **kwargs)
+        request_obj = self.apiobj._get_request(**get_args)
+        return await ApiEndpoints.assets.get.perform_request_async(
+            http=self.http, request_obj=request_obj, asset_type=self.ASSET_TYPE
+        )
+
+    async def _count(
+        self,
+        filter: Optional[str] = None,
+        history_date: Optional[str] = None,
+        use_cache_entry: bool = False,
+    ) -> json_api.assets.Count:
+        """Private API method to get the count of assets."""
+        api_endpoint = ApiEndpoints.assets.count
+        request_obj = api_endpoint.load_request(
+            use_cache_entry=use_cache_entry, filter=filter, history=history_date
+        )
+        return await api_endpoint.perform_request_async(
+            http=self.http, request_obj=request_obj, asset_type=self.ASSET_TYPE
+        )
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return f"{self.__class__.__name__}(apiobj={self.apiobj}, http={self.http})"
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
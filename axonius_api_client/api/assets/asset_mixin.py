@@ -1,19 +1,35 @@
 # -*- coding: utf-8 -*-
 """API model mixin for device and user assets."""
 import datetime
+import functools
 import time
-from typing import Generator, List, Optional, Union
+from typing import Callable, Generator, List, Optional, Tuple, Union
 
 import cachetools
 
-from ...constants.api import DEFAULT_CALLBACKS_CLS, MAX_PAGE_SIZE, PAGE_SIZE
+from ...constants.api import (
+    DEFAULT_CALLBACKS_CLS,
+    MAX_PAGE_SIZE,
+    PAGE_SIZE,
+    PAGE_SIZE_ADAPTIVE_MIN,
+    PAGE_SIZE_ADAPTIVE_TARGET,
+)
 from ...exceptions import ApiError, NotFoundError, ResponseNotOk, StopFetch
-from ...tools import combo_dicts, dt_now, dt_now_file, json_dump, listify
+from ...http import Http
+from ...tools import PathLike, combo_dicts, dt_now, dt_now_file, json_dump, listify
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
+from ..asset_callbacks.base import Base
 from ..asset_callbacks.tools import get_callbacks_cls
 from ..mixins import ModelMixins
 from ..wizards import Wizard, WizardCsv, WizardText
+from .paging import (
+    AdaptivePageSize,
+    PagePrefetcher,
+    ParallelPageFetcher,
+    load_checkpoint,
+    save_checkpoint,
+)
 
 GEN_TYPE = Union[Generator[dict, None, None], List[dict]]
 HISTORY_DATES_OBJ_CACHE = cachetools.TTLCache(maxsize=1, ttl=300)
@@ -87,27 +103,41 @@ class AssetMixin(ModelMixins):
             wiz_entries: wizard expressions to create query from
 
         """
-        wiz_parsed = self.get_wiz_entries(wiz_entries=wiz_entries)
-
-        if isinstance(wiz_parsed, dict) and wiz_parsed.get("query"):
-            query = wiz_parsed["query"]
-
-        history_date = self.get_history_date(
-            date=history_date, days_ago=history_days_ago, exact=history_exact
+        count_args = self._get_count_args(
+            query=query,
+            history_date=history_date,
+            history_days_ago=history_days_ago,
+            history_exact=history_exact,
+            wiz_entries=wiz_entries,
         )
 
         value = None
 
         while value is None:
-            value = self._count(
-                filter=query,
-                history_date=history_date,
-                use_cache_entry=use_cache_entry,
-            ).value
+            value = self._count(use_cache_entry=use_cache_entry, **count_args).value
             use_cache_entry = True
 
         return value
 
+    def _get_count_args(
+        self,
+        query: Optional[str] = None,
+        history_date: Optional[Union[str, datetime.timedelta, datetime.datetime]] = None,
+        history_days_ago: Optional[int] = None,
+        history_exact: bool = False,
+        wiz_entries: Optional[Union[List[dict], List[str], dict, str]] = None,
+    ) -> dict:
+        """Parse the arguments for :meth:`count` into arguments for :meth:`_count`."""
+        wiz_parsed = self.get_wiz_entries(wiz_entries=wiz_entries)
+
+        if isinstance(wiz_parsed, dict) and wiz_parsed.get("query"):
+            query = wiz_parsed["query"]
+
+        history_date = self.get_history_date(
+            date=history_date, days_ago=history_days_ago, exact=history_exact
+        )
+        return {"filter": query, "history_date": history_date}
+
     def count_by_saved_query(self, name: str, **kwargs) -> int:
         """Get the count of assets for a query defined in a saved query.
 
@@ -174,6 +204,10 @@ class AssetMixin(ModelMixins):
             >>> entries=[{'type': 'simple', 'value': 'name equals test'}]
             >>> assets = apiobj.get(wiz_entries=entries)
 
+            Get all assets using 4 threads to fetch pages in parallel
+
+            >>> assets = apiobj.get(workers=4)
+
         See Also:
             This method is used by all other get* methods under the hood and their kwargs are
             passed thru to this method and passed to :meth:`get_generator` which are then passed
@@ -197,6 +231,9 @@ class AssetMixin(ModelMixins):
             If ``export`` equals ``xlsx``, see
             :meth:`axonius_api_client.api.asset_callbacks.base_xlsx.Xlsx.args_map`.
 
+            If ``export`` equals ``tee`` or is a list of exports, see
+            :meth:`axonius_api_client.api.asset_callbacks.base_tee.Tee.args_map`.
+
         Args:
             generator: return an iterator for assets that will yield rows as they are fetched
             **kwargs: passed to :meth:`get_generator`
@@ -259,7 +296,7 @@ class AssetMixin(ModelMixins):
         page_size: int = MAX_PAGE_SIZE,
         page_start: int = 0,
         page_sleep: int = 0,
-        export: str = DEFAULT_CALLBACKS_CLS,
+        export: Union[str, List[Union[str, dict]]] = DEFAULT_CALLBACKS_CLS,
         include_notes: bool = False,
         include_details: bool = False,
         sort_field: Optional[str] = None,
@@ -268,6 +305,14 @@ class AssetMixin(ModelMixins):
         history_days_ago: Optional[int] = None,
         history_exact: bool = False,
         wiz_entries: Optional[Union[List[dict], List[str], dict, str]] = None,
+        prefetch_pages: int = 0,
+        workers: int = 1,
+        workers_ordered: bool = True,
+        checkpoint_file: Optional[PathLike] = None,
+        resume_from: Optional[PathLike] = None,
+        page_size_adaptive: bool = False,
+        page_size_target: float = PAGE_SIZE_ADAPTIVE_TARGET,
+        page_size_min: int = PAGE_SIZE_ADAPTIVE_MIN,
         **kwargs,
     ) -> Generator[dict, None, None]:
         """Get assets from a query.
@@ -288,7 +333,8 @@ class AssetMixin(ModelMixins):
             page_size: fetch N rows per page
             page_start: start at page N
             page_sleep: sleep for N seconds between each page fetch
-            export: export assets using a callback method
+            export: export assets using a callback method, or a list of exports to write
+                from one fetch (see :obj:`axonius_api_client.api.asset_callbacks.base_tee.Tee`)
             include_notes: include any defined notes for each adapter
             include_details: include details fields showing the adapter source of agg values
             sort_field: sort the returned assets on a given field
@@ -297,8 +343,114 @@ class AssetMixin(ModelMixins):
             history_days_ago: return assets for a history date N days ago
             history_exact: Use the closest match for history_date and history_days_ago
             wiz_entries: wizard expressions to create query from
+            prefetch_pages: fetch up to N pages in a background thread while the current page
+                is being processed (0 = fetch each page only after the previous page is done)
+            workers: fetch pages by offset using N threads, each with its own HTTP session
+                (1 = fetch pages serially using a cursor, ignores prefetch_pages and page_sleep
+                if more than 1, sorts on internal_axon_id if sort_field is not supplied)
+            workers_ordered: if workers is more than 1, yield pages in the order of their offsets
+                instead of the order they are received
+            checkpoint_file: save the paging state to this file after each page is processed
+            resume_from: checkpoint file saved by a previous fetch to resume fetching from
+            page_size_adaptive: change the page size after each page to aim for
+                page_size_target seconds per page, using page_size as the largest page size
+            page_size_target: if page_size_adaptive, seconds that each page fetch should take
+            page_size_min: if page_size_adaptive, smallest page size to use
             **kwargs: passed thru to the asset callback defined in ``export``
         """
+        store, state, callbacks = self._get_setup(
+            query=query,
+            fields=fields,
+            fields_manual=fields_manual,
+            fields_regex=fields_regex,
+            fields_regex_root_only=fields_regex_root_only,
+            fields_fuzzy=fields_fuzzy,
+            fields_default=fields_default,
+            fields_root=fields_root,
+            fields_error=fields_error,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            row_start=row_start,
+            page_size=page_size,
+            page_start=page_start,
+            page_sleep=page_sleep,
+            export=export,
+            include_notes=include_notes,
+            include_details=include_details,
+            sort_field=sort_field,
+            sort_descending=sort_descending,
+            history_date=history_date,
+            history_days_ago=history_days_ago,
+            history_exact=history_exact,
+            wiz_entries=wiz_entries,
+            prefetch_pages=prefetch_pages,
+            workers=workers,
+            workers_ordered=workers_ordered,
+            checkpoint_file=checkpoint_file,
+            resume_from=resume_from,
+            page_size_adaptive=page_size_adaptive,
+            page_size_target=page_size_target,
+            page_size_min=page_size_min,
+            **kwargs,
+        )
+        pages = self._get_pages(store=store, state=state)
+
+        try:
+            for start_dt, page in pages:
+                try:
+                    yield from self._process_page(
+                        page=page, start_dt=start_dt, store=store, state=state, callbacks=callbacks
+                    )
+                except StopFetch as exc:
+                    self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
+                    break
+        finally:
+            pages.close()
+
+        yield from callbacks.process_pending()
+        self._get_finish(store=store, state=state, callbacks=callbacks)
+
+    def _get_setup(
+        self,
+        query: Optional[str] = None,
+        fields: Optional[Union[List[str], str]] = None,
+        fields_manual: Optional[Union[List[str], str]] = None,
+        fields_regex: Optional[Union[List[str], str]] = None,
+        fields_regex_root_only: bool = True,
+        fields_fuzzy: Optional[Union[List[str], str]] = None,
+        fields_default: bool = True,
+        fields_root: Optional[str] = None,
+        fields_error: bool = True,
+        max_rows: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        row_start: int = 0,
+        page_size: int = MAX_PAGE_SIZE,
+        page_start: int = 0,
+        page_sleep: int = 0,
+        export: Union[str, List[Union[str, dict]]] = DEFAULT_CALLBACKS_CLS,
+        include_notes: bool = False,
+        include_details: bool = False,
+        sort_field: Optional[str] = None,
+        sort_descending: bool = False,
+        history_date: Optional[Union[str, datetime.timedelta, datetime.datetime]] = None,
+        history_days_ago: Optional[int] = None,
+        history_exact: bool = False,
+        wiz_entries: Optional[Union[List[dict], List[str], dict, str]] = None,
+        prefetch_pages: int = 0,
+        workers: int = 1,
+        workers_ordered: bool = True,
+        checkpoint_file: Optional[PathLike] = None,
+        resume_from: Optional[PathLike] = None,
+        page_size_adaptive: bool = False,
+        page_size_target: float = PAGE_SIZE_ADAPTIVE_TARGET,
+        page_size_min: int = PAGE_SIZE_ADAPTIVE_MIN,
+        **kwargs,
+    ) -> Tuple[dict, dict, Base]:
+        """Validate the arguments for :meth:`get_generator` and start the callbacks.
+
+        Returns:
+            Tuple[dict, dict, Base]: store of arguments, paging state, and started callbacks object
+        """
         wiz_parsed: Optional[dict] = self.get_wiz_entries(wiz_entries=wiz_entries)
 
         if isinstance(wiz_parsed, dict) and wiz_parsed.get("query"):
@@ -319,11 +471,20 @@ class AssetMixin(ModelMixins):
             field=sort_field, descending=sort_descending
         )
 
+        if workers > 1 and not sort_field_parsed:
+            # offsets only point to the same rows from page to page if the sort is stable
+            sort_field_parsed = self.FIELD_AXON_ID
+
         history_date_parsed: Optional[str] = self.get_history_date(
             date=history_date, days_ago=history_days_ago, exact=history_exact
         )
 
-        initial_count: int = self.count(query=query, history_date=history_date)
+        initial_count: int = self.count(
+            query=query,
+            history_date=history_date,
+            history_days_ago=history_days_ago,
+            history_exact=history_exact,
+        )
 
         file_date: str = dt_now_file()
         export_templates: dict = {
@@ -359,6 +520,14 @@ class AssetMixin(ModelMixins):
             "row_start": row_start,
             "initial_count": initial_count,
             "export_templates": export_templates,
+            "prefetch_pages": prefetch_pages,
+            "workers": workers,
+            "workers_ordered": workers_ordered,
+            "checkpoint_file": checkpoint_file,
+            "resume_from": resume_from,
+            "page_size_adaptive": page_size_adaptive,
+            "page_size_target": page_size_target,
+            "page_size_min": page_size_min,
         }
 
         state = json_api.assets.AssetsPage.create_state(
@@ -374,51 +543,144 @@ class AssetMixin(ModelMixins):
         callbacks_cls = get_callbacks_cls(export=export)
         callbacks = callbacks_cls(apiobj=self, getargs=kwargs, state=state, store=store)
 
+        if checkpoint_file or resume_from:
+            if not callbacks.resumable:
+                raise ApiError(f"Export {export!r} does not support checkpoint_file or resume_from")
+            if workers > 1:
+                raise ApiError("Can not use checkpoint_file or resume_from when workers > 1")
+
+        if page_size_adaptive and workers > 1:
+            raise ApiError("Can not use page_size_adaptive when workers > 1")
+
+        if resume_from:
+            store["resume"] = load_checkpoint(path=resume_from, store=store, callbacks=callbacks)
+            state.update(store["resume"]["state"])
+            # cursors expire, so start a new cursor at the offset of the checkpoint
+            state["page_cursor"] = None
+            self.LOG.info(f"RESUMING FETCH from checkpoint {resume_from} state={json_dump(state)}")
+
         self.LAST_CALLBACKS = callbacks
         callbacks.start()
 
         self.LOG.info(f"STARTING FETCH store={json_dump(store)}")
         self.LOG.debug(f"STARTING FETCH state={json_dump(state)}")
 
-        while not state["stop_fetch"]:
-            try:
-                start_dt = dt_now()
-
-                page = self._get(
-                    include_details=store["include_details"],
-                    include_notes=store["include_notes"],
-                    sort=store["sort_field_parsed"],
-                    history_date=store["history_date_parsed"],
-                    filter=store["query"],
-                    fields=store["fields_parsed"],
-                    cursor_id=state["page_cursor"],
-                    offset=state["rows_offset"],
-                    limit=state["page_size"],
-                    always_cached_query=False,
-                    use_cache_entry=False,
-                    get_metadata=True,
-                    use_cursor=True,
-                )
-
-                state = page.process_page(state=state, start_dt=start_dt, apiobj=self)
-
-                for row in page.assets:
-                    state = page.start_row(state=state, apiobj=self, row=row)
-                    yield from listify(obj=callbacks.process_row(row=row))
-                    state = page.process_row(state=state, apiobj=self, row=row)
-
-                state = page.process_loop(state=state, apiobj=self)
-
-                time.sleep(state["page_sleep"])
-            except StopFetch as exc:
-                self.LOG.debug(f"Received {type(exc)}: {exc.reason}")
-                break
+        return store, state, callbacks
+
+    def _process_page(
+        self,
+        page: json_api.assets.AssetsPage,
+        start_dt: datetime.datetime,
+        store: dict,
+        state: dict,
+        callbacks: Base,
+    ) -> Generator[dict, None, None]:
+        """Process the rows of a page of assets through the callbacks and update the state.
 
+        Raises:
+            StopFetch: if the state of the page says to stop fetching
+        """
+        page.process_page(state=state, start_dt=start_dt, apiobj=self)
+
+        rows = page.start_rows(state=state, apiobj=self)
+        yield from listify(obj=callbacks.process_page(rows=rows))
+        page.process_rows(state=state, apiobj=self, rows=rows)
+        callbacks.check_stop()
+
+        if store["checkpoint_file"]:
+            save_checkpoint(
+                path=store["checkpoint_file"], store=store, state=state, callbacks=callbacks
+            )
+
+        page.process_loop(state=state, apiobj=self)
+
+    def _get_finish(self, store: dict, state: dict, callbacks: Base):
+        """Stop the callbacks after all pages have been processed."""
         self.LOG.info(f"FINISHED FETCH store={json_dump(store)}")
         self.LOG.debug(f"FINISHED FETCH state={json_dump(state)}")
 
         callbacks.stop()
 
+    def _get_page(self, store: dict, **kwargs) -> json_api.assets.AssetsPage:
+        """Fetch a single page of assets for the query in a store from :meth:`get_generator`."""
+        return self._get(**self._get_page_args(store=store, **kwargs))
+
+    def _get_page_args(self, store: dict, **kwargs) -> dict:
+        """Get the arguments for :meth:`_get` for the query in a store of :meth:`get_generator`."""
+        get_args = {
+            "include_details": store["include_details"],
+            "include_notes": store["include_notes"],
+            "sort": store["sort_field_parsed"],
+            "history_date": store["history_date_parsed"],
+            "filter": store["query"],
+            "fields": store["fields_parsed"],
+            "always_cached_query": False,
+            "use_cache_entry": False,
+            "get_metadata": True,
+            "use_cursor": True,
+        }
+        get_args.update(kwargs)
+        return get_args
+
+    def _get_pages(
+        self, store: dict, state: dict
+    ) -> Union[Generator, PagePrefetcher, ParallelPageFetcher]:
+        """Get an iterable that yields a tuple of (start_dt, page) for each page to process.
+
+        Notes:
+            If ``workers`` in store is more than 1, pages will be fetched using offsets by
+            :obj:`axonius_api_client.api.assets.paging.ParallelPageFetcher`.
+
+            If ``prefetch_pages`` in store is more than 0, pages will be fetched in a background
+            thread by :obj:`axonius_api_client.api.assets.paging.PagePrefetcher`.
+
+            Otherwise each page will be fetched only after the previous page has been processed.
+
+            If ``page_size_adaptive`` in store is True, the page size will be changed after each
+            page is fetched by :obj:`axonius_api_client.api.assets.paging.AdaptivePageSize`.
+        """
+        workers = store.get("workers") or 1
+        prefetch_pages = store.get("prefetch_pages") or 0
+
+        if workers > 1:
+            return ParallelPageFetcher(
+                fetch=functools.partial(self._get_page, store=store, use_cursor=False),
+                http=self.auth.http,
+                state=state,
+                total=store["initial_count"],
+                workers=workers,
+                ordered=store.get("workers_ordered", True),
+                log=self.LOG,
+            )
+
+        fetch = functools.partial(self._get_page, store=store)
+
+        if store.get("page_size_adaptive"):
+            fetch = AdaptivePageSize(
+                fetch=fetch,
+                state=state,
+                target=store["page_size_target"],
+                min_size=store["page_size_min"],
+                max_size=state["page_size"],
+                log=self.LOG,
+            )
+
+        if prefetch_pages > 0:
+            return PagePrefetcher(fetch=fetch, state=state, size=prefetch_pages, log=self.LOG)
+        return self._get_pages_serial(fetch=fetch, state=state)
+
+    def _get_pages_serial(self, fetch: Callable, state: dict) -> Generator:
+        """Fetch each page using the cursor from the state of the previous page."""
+        while not state["stop_fetch"]:
+            start_dt = dt_now()
+            page = fetch(
+                cursor_id=state["page_cursor"],
+                offset=state["rows_offset"],
+                limit=state["page_size"],
+            )
+            yield start_dt, page
+            time.sleep(state["page_sleep"])
+
     def get_by_saved_query(self, name: str, **kwargs) -> GEN_TYPE:
         """Get assets that would be returned by a saved query.
 
@@ -644,7 +906,6 @@ class AssetMixin(ModelMixins):
     def _init(self, **kwargs):
         """Post init method for subclasses to use for extra setup."""
         from ..adapters import Adapters
-        from ..asset_callbacks import Base
         from ..system import Instances
         from .fields import Fields
         from .labels import Labels
@@ -703,6 +964,7 @@ class AssetMixin(ModelMixins):
         fields: Optional[dict] = None,
         offset: int = 0,
         limit: int = PAGE_SIZE,
+        http: Optional[Http] = None,
     ) -> json_api.assets.AssetsPage:
         """Private API method to get a page of assets.
 
@@ -725,9 +987,51 @@ class AssetMixin(ModelMixins):
             fields (Optional[dict], optional): CSV or list of fields to include in return
             offset (int, optional): Description
             limit (int, optional): Description
+            http (Optional[Http], optional): HTTP object to use instead of the one from auth
 
         """
-        asset_type = self.ASSET_TYPE
+        request_obj = self._get_request(
+            always_cached_query=always_cached_query,
+            use_cache_entry=use_cache_entry,
+            include_details=include_details,
+            include_notes=include_notes,
+            get_metadata=get_metadata,
+            use_cursor=use_cursor,
+            sort_descending=sort_descending,
+            history_date=history_date,
+            filter=filter,
+            cursor_id=cursor_id,
+            sort=sort,
+            excluded_adapters=excluded_adapters,
+            field_filters=field_filters,
+            fields=fields,
+            offset=offset,
+            limit=limit,
+        )
+        return ApiEndpoints.assets.get.perform_request(
+            http=http or self.auth.http, request_obj=request_obj, asset_type=self.ASSET_TYPE
+        )
+
+    def _get_request(
+        self,
+        always_cached_query: bool = False,
+        use_cache_entry: bool = False,
+        include_details: bool = False,
+        include_notes: bool = False,
+        get_metadata: bool = True,
+        use_cursor: bool = True,
+        sort_descending: bool = False,
+        history_date: Optional[str] = None,
+        filter: Optional[str] = None,
+        cursor_id: Optional[str] = None,
+        sort: Optional[str] = None,
+        excluded_adapters: Optional[dict] = None,
+        field_filters: Optional[dict] = None,
+        fields: Optional[dict] = None,
+        offset: int = 0,
+        limit: int = PAGE_SIZE,
+    ) -> json_api.assets.AssetRequest:
+        """Build the request object used by :meth:`_get` to get a page of assets."""
         api_endpoint = ApiEndpoints.assets.get
         request_obj = api_endpoint.load_request(
             always_cached_query=always_cached_query,
@@ -746,9 +1050,7 @@ class AssetMixin(ModelMixins):
         request_obj.set_page(limit=limit, offset=offset)
         self.LAST_GET_REQUEST_OBJ = request_obj
         self.LAST_GET = request_obj.to_dict()
-        return api_endpoint.perform_request(
-            http=self.auth.http, request_obj=request_obj, asset_type=asset_type
-        )
+        return request_obj
 
     def _get_by_id(self, id: str) -> json_api.assets.AssetById:
         """Private API method to get the full metadata of all adapters for a single asset.
@@ -782,6 +1084,7 @@ class AssetMixin(ModelMixins):
         request_obj = api_endpoint.load_request(
             use_cache_entry=use_cache_entry,
             filter=filter,
+            history=history_date,
         )
         return api_endpoint.perform_request(
             http=self.auth.http, request_obj=request_obj, asset_type=asset_type
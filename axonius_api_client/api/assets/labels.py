@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 """API for working with tags for assets."""
-from typing import List, Union
+from typing import Callable, List, Optional, Union
 
-from ...tools import listify
+from ...constants.api import TAGS_CHUNK_SIZE
+from ...exceptions import ApiError, ResponseNotOk
+from ...http import Http
+from ...tools import grouper, listify
 from .. import json_api
 from ..api_endpoints import ApiEndpoints
 from ..mixins import ChildMixins
@@ -20,6 +23,8 @@ class Labels(ChildMixins):
         * Get all known tags: :meth:`get`
         * Add tags to assets: :meth:`add`
         * Remove tags from assets: :meth:`remove`
+        * Add tags to assets that match a query: :meth:`add_by_query`
+        * Remove tags from assets that match a query: :meth:`remove_by_query`
 
     See Also:
         * Device assets :obj:`axonius_api_client.api.assets.devices.Devices`
@@ -39,7 +44,13 @@ class Labels(ChildMixins):
         """
         return [x.value for x in self._get()]
 
-    def add(self, rows: Union[List[dict], str], labels: List[str]) -> int:
+    def add(
+        self,
+        rows: Union[List[dict], str],
+        labels: List[str],
+        chunk_size: Optional[int] = None,
+        http: Optional[Http] = None,
+    ) -> int:
         """Add tags to assets.
 
         Examples:
@@ -55,21 +66,22 @@ class Labels(ChildMixins):
         Args:
             rows: list of internal_axon_id strs or list of assets returned from a get method
             labels: tags to add
+            chunk_size: number of assets to tag in each request, 0 or None (the default) to tag
+                all assets in one request
+            http: HTTP client to use instead of the one from the parent API object
         """
-        ids = self._get_ids(rows=rows)
-        return self._add(labels=labels, ids=ids).value
-
-        # processed = 0
-
-        # # only do 100 labels at a time, more seems to break API
-        # for group in grouper(ids, 100):
-        #     group = [x for x in group if x is not None]
-        #     response = self._add(labels=labels, ids=group)
-        #     processed += response
-
-        # return processed
-
-    def remove(self, rows: List[dict], labels: List[str]) -> int:
+        processed = 0
+        for ids in self._get_chunks(rows=rows, chunk_size=chunk_size):
+            processed += self._add(labels=labels, ids=ids, http=http).value
+        return processed
+
+    def remove(
+        self,
+        rows: Union[List[dict], str],
+        labels: List[str],
+        chunk_size: Optional[int] = None,
+        http: Optional[Http] = None,
+    ) -> int:
         """Remove tags from assets.
 
         Examples:
@@ -85,9 +97,146 @@ class Labels(ChildMixins):
         Args:
             rows: list of internal_axon_id strs or list of assets returned from a get method
             labels: tags to remove
+            chunk_size: number of assets to un-tag in each request, 0 or None (the default) to
+                un-tag all assets in one request
+            http: HTTP client to use instead of the one from the parent API object
         """
-        ids = self._get_ids(rows=rows)
-        return self._remove(labels=labels, ids=ids).value
+        processed = 0
+        for ids in self._get_chunks(rows=rows, chunk_size=chunk_size):
+            processed += self._remove(labels=labels, ids=ids, http=http).value
+        return processed
+
+    def add_by_query(
+        self,
+        query: str,
+        labels: List[str],
+        local: bool = False,
+        chunk_size: Optional[int] = TAGS_CHUNK_SIZE,
+        **kwargs,
+    ) -> int:
+        """Add tags to all assets that match a query.
+
+        Examples:
+            Add tags to all assets that match a query in a single request
+
+            >>> query = '(specific_data.data.hostname == regex("test", "i"))'
+            >>> apiobj.labels.add_by_query(query=query, labels=['api tag 1', 'api tag 2'])
+            12
+
+        Notes:
+            The query is sent as the filter of the request, so no assets have to be fetched.
+            If the filter is rejected or ``local`` is True, the internal_axon_id of each asset
+            that matches the query is fetched and tags are added for every ``chunk_size``
+            assets, so only one chunk of ids is held in memory.
+
+        Args:
+            query: query of the assets to add tags to
+            labels: tags to add
+            local: fetch the assets that match query and add tags to them by internal_axon_id
+            chunk_size: if fetching assets, number of assets to tag in each request
+            **kwargs: passed to
+                :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get_generator`
+                if fetching assets
+        """
+        return self._modify_by_query(
+            method=self._add,
+            query=query,
+            labels=labels,
+            local=local,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    def remove_by_query(
+        self,
+        query: str,
+        labels: List[str],
+        local: bool = False,
+        chunk_size: Optional[int] = TAGS_CHUNK_SIZE,
+        **kwargs,
+    ) -> int:
+        """Remove tags from all assets that match a query.
+
+        Examples:
+            Remove tags from all assets that match a query in a single request
+
+            >>> query = '(labels == "api tag 1")'
+            >>> apiobj.labels.remove_by_query(query=query, labels=['api tag 1'])
+            12
+
+        Notes:
+            See :meth:`add_by_query` for how the assets are selected.
+
+        Args:
+            query: query of the assets to remove tags from
+            labels: tags to remove
+            local: fetch the assets that match query and remove tags from them by internal_axon_id
+            chunk_size: if fetching assets, number of assets to un-tag in each request
+            **kwargs: passed to
+                :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get_generator`
+                if fetching assets
+        """
+        return self._modify_by_query(
+            method=self._remove,
+            query=query,
+            labels=labels,
+            local=local,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    def _modify_by_query(
+        self,
+        method: Callable,
+        query: str,
+        labels: List[str],
+        local: bool = False,
+        chunk_size: Optional[int] = TAGS_CHUNK_SIZE,
+        **kwargs,
+    ) -> int:
+        """Add or remove tags for all assets that match a query.
+
+        Args:
+            method: :meth:`_add` or :meth:`_remove`
+            query: query of the assets to modify tags for
+            labels: tags to add or remove
+            local: fetch the assets that match query and modify tags by internal_axon_id
+            chunk_size: if fetching assets, number of assets to modify tags for in each request
+            **kwargs: passed to
+                :meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get_generator`
+                if fetching assets
+
+        Raises:
+            :exc:`ApiError`: if query is empty, since that would select all assets
+        """
+        if not isinstance(query, str) or not query.strip():
+            raise ApiError(
+                f"Must supply a query to select the assets to modify tags for: {query!r}"
+            )
+
+        if not local:
+            try:
+                return method(labels=labels, ids=[], query=query).value
+            except ResponseNotOk as exc:
+                self.LOG.warning(
+                    f"Tag request using query as filter failed, fetching assets: {exc}"
+                )
+
+        key = self.parent.FIELD_AXON_ID
+        processed = 0
+        ids = []
+
+        kwargs.setdefault("fields_default", False)
+        kwargs.setdefault("fields", key)
+        for row in self.parent.get_generator(query=query, **kwargs):
+            ids.append(row[key])
+            if chunk_size and len(ids) >= chunk_size:
+                processed += method(labels=labels, ids=ids).value
+                ids = []
+
+        if ids:
+            processed += method(labels=labels, ids=ids).value
+        return processed
 
     def _get_ids(self, rows: Union[List[dict], str]) -> List[str]:
         """Get the internal_axon_id from a list of assets.
@@ -97,19 +246,45 @@ class Labels(ChildMixins):
         """
         return [x["internal_axon_id"] if isinstance(x, dict) else x for x in listify(rows)]
 
-    def _add(self, labels: List[str], ids: List[str]) -> json_api.generic.IntValue:
+    def _get_chunks(
+        self, rows: Union[List[dict], str], chunk_size: Optional[int] = None
+    ) -> List[List[str]]:
+        """Split the internal_axon_id from a list of assets into chunks.
+
+        Args:
+            rows: list of internal_axon_id strs or list of assets returned from a get method
+            chunk_size: number of ids in each chunk, 0 or None for one chunk
+        """
+        ids = self._get_ids(rows=rows)
+        if not chunk_size or len(ids) <= chunk_size:
+            return [ids]
+        return [[x for x in group if x is not None] for group in grouper(ids, chunk_size)]
+
+    def _add(
+        self,
+        labels: List[str],
+        ids: List[str],
+        http: Optional[Http] = None,
+        query: Optional[str] = None,
+    ) -> json_api.generic.IntValue:
         """Direct API method to add labels/tags to assets.
 
         Args:
             labels: tags to process
-            ids: internal_axon_id of assets to add tags to
+            ids: internal_axon_id of assets to add tags to, or to leave out if query supplied
+            http: HTTP client to use instead of the one from the parent API object
+            query: add tags to all assets that match this query instead of ids
         """
         api_endpoint = ApiEndpoints.assets.tags_add
 
-        entities = {"ids": listify(ids), "include": True}
-        request_obj = api_endpoint.load_request(entities=entities, labels=listify(labels))
+        entities = {"ids": listify(ids), "include": not query}
+        request_obj = api_endpoint.load_request(
+            entities=entities, labels=listify(labels), filter=query or None
+        )
         return api_endpoint.perform_request(
-            http=self.auth.http, request_obj=request_obj, asset_type=self.parent.ASSET_TYPE
+            http=http or self.auth.http,
+            request_obj=request_obj,
+            asset_type=self.parent.ASSET_TYPE,
         )
 
     def _get(self) -> List[json_api.generic.StrValue]:
@@ -117,17 +292,29 @@ class Labels(ChildMixins):
         api_endpoint = ApiEndpoints.assets.tags_get
         return api_endpoint.perform_request(http=self.auth.http, asset_type=self.parent.ASSET_TYPE)
 
-    def _remove(self, labels: List[str], ids: List[str]) -> json_api.generic.IntValue:
+    def _remove(
+        self,
+        labels: List[str],
+        ids: List[str],
+        http: Optional[Http] = None,
+        query: Optional[str] = None,
+    ) -> json_api.generic.IntValue:
         """Direct API method to remove labels/tags from assets.
 
         Args:
             labels: tags to process
-            ids: internal_axon_id of assets to remove tags from
+            ids: internal_axon_id of assets to remove tags from, or to leave out if query supplied
+            http: HTTP client to use instead of the one from the parent API object
+            query: remove tags from all assets that match this query instead of ids
         """
         api_endpoint = ApiEndpoints.assets.tags_remove
 
-        entities = {"ids": listify(ids), "include": True}
-        request_obj = api_endpoint.load_request(entities=entities, labels=listify(labels))
+        entities = {"ids": listify(ids), "include": not query}
+        request_obj = api_endpoint.load_request(
+            entities=entities, labels=listify(labels), filter=query or None
+        )
         return api_endpoint.perform_request(
-            http=self.auth.http, request_obj=request_obj, asset_type=self.parent.ASSET_TYPE
+            http=http or self.auth.http,
+            request_obj=request_obj,
+            asset_type=self.parent.ASSET_TYPE,
         )
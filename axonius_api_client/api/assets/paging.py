@@ -0,0 +1,579 @@
+# -*- coding: utf-8 -*-
+"""Helpers for fetching pages of assets."""
+import collections
+import concurrent.futures
+import datetime
+import hashlib
+import logging
+import os
+import queue
+import threading
+from typing import Callable, Generator, List, Optional, Tuple
+
+import requests
+
+from ...constants.api import (
+    MAX_PAGE_SIZE,
+    PAGE_SIZE_ADAPTIVE_MAX_BYTES,
+    PAGE_SIZE_ADAPTIVE_MIN,
+    PAGE_SIZE_ADAPTIVE_TARGET,
+)
+from ...exceptions import ApiError, ResponseError
+from ...http import Http
+from ...tools import PathLike, dt_now, dt_sec_ago, get_path, json_dump, path_read
+
+PAGE_TYPE = Tuple[datetime.datetime, object]
+
+CHECKPOINT_STATE_KEYS: List[str] = [
+    "page_cursor",
+    "page_loop",
+    "page_number",
+    "rows_fetched_total",
+    "rows_offset",
+    "rows_processed_total",
+]
+"""keys of the paging state to save in a checkpoint and restore when resuming."""
+
+
+def get_fields_hash(fields: List[str]) -> str:
+    """Get a hash of the fields being fetched to validate a checkpoint is resumed correctly."""
+    return hashlib.sha256(json_dump(list(fields or []), indent=None).encode()).hexdigest()
+
+
+def save_checkpoint(path: PathLike, store: dict, state: dict, callbacks) -> dict:
+    """Write the paging state of a fetch to a checkpoint file.
+
+    Notes:
+        The checkpoint is written to a temporary file which is then renamed over the
+        checkpoint file, so a fetch that dies mid-write will leave the previous checkpoint.
+
+    Args:
+        path: path of checkpoint file to write
+        store: store tracker of assets get method
+        state: state tracker of assets get method
+        callbacks: callbacks object used by assets get method
+    """
+    path = get_path(obj=path)
+    data = {
+        "asset_type": callbacks.APIOBJ.ASSET_TYPE,
+        "export": callbacks.CB_NAME,
+        "query": store["query"],
+        "fields_hash": get_fields_hash(store["fields_parsed"]),
+        "saved": dt_now().isoformat(),
+        "state": {k: state[k] for k in CHECKPOINT_STATE_KEYS},
+        "callbacks": callbacks.get_checkpoint(),
+    }
+
+    if not path.parent.is_dir():
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    tmp_path = path.parent / f"{path.name}.tmp"
+    tmp_path.write_text(json_dump(data))
+    os.replace(str(tmp_path), str(path))
+    return data
+
+
+def load_checkpoint(path: PathLike, store: dict, callbacks) -> dict:
+    """Load a checkpoint file and check that it can be used to resume a fetch.
+
+    Args:
+        path: path of checkpoint file to read
+        store: store tracker of assets get method that will resume the fetch
+        callbacks: callbacks object used by assets get method that will resume the fetch
+
+    Raises:
+        :exc:`ApiError`: if the query, fields, asset type, or export of the checkpoint do
+            not match those of the fetch being resumed
+    """
+    path, data = path_read(obj=path, is_json=True)
+    checks = {
+        "asset_type": callbacks.APIOBJ.ASSET_TYPE,
+        "export": callbacks.CB_NAME,
+        "query": store["query"],
+        "fields_hash": get_fields_hash(store["fields_parsed"]),
+    }
+
+    for key, value in checks.items():
+        if data.get(key) != value:
+            raise ApiError(
+                f"Unable to resume from checkpoint {str(path)!r}, {key} of checkpoint "
+                f"{data.get(key)!r} does not match {key} of this fetch {value!r}"
+            )
+    return data
+
+
+class PagePrefetcher:
+    """Fetch pages of assets in a background thread while the current page is processed.
+
+    Notes:
+        The worker follows the cursor returned by each page, so it never has to wait for the
+        rows of a page to be processed before requesting the next page. At most ``size``
+        fetched pages are held in memory at any given time.
+    """
+
+    DONE: object = object()
+    """sentinel put on the queue by the worker when there are no more pages to fetch."""
+
+    WAIT: float = 0.1
+    """seconds to block on the queue before checking if a stop was requested."""
+
+    def __init__(
+        self,
+        fetch: Callable,
+        state: dict,
+        size: int = 1,
+        log: Optional[logging.Logger] = None,
+    ):
+        """Fetch pages of assets in a background thread.
+
+        Args:
+            fetch: callable that takes cursor_id, offset, and limit and returns a page
+            state: state tracker of assets get method that created this object
+            size: maximum number of fetched pages to hold in the queue
+            log: logger to use
+        """
+        self.fetch: Callable = fetch
+        self.state: dict = state
+        self.size: int = max(1, size)
+        self.log: logging.Logger = log or logging.getLogger(__name__)
+        self.queue: queue.Queue = queue.Queue(maxsize=self.size)
+        self.stop_event: threading.Event = threading.Event()
+        self.thread: threading.Thread = threading.Thread(
+            target=self._run, name=f"{self.__class__.__name__}", daemon=True
+        )
+        self.cursor: Optional[str] = state["page_cursor"]
+        self.offset: int = state["rows_offset"]
+        self.pages_fetched: int = 0
+        self.rows_fetched: int = 0
+
+    def __iter__(self) -> Generator[PAGE_TYPE, None, None]:
+        """Yield each page fetched by the worker as a tuple of (start_dt, page).
+
+        Notes:
+            start_dt is shifted so that the time between start_dt and now is the time the
+            worker spent fetching the page, not the time the page spent waiting in the queue.
+        """
+        if not self.thread.is_alive():
+            self.log.debug(f"Starting page prefetch worker with queue size {self.size}")
+            self.thread.start()
+
+        while True:
+            item = self.queue.get()
+            if item is self.DONE:
+                return
+
+            took, page, exc = item
+            if exc is not None:
+                raise exc
+
+            yield dt_now() - took, page
+
+    def close(self):
+        """Stop the worker and discard any pages that have not been processed."""
+        self.stop_event.set()
+
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+        if self.thread.is_alive():
+            self.thread.join(timeout=self.WAIT * 10)
+        self.log.debug(
+            f"Stopped page prefetch worker after {self.pages_fetched} pages "
+            f"and {self.rows_fetched} rows"
+        )
+
+    def _put(self, item) -> bool:
+        """Put an item on the queue, giving up if a stop is requested while the queue is full."""
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=self.WAIT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _is_done(self, page) -> bool:
+        """Check if the worker has fetched all of the pages that will be needed."""
+        max_pages = self.state["max_pages"]
+        max_rows = self.state["max_rows"]
+
+        if not page.assets:
+            return True
+        if max_pages and self.pages_fetched >= max_pages:
+            return True
+        if max_rows and self.rows_fetched >= max_rows:
+            return True
+        return False
+
+    def _run(self):
+        """Fetch pages using the cursor from the previous page until done or stopped."""
+        while not self.stop_event.is_set():
+            start_dt = dt_now()
+            try:
+                page = self.fetch(
+                    cursor_id=self.cursor, offset=self.offset, limit=self.state["page_size"]
+                )
+            except Exception as exc:
+                self._put((dt_now() - start_dt, None, exc))
+                return
+
+            if not self._put((dt_now() - start_dt, page, None)):
+                return
+
+            self.pages_fetched += 1
+            self.rows_fetched += page.asset_count_page
+            self.cursor = page.cursor
+            self.offset += page.asset_count_page
+
+            if self._is_done(page=page):
+                break
+
+            if self.stop_event.wait(self.state["page_sleep"]):
+                return
+
+        self._put(self.DONE)
+
+
+class ParallelPageFetcher:
+    """Fetch pages of assets by offset using multiple threads.
+
+    Notes:
+        The first page is fetched before any other pages, and the offsets to fetch are
+        calculated from the total count of assets returned with it, so any assets added after
+        the fetch starts will not be returned. Each worker thread uses its own clone of
+        :obj:`axonius_api_client.http.Http`, and the clones are closed by :meth:`close`.
+
+        Offset paging does not use a cursor, so the rows must be sorted on a field that does
+        not change (:meth:`axonius_api_client.api.assets.asset_mixin.AssetMixin.get_generator`
+        sorts on ``internal_axon_id`` if no sort field is supplied). Even then, assets that are
+        added or removed while the fetch is running shift the rows between pages: rows that
+        move to a page that was already fetched are missed, and rows that move to a page not
+        fetched yet are returned twice. Duplicate rows are removed by ``internal_axon_id``, but
+        missed rows can not be detected, so :meth:`close` logs a warning if the number of rows
+        returned plus the number of duplicates does not match the number of rows expected.
+    """
+
+    ID_KEY: str = "internal_axon_id"
+    """key used to de-duplicate rows across pages."""
+
+    def __init__(
+        self,
+        fetch: Callable,
+        http: Http,
+        state: dict,
+        total: int,
+        workers: int = 2,
+        ordered: bool = True,
+        log: Optional[logging.Logger] = None,
+    ):
+        """Fetch pages of assets by offset using multiple threads.
+
+        Args:
+            fetch: callable that takes http, offset, and limit and returns a page
+            http: HTTP object to clone for each worker thread
+            state: state tracker of assets get method that created this object
+            total: total count of assets that the query will return
+            workers: number of threads to fetch pages with
+            ordered: yield pages in the order of their offsets instead of as they are received
+            log: logger to use
+        """
+        self.fetch: Callable = fetch
+        self.http: Http = http
+        self.state: dict = state
+        self.total: int = total or 0
+        self.workers: int = max(1, workers)
+        self.ordered: bool = ordered
+        self.log: logging.Logger = log or logging.getLogger(__name__)
+        self.offsets: List[int] = self.get_offsets()
+        self.https: queue.Queue = queue.Queue()
+        self.clones: int = 0
+        self.add_clones()
+        self.executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.pending: collections.deque = collections.deque()
+        self.seen_ids: set = set()
+        self.rows_duplicate: int = 0
+        self.rows_yielded: int = 0
+        self.pages_yielded: int = 0
+        self.finished: bool = False
+
+    def add_clones(self):
+        """Clone :attr:`http` until there is one clone for each worker that has a page to fetch."""
+        while self.clones < (min(self.workers, len(self.offsets)) or 1):
+            self.https.put(self.http.clone())
+            self.clones += 1
+
+    @property
+    def rows_expected(self) -> int:
+        """Get the number of rows that the pages at :attr:`offsets` should return."""
+        page_size = self.state["page_size"]
+        return sum(max(0, min(page_size, self.total - x)) for x in self.offsets)
+
+    def get_offsets(self) -> List[int]:
+        """Get the offset of each page to fetch, limited by max_rows and max_pages."""
+        page_size = self.state["page_size"]
+        max_pages = self.state["max_pages"]
+        max_rows = self.state["max_rows"]
+        start = self.state["rows_offset"]
+        stop = self.total
+
+        if max_rows:
+            stop = min(stop, start + max_rows)
+
+        offsets = list(range(start, stop, page_size))
+        return offsets[:max_pages] if max_pages else offsets
+
+    def __iter__(self) -> Generator[Tuple[datetime.datetime, object], None, None]:
+        """Yield each page that has rows as a tuple of (start_dt, page).
+
+        Notes:
+            Pages are numbered in the order that they are yielded, so that max_pages
+            is enforced the same way no matter which order the pages were received in.
+        """
+        self.log.debug(
+            f"Fetching {len(self.offsets)} pages of {self.state['page_size']} rows "
+            f"using {self.workers} workers (ordered={self.ordered})"
+        )
+        offsets = collections.deque(self.offsets)
+        first_number = (self.state["rows_offset"] // self.state["page_size"]) + 1
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix=self.__class__.__name__
+        )
+
+        if offsets:
+            self.pending.append(self.executor.submit(self._fetch, offsets.popleft()))
+            self.set_total(page=self.pending[0].result()[1])
+            offsets = collections.deque(self.offsets[1:])
+
+        while offsets or self.pending:
+            while offsets and len(self.pending) < self.workers * 2:
+                self.pending.append(self.executor.submit(self._fetch, offsets.popleft()))
+
+            took, page = self._next_result()
+            page.assets = self._dedupe(rows=page.assets)
+            if not page.assets:
+                continue
+
+            page.meta.setdefault("page", {})["number"] = first_number + self.pages_yielded
+            self.pages_yielded += 1
+            self.rows_yielded += page.asset_count_page
+            yield dt_now() - took, page
+
+        self.finished = True
+
+    def set_total(self, page: object):
+        """Calculate the offsets from the total count of assets returned with the first page.
+
+        Notes:
+            The total count passed to this object may not be for the same point in time (or
+            the same history date) as the pages, so the total of the first page is used.
+        """
+        total = page.asset_count_total
+        if total is None or total == self.total:
+            return
+
+        self.log.debug(f"Total count of assets changed from {self.total} to {total}")
+        self.total = total
+        self.offsets = self.get_offsets()
+        self.add_clones()
+
+    def close(self):
+        """Cancel pages not fetched yet, wait for pages being fetched, and close the clones."""
+        for future in self.pending:
+            future.cancel()
+        self.pending.clear()
+
+        if self.executor:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+        while True:
+            try:
+                self.https.get_nowait().close()
+            except queue.Empty:
+                break
+
+        self.log.debug(
+            f"Stopped parallel fetch after {self.pages_yielded} pages "
+            f"with {self.rows_duplicate} duplicate rows removed"
+        )
+
+        rows_received = self.rows_yielded + self.rows_duplicate
+        if self.finished and rows_received != self.rows_expected:
+            self.log.warning(
+                f"Parallel fetch expected {self.rows_expected} rows but received "
+                f"{rows_received} rows ({self.rows_duplicate} duplicates removed), "
+                "rows may have been missed if assets changed during the fetch"
+            )
+
+    def _next_result(self) -> Tuple[datetime.timedelta, object]:
+        """Wait for the next page, either the oldest one submitted or the first one done."""
+        if self.ordered:
+            future = self.pending.popleft()
+        else:
+            done, _ = concurrent.futures.wait(
+                self.pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            future = next(x for x in self.pending if x in done)
+            self.pending.remove(future)
+        return future.result()
+
+    def _fetch(self, offset: int) -> Tuple[datetime.timedelta, object]:
+        """Fetch a page at offset using an HTTP object that no other thread is using."""
+        http = self.https.get()
+        try:
+            start_dt = dt_now()
+            page = self.fetch(http=http, offset=offset, limit=self.state["page_size"])
+            return dt_now() - start_dt, page
+        finally:
+            self.https.put(http)
+
+    def _dedupe(self, rows: List[dict]) -> List[dict]:
+        """Remove rows that have already been returned by a previous page."""
+        ret = []
+        for row in rows:
+            row_id = row.get(self.ID_KEY)
+            if row_id is not None:
+                if row_id in self.seen_ids:
+                    self.rows_duplicate += 1
+                    continue
+                self.seen_ids.add(row_id)
+            ret.append(row)
+        return ret
+
+
+class AdaptivePageSize:
+    """Change the page size after each page is fetched to aim for a target fetch time.
+
+    Notes:
+        The size of the next page is calculated from the seconds per row and the bytes per row
+        of the last page, and can at most double from one page to the next. If fetching a page
+        fails with a 5xx response, a timeout, or a connection error, the page size is halved and
+        the same page is fetched again until the page size reaches the minimum.
+
+        Each page size used is recorded with the page that was fetched, and added to
+        ``state["page_sizes"]`` when that page is processed, so the state is only changed by
+        the thread processing pages even if pages are prefetched. Since the page number
+        returned by the REST API is based on the page size, pages are numbered in the order
+        they are fetched so that max_pages is still enforced.
+    """
+
+    BACKOFF_EXCS: tuple = (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+    """exceptions that will cause the page size to be halved and the page to be fetched again."""
+
+    def __init__(
+        self,
+        fetch: Callable,
+        state: dict,
+        target: float = PAGE_SIZE_ADAPTIVE_TARGET,
+        min_size: int = PAGE_SIZE_ADAPTIVE_MIN,
+        max_size: int = MAX_PAGE_SIZE,
+        max_bytes: int = PAGE_SIZE_ADAPTIVE_MAX_BYTES,
+        log: Optional[logging.Logger] = None,
+    ):
+        """Change the page size after each page is fetched to aim for a target fetch time.
+
+        Args:
+            fetch: callable that takes cursor_id, offset, and limit and returns a page
+            state: state tracker of assets get method that created this object
+            target: seconds that each page fetch should take
+            min_size: smallest page size to use
+            max_size: largest page size to use
+            max_bytes: largest response body in bytes to aim for (0 = no limit)
+            log: logger to use
+        """
+        self.fetch: Callable = fetch
+        self.state: dict = state
+        self.target: float = target
+        self.max_size: int = min(max_size or MAX_PAGE_SIZE, MAX_PAGE_SIZE)
+        if state["max_rows"]:
+            self.max_size = min(self.max_size, state["max_rows"])
+        self.min_size: int = max(1, min(min_size, self.max_size))
+        self.max_bytes: int = max_bytes
+        self.log: logging.Logger = log or logging.getLogger(__name__)
+
+        self.state["page_size"] = self.clamp(state["page_size"])
+        self.state.setdefault("page_sizes", [])
+        self.page_number: int = state["page_number"]
+        self.records: List[dict] = []
+
+    def __call__(self, cursor_id: Optional[str], offset: int, limit: Optional[int] = None):
+        """Fetch a page using the current page size, halving it on failures.
+
+        Args:
+            cursor_id: cursor to use when fetching the page
+            offset: row to start the page at
+            limit: ignored, the current page size from state is always used
+        """
+        while True:
+            page_size = self.state["page_size"]
+            start_dt = dt_now()
+            try:
+                page = self.fetch(cursor_id=cursor_id, offset=offset, limit=page_size)
+            except (ResponseError, *self.BACKOFF_EXCS) as exc:
+                if not self.is_backoff(exc=exc) or page_size <= self.min_size:
+                    raise
+                self.state["page_size"] = self.clamp(page_size // 2)
+                self.record(page_size=page_size, backoff=f"{type(exc).__name__}")
+                self.log.warning(
+                    f"Fetching page with page size {page_size} failed, retrying with page size "
+                    f"{self.state['page_size']}: {exc}"
+                )
+                continue
+
+            seconds = dt_sec_ago(obj=start_dt, exact=True)
+            self.page_number += 1
+            page.meta.setdefault("page", {})["number"] = self.page_number
+            self.record(page_size=page_size, page=page, seconds=seconds)
+            page.page_sizes, self.records = self.records, []
+            self.state["page_size"] = self.get_next_size(
+                page_size=page_size, page=page, seconds=seconds
+            )
+            return page
+
+    def is_backoff(self, exc: Exception) -> bool:
+        """Check if an exception should cause the page size to be halved."""
+        if isinstance(exc, ResponseError):
+            response = getattr(exc, "response", None)
+            return response is not None and response.status_code >= 500
+        return True
+
+    def clamp(self, value: int) -> int:
+        """Keep a page size between the minimum and maximum page size."""
+        return max(self.min_size, min(self.max_size, int(value)))
+
+    def get_next_size(self, page_size: int, page, seconds: float) -> int:
+        """Calculate the size of the next page from the time taken and bytes of the last page."""
+        rows = page.asset_count_page
+        if not rows:
+            return page_size
+
+        sizes = [page_size * 2]
+
+        if seconds > 0:
+            sizes.append(self.target / (seconds / rows))
+
+        if self.max_bytes and page.response_bytes:
+            sizes.append(self.max_bytes / (page.response_bytes / rows))
+
+        return self.clamp(min(sizes))
+
+    def record(
+        self,
+        page_size: int,
+        page=None,
+        seconds: float = 0,
+        backoff: Optional[str] = None,
+    ):
+        """Add the page size used to fetch a page to the records for the next page fetched."""
+        self.records.append(
+            {
+                "page_size": page_size,
+                "rows": page.asset_count_page if page else 0,
+                "bytes": page.response_bytes if page else 0,
+                "seconds": seconds,
+                "backoff": backoff,
+            }
+        )
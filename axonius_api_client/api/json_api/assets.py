@@ -2,6 +2,7 @@
 """Models for API requests & responses."""
 import dataclasses
 import datetime
+import logging
 from typing import ClassVar, Dict, List, Optional, Type, Union
 
 import marshmallow
@@ -9,7 +10,7 @@ import marshmallow_jsonapi
 
 from ... import LOG
 from ...constants.api import MAX_PAGE_SIZE, PAGE_SIZE
-from ...exceptions import ApiError, StopFetch
+from ...exceptions import ApiError, SchemaError, StopFetch
 from ...http import Http
 from ...tools import coerce_int, dt_now, dt_parse, dt_sec_ago, json_dump, parse_int_min_max
 from .base import BaseModel, BaseSchema, BaseSchemaJson
@@ -339,20 +340,52 @@ class AssetsPage(BaseModel):
     meta: Optional[dict] = dataclasses.field(default_factory=dict)
     empty_response: bool = False
 
+    STRICT: ClassVar[bool] = False
+    """Validate pages using the dataclasses_json schema in :meth:`load_response`."""
+
     def __post_init__(self):
         """Pass."""
         self.page_start_dt = dt_now()
         self.row_start_dt = dt_now()
+        self.response_bytes = 0
+        self.page_sizes = []
 
     @classmethod
-    def load_response(cls, data: dict, http: Http, **kwargs):
-        """Pass."""
-        empty = data.get("data") is None
-        assets = [x["attributes"] for x in data.get("data") or []]
-        meta = data.get("meta") or {}
-        new_data = {"assets": assets, "meta": meta, "empty_response": empty}
-        schema = cls.schema()
-        return cls._load_schema(schema=schema, data=new_data, http=http)
+    def load_response(cls, data: dict, http: Http, strict: Optional[bool] = None, **kwargs):
+        """Load a page of assets from the data of a response.
+
+        Notes:
+            The assets are passed on as is, so unless strict is True the page is created
+            directly from data instead of validating every asset with a marshmallow schema.
+
+        Args:
+            data: JSON API data from the response
+            http: HTTP object used to receive the response
+            strict: validate the page using the dataclasses_json schema, if None
+                use :attr:`STRICT`
+            **kwargs: response is used to set response_bytes
+        """
+        strict = cls.STRICT if strict is None else strict
+        try:
+            empty = data.get("data") is None
+            assets = [x["attributes"] for x in data.get("data") or []]
+            meta = data.get("meta") or {}
+        except Exception as exc:
+            raise SchemaError(schema=None, exc=exc, obj=cls, data=data)
+
+        if strict:
+            new_data = {"assets": assets, "meta": meta, "empty_response": empty}
+            obj = cls._load_schema(schema=cls.schema(), data=new_data, http=http)
+        else:
+            if not isinstance(meta, dict) or not all(isinstance(x, dict) for x in assets):
+                exc = ApiError("Page meta and assets must be dictionaries")
+                raise SchemaError(schema=None, exc=exc, obj=cls, data=data)
+            obj = cls(assets=assets, meta=meta, empty_response=empty)
+            cls._post_load_attrs(data=obj, http=http)
+
+        response = kwargs.get("response")
+        obj.response_bytes = len(response.content) if response is not None else 0
+        return obj
 
     def __str__(self):
         """Pass."""
@@ -504,10 +537,14 @@ class AssetsPage(BaseModel):
         state["page_cursor"] = self.cursor
         state["page_number"] = self.page_number
 
+        if self.page_sizes:
+            state.setdefault("page_sizes", []).extend(self.page_sizes)
+
         if not self.assets:
             state = self.process_stop(state=state, reason="no more rows returned", apiobj=apiobj)
 
-        apiobj.LOG.debug(f"CURRENT PAGING STATE: {json_dump(state)}")
+        if apiobj.LOG.isEnabledFor(logging.DEBUG):
+            apiobj.LOG.debug(f"CURRENT PAGING STATE: {json_dump(state)}")
         return state
 
     def start_row(self, state: dict, apiobj, row: dict) -> dict:
@@ -524,6 +561,24 @@ class AssetsPage(BaseModel):
         state["process_seconds_row"] = dt_sec_ago(obj=self.row_start_dt, exact=True)
         return state
 
+    def start_rows(self, state: dict, apiobj) -> List[dict]:
+        """Get the rows of this page to process, leaving out any rows past max_rows."""
+        self.row_start_dt = dt_now()
+        if state["max_rows"]:
+            return self.assets[: max(0, state["max_rows"] - state["rows_processed_total"])]
+        return self.assets
+
+    def process_rows(self, state: dict, apiobj, rows: List[dict]) -> dict:
+        """Update the state after the rows from :meth:`start_rows` have been processed."""
+        if state["max_rows"] and state["rows_processed_total"] >= state["max_rows"]:
+            state = self.process_stop(
+                state=state, reason="'rows_processed_total' greater than 'max_rows'", apiobj=apiobj
+            )
+        process_rows_took = dt_sec_ago(obj=self.row_start_dt, exact=True)
+        state["process_seconds_page"] = process_rows_took
+        state["process_seconds_row"] = process_rows_took / len(rows) if rows else 0
+        return state
+
     def process_loop(self, state: dict, apiobj) -> dict:
         """Pass."""
         if state["max_pages"] and state["page_number"] >= state["max_pages"]:
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Easy all-in-one asyncio connection handler."""
+import asyncio
+
+from .api import AsyncAssets
+from .connect import Connect
+from .constants.api import ASYNC_WORKERS
+from .exceptions import ApiError
+from .http import AsyncHttp
+
+
+class AsyncConnect:
+    """Easy all-in-one asyncio connection handler for using the API client.
+
+    Notes:
+        Wraps a :obj:`axonius_api_client.connect.Connect` object, so all arguments supported by
+        :obj:`axonius_api_client.connect.Connect` are supported. The synchronous API models are
+        still available using :attr:`client`.
+
+        Requests are sent by :obj:`axonius_api_client.http.AsyncHttp` using
+        :obj:`requests.Session` objects in a thread pool, not by a native asyncio transport,
+        see :obj:`axonius_api_client.http.AsyncHttp` for the limitations of this.
+
+    Examples:
+        >>> import asyncio
+        >>> import axonius_api_client as axonapi
+        >>>
+        >>> async def main():
+        ...     client_args = axonapi.get_env_connect()
+        ...     async with axonapi.AsyncConnect(**client_args) as client:
+        ...         device_count, user_count = await asyncio.gather(
+        ...             client.devices.count(), client.users.count()
+        ...         )
+        ...         async for row in client.devices.aget(fields="hostname"):
+        ...             print(row)
+        >>>
+        >>> asyncio.run(main())
+    """
+
+    def __init__(self, url: str, key: str, secret: str, workers: int = ASYNC_WORKERS, **kwargs):
+        """Easy all-in-one asyncio connection handler.
+
+        Args:
+            url: URL, hostname, or IP address of Axonius instance
+            key: API Key from account page in Axonius instance
+            secret: API Secret from account page in Axonius instance
+            workers: number of threads to use for sending requests
+            **kwargs: passed to :obj:`axonius_api_client.connect.Connect`
+        """
+        self.client: Connect = Connect(url=url, key=key, secret=secret, **kwargs)
+        """synchronous connection handler used for authentication and API models"""
+
+        self.HTTP: AsyncHttp = AsyncHttp(http=self.client.HTTP, workers=workers)
+        """:obj:`axonius_api_client.http.AsyncHttp` client to use for all async API models"""
+
+    @property
+    def STARTED(self) -> bool:
+        """Check if :meth:`start` has connected to Axonius."""
+        return self.client.STARTED
+
+    async def start(self):
+        """Connect to and authenticate with Axonius."""
+        if not self.STARTED:
+            await self.HTTP.run(self.client.start)
+
+    async def close(self):
+        """Wait for any requests being sent and shutdown the thread pool of :attr:`HTTP`."""
+        await asyncio.get_running_loop().run_in_executor(None, self.HTTP.close)
+
+    async def __aenter__(self) -> "AsyncConnect":
+        """Connect to Axonius when entering an async context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close when exiting an async context manager."""
+        await self.close()
+
+    @property
+    def users(self) -> AsyncAssets:
+        """Work with user assets."""
+        self._check_started()
+        if not hasattr(self, "_users"):
+            self._users = AsyncAssets(apiobj=self.client.users, http=self.HTTP)
+        return self._users
+
+    @property
+    def devices(self) -> AsyncAssets:
+        """Work with device assets."""
+        self._check_started()
+        if not hasattr(self, "_devices"):
+            self._devices = AsyncAssets(apiobj=self.client.devices, http=self.HTTP)
+        return self._devices
+
+    def _check_started(self):
+        """Check that :meth:`start` has been awaited, since connecting blocks."""
+        if not self.STARTED:
+            raise ApiError(f"Must use 'await {self.__class__.__name__}.start()' first")
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return f"{self.__class__.__name__}(client={self.client}, http={self.HTTP})"
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
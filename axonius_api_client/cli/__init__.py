@@ -5,7 +5,16 @@ import sys
 import click
 
 from .. import version
-from ..constants.api import TIMEOUT_CONNECT, TIMEOUT_RESPONSE
+from ..constants.api import (
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_MAX,
+    RETRY_JITTER,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_METHODS,
+    RETRY_STATUSES,
+    TIMEOUT_CONNECT,
+    TIMEOUT_RESPONSE,
+)
 from ..constants.logs import (
     LOG_FILE_MAX_FILES,
     LOG_FILE_MAX_MB,
@@ -314,6 +323,67 @@ All of the options listed above must be supplied BEFORE any commands or groups.
     type=click.INT,
     show_default=True,
 )
+@click.option(
+    "--retry-max-attempts",
+    "-rma",
+    "retry_max_attempts",
+    default=RETRY_MAX_ATTEMPTS,
+    help="Number of times to send idempotent requests before giving up (1 = no retries)",
+    type=click.INT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--retry-backoff-factor",
+    "-rbf",
+    "retry_backoff_factor",
+    default=RETRY_BACKOFF_FACTOR,
+    help="Seconds to wait before the first retry, doubled for each retry after that",
+    type=click.FLOAT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--retry-backoff-max",
+    "-rbm",
+    "retry_backoff_max",
+    default=RETRY_BACKOFF_MAX,
+    help="Maximum seconds to wait between retries, including any Retry-After header",
+    type=click.FLOAT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--retry-jitter",
+    "-rj",
+    "retry_jitter",
+    default=RETRY_JITTER,
+    help="Maximum random seconds to add to the wait between retries",
+    type=click.FLOAT,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--retry-status",
+    "-rs",
+    "retry_statuses",
+    default=RETRY_STATUSES,
+    help="Response status codes to retry idempotent requests on (multiples)",
+    type=click.INT,
+    multiple=True,
+    show_envvar=True,
+    show_default=True,
+)
+@click.option(
+    "--retry-method",
+    "-rm",
+    "retry_methods",
+    default=RETRY_METHODS,
+    help="Request methods that are always treated as idempotent (multiples)",
+    multiple=True,
+    show_envvar=True,
+    show_default=True,
+)
 @click.version_option(version.__version__)
 @context.pass_context
 @click.pass_context
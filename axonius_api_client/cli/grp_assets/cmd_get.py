@@ -11,7 +11,7 @@ from ..options import (
     get_option_fields_default,
     get_option_help,
 )
-from .grp_common import GET_EXPORT, HISTORY, OPTS_EXPORT, WIZ, load_whitelist, load_wiz
+from .grp_common import GET_EXPORT, HISTORY, OPTS_EXPORT, WIZ, load_tee, load_whitelist, load_wiz
 
 OPTIONS = [
     *AUTH,
@@ -34,6 +34,7 @@ def cmd(ctx, url, key, secret, query_file, wizard_content, whitelist=None, **kwa
     """Get assets using a query and fields."""
     kwargs["query"] = query_file.read().strip() if query_file else kwargs.get("query")
     kwargs["report_software_whitelist"] = load_whitelist(whitelist)
+    kwargs = load_tee(kwargs)
     client = ctx.obj.start_client(url=url, key=key, secret=secret)
     p_grp = ctx.parent.command.name
     apiobj = getattr(client, p_grp)
@@ -2,7 +2,7 @@
 """Command line interface for Axonius API Client."""
 from ..context import CONTEXT_SETTINGS, click
 from ..options import AUTH, FIELDS_SELECT, PAGING, SQ_NAME, add_options, get_option_help
-from .grp_common import GET_EXPORT, OPTS_EXPORT, load_whitelist
+from .grp_common import GET_EXPORT, OPTS_EXPORT, load_tee, load_whitelist
 
 METHOD = "get-by-saved-query"
 OPTIONS = [
@@ -23,6 +23,7 @@ def cmd(ctx, url, key, secret, whitelist=None, **kwargs):
     """Get assets using a saved query."""
     client = ctx.obj.start_client(url=url, key=key, secret=secret)
     kwargs["report_software_whitelist"] = load_whitelist(whitelist)
+    kwargs = load_tee(kwargs)
     p_grp = ctx.parent.command.name
     apiobj = getattr(client, p_grp)
     with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
@@ -127,6 +127,16 @@ GET_EXPORT = [
         type=click.INT,
         hidden=False,
     ),
+    click.option(
+        "--callback-workers",
+        "callback_workers",
+        default=asset_callbacks.Base.args_map()["callback_workers"],
+        help="Number of processes to run flatten, explode, join and other field callbacks in",
+        show_envvar=True,
+        show_default=True,
+        type=click.IntRange(min=1),
+        hidden=False,
+    ),
     click.option(
         "--export-format",
         "-xt",
@@ -137,6 +147,16 @@ GET_EXPORT = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--export-tee",
+        "tee_exports",
+        help="Write to several formats from one fetch (multiples, overrides --export-format)",
+        multiple=True,
+        default=[],
+        show_envvar=True,
+        metavar="FORMAT=FILE",
+        hidden=False,
+    ),
     TABLE_FMT,
     click.option(
         "--table-max-rows",
@@ -148,6 +168,16 @@ GET_EXPORT = [
         type=click.INT,
         hidden=False,
     ),
+    click.option(
+        "--table-block-rows",
+        "table_block_rows",
+        default=asset_callbacks.Table.args_map()["table_block_rows"],
+        help="Rows to render in each table for --export-format=table (default: all in one table)",
+        show_envvar=True,
+        show_default=True,
+        type=click.INT,
+        hidden=False,
+    ),
     click.option(
         "--table-api-fields/--no-table-api-fields",
         "table_api_fields",
@@ -158,6 +188,64 @@ GET_EXPORT = [
         show_default=True,
         hidden=False,
     ),
+    click.option(
+        "--sqlite-table",
+        "sqlite_table",
+        default=asset_callbacks.Sqlite.args_map()["sqlite_table"],
+        help="Table to upsert assets into for --export-format=sqlite (default: asset type)",
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--sqlite-index",
+        "sqlite_indexes",
+        help="Column to create an index for in --export-format=sqlite (multiples)",
+        multiple=True,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--export-compress",
+        "export_compress",
+        default=asset_callbacks.Json.args_map()["export_compress"],
+        help="Compression to use for --export-file (default: use the suffix of --export-file)",
+        type=click.Choice(["none", *asset_callbacks.compress.COMPRESSIONS]),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--export-compress-level",
+        "export_compress_level",
+        default=asset_callbacks.Json.args_map()["export_compress_level"],
+        help="Compression level to use for --export-file (default: compression default)",
+        type=click.INT,
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--export-rotate-rows",
+        "export_rotate_rows",
+        default=asset_callbacks.Json.args_map()["export_rotate_rows"],
+        help="Write --export-file in parts of N rows with a manifest (0 = one file)",
+        type=click.IntRange(min=0),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
+    click.option(
+        "--export-rotate-bytes",
+        "export_rotate_bytes",
+        default=asset_callbacks.Json.args_map()["export_rotate_bytes"],
+        help="Write --export-file in parts of about N bytes with a manifest (0 = one file)",
+        type=click.IntRange(min=0),
+        show_envvar=True,
+        show_default=True,
+        hidden=False,
+    ),
     click.option(
         "--schema/--no-schema",
         "export_schema",
@@ -331,6 +419,26 @@ GET_EXPORT = [
         hidden=False,
         metavar="TAG",
     ),
+    click.option(
+        "--tags-chunk-size",
+        "tags_chunk_size",
+        default=asset_callbacks.Base.args_map()["tags_chunk_size"],
+        help="Send --tag/--untag requests every N assets during the fetch (0 = all at end)",
+        show_envvar=True,
+        show_default=True,
+        type=click.IntRange(min=0),
+        hidden=False,
+    ),
+    click.option(
+        "--tags-background/--no-tags-background",
+        "tags_background",
+        default=asset_callbacks.Base.args_map()["tags_background"],
+        help="Send --tag/--untag requests from a background thread",
+        show_envvar=True,
+        show_default=True,
+        is_flag=True,
+        hidden=False,
+    ),
     click.option(
         "--include-details/--no-include-details",
         "-id/-nid",
@@ -469,6 +577,14 @@ def load_whitelist(fh):
     return [x.strip() for x in fh.readlines() if x.strip()] if fh else None
 
 
+def load_tee(kwargs):
+    """Pass."""
+    tee_exports = list(kwargs.pop("tee_exports", None) or [])
+    if tee_exports:
+        kwargs["export"] = tee_exports
+    return kwargs
+
+
 def gen_get_by_cmd(options, doc, cmd_name, method):
     """Pass."""
 
@@ -484,6 +600,7 @@ def gen_get_by_cmd(options, doc, cmd_name, method):
         )
         client = ctx.obj.start_client(url=url, key=key, secret=secret)
         kwargs["report_software_whitelist"] = load_whitelist(whitelist)
+        kwargs = load_tee(kwargs)
         p_grp = ctx.parent.command.name
         apiobj = getattr(client, p_grp)
         apimethod = getattr(apiobj, get_method)
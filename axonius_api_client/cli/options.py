@@ -4,7 +4,12 @@ import click
 import tabulate
 
 from .. import DEFAULT_PATH
-from ..constants.api import MAX_PAGE_SIZE, TABLE_FORMAT
+from ..constants.api import (
+    MAX_PAGE_SIZE,
+    PAGE_SIZE_ADAPTIVE_MIN,
+    PAGE_SIZE_ADAPTIVE_TARGET,
+    TABLE_FORMAT,
+)
 from ..tools import coerce_int
 from . import context
 from .helps import HELPSTRS
@@ -301,6 +306,78 @@ PAGING = [
         show_envvar=True,
         show_default=True,
     ),
+    click.option(
+        "--page-size-adaptive/--no-page-size-adaptive",
+        "page_size_adaptive",
+        default=False,
+        help="Change the page size after each page to aim for --page-size-target seconds",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-size-target",
+        "page_size_target",
+        default=PAGE_SIZE_ADAPTIVE_TARGET,
+        type=click.FLOAT,
+        help="If --page-size-adaptive, seconds that each page fetch should take",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--page-size-min",
+        "page_size_min",
+        default=PAGE_SIZE_ADAPTIVE_MIN,
+        type=click.INT,
+        help="If --page-size-adaptive, smallest page size to use",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--prefetch-pages",
+        "prefetch_pages",
+        default=0,
+        type=click.INT,
+        help="Fetch up to N pages in the background while the current page is processed",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--workers",
+        "workers",
+        default=1,
+        type=click.INT,
+        help="Fetch pages by offset in parallel using N threads",
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--workers-ordered/--no-workers-ordered",
+        "workers_ordered",
+        default=True,
+        help="If --workers is more than 1, return pages in order instead of as they arrive",
+        is_flag=True,
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--checkpoint-file",
+        "checkpoint_file",
+        default=None,
+        help="Save the paging state to this file after each page is processed",
+        type=click.Path(exists=False, resolve_path=True),
+        show_envvar=True,
+        show_default=True,
+    ),
+    click.option(
+        "--resume-from",
+        "resume_from",
+        default=None,
+        help="Resume fetching from a file saved by --checkpoint-file",
+        type=click.Path(exists=True, resolve_path=True, dir_okay=False),
+        show_envvar=True,
+        show_default=True,
+    ),
 ]
 
 SPLIT_CONFIG_OPT = click.option(
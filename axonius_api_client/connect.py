@@ -27,7 +27,19 @@ from .api import (
     Users,
 )
 from .auth import ApiKey
-from .constants.api import TIMEOUT_CONNECT, TIMEOUT_RESPONSE
+from .constants.api import (
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_MAX,
+    RETRY_JITTER,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_METHODS,
+    RETRY_STATUSES,
+    TIMEOUT_CONNECT,
+    TIMEOUT_RESPONSE,
+)
 from .constants.logs import (
     LOG_FILE_MAX_FILES,
     LOG_FILE_MAX_MB,
@@ -140,6 +152,41 @@ class Connect:
         self.TIMEOUT_RESPONSE: int = coerce_int(kwargs.get("timeout_response", TIMEOUT_RESPONSE))
         """Seconds to wait for responses from :attr:`url` ``kwargs=timeout_response``"""
 
+        self.POOL_CONNECTIONS: int = coerce_int(kwargs.get("pool_connections", POOL_CONNECTIONS))
+        """Number of urllib3 connection pools to cache ``kwargs=pool_connections``"""
+
+        self.POOL_MAXSIZE: int = coerce_int(kwargs.get("pool_maxsize", POOL_MAXSIZE))
+        """Maximum number of connections to keep open per pool ``kwargs=pool_maxsize``"""
+
+        self.POOL_BLOCK: bool = coerce_bool(kwargs.get("pool_block", POOL_BLOCK))
+        """Block when no connections are free in a pool ``kwargs=pool_block``"""
+
+        self.POOL_SHARED: bool = coerce_bool(kwargs.get("pool_shared", False))
+        """Share connection pools with all other clients for the same url, cert, proxy, and
+        pool settings ``kwargs=pool_shared``"""
+
+        self.RETRY_MAX_ATTEMPTS: int = coerce_int(
+            kwargs.get("retry_max_attempts", RETRY_MAX_ATTEMPTS)
+        )
+        """Number of times to send idempotent requests before giving up
+        ``kwargs=retry_max_attempts``"""
+
+        self.RETRY_BACKOFF_FACTOR: float = kwargs.get("retry_backoff_factor", RETRY_BACKOFF_FACTOR)
+        """Seconds to wait before the first retry, doubled for each retry after that
+        ``kwargs=retry_backoff_factor``"""
+
+        self.RETRY_BACKOFF_MAX: float = kwargs.get("retry_backoff_max", RETRY_BACKOFF_MAX)
+        """Maximum seconds to wait between retries ``kwargs=retry_backoff_max``"""
+
+        self.RETRY_JITTER: float = kwargs.get("retry_jitter", RETRY_JITTER)
+        """Maximum random seconds to add to the wait between retries ``kwargs=retry_jitter``"""
+
+        self.RETRY_STATUSES: List[int] = kwargs.get("retry_statuses", RETRY_STATUSES)
+        """Response status codes to retry idempotent requests on ``kwargs=retry_statuses``"""
+
+        self.RETRY_METHODS: List[str] = kwargs.get("retry_methods", RETRY_METHODS)
+        """Request methods that are always treated as idempotent ``kwargs=retry_methods``"""
+
         self.CERT_CLIENT_KEY: Optional[Union[str, pathlib.Path]] = kwargs.get(
             "cert_client_key", None
         )
@@ -274,6 +321,16 @@ class Connect:
             "save_history": self.SAVE_HISTORY,
             "connect_timeout": self.TIMEOUT_CONNECT,
             "response_timeout": self.TIMEOUT_RESPONSE,
+            "pool_connections": self.POOL_CONNECTIONS,
+            "pool_maxsize": self.POOL_MAXSIZE,
+            "pool_block": self.POOL_BLOCK,
+            "pool_shared": self.POOL_SHARED,
+            "retry_max_attempts": self.RETRY_MAX_ATTEMPTS,
+            "retry_backoff_factor": self.RETRY_BACKOFF_FACTOR,
+            "retry_backoff_max": self.RETRY_BACKOFF_MAX,
+            "retry_jitter": self.RETRY_JITTER,
+            "retry_statuses": self.RETRY_STATUSES,
+            "retry_methods": self.RETRY_METHODS,
             "headers": headers,
         }
         """arguments to use for creating :attr:`HTTP`"""
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Constants for API models."""
-from typing import List
+from typing import List, Optional
 
 USE_CA_PATH: str = " > ".join(
     ["Settings", "Certificate Settings", "SSL Trust & CA Settings", "Use custom CA certificate"]
@@ -24,6 +24,9 @@ TABLE_FORMAT: str = "fancy_grid"
 TABLE_MAX_ROWS: int = 5
 """Default row limit for tablize export"""
 
+TABLE_BLOCK_ROWS: Optional[int] = None
+"""Default number of rows to render in each table for tablize export (None = all in one)"""
+
 MAX_PAGE_SIZE: int = 2000
 """maximum page size that REST API allows"""
 
@@ -33,6 +36,15 @@ PAGE_SIZE: int = MAX_PAGE_SIZE
 PAGE_SLEEP: int = 0
 """API wide default number of seconds to sleep between in page."""
 
+PAGE_SIZE_ADAPTIVE_TARGET: float = 30.0
+"""seconds that each page fetch should take when using an adaptive page size."""
+
+PAGE_SIZE_ADAPTIVE_MIN: int = 50
+"""smallest page size to use when using an adaptive page size."""
+
+PAGE_SIZE_ADAPTIVE_MAX_BYTES: int = 100 * 1024 * 1024
+"""largest response body in bytes to aim for when using an adaptive page size."""
+
 GUI_PAGE_SIZES: List[int] = [20, 50, 100]
 """valid page sizes for GUI page sizes for saved queries"""
 
@@ -42,6 +54,39 @@ TIMEOUT_CONNECT: int = 5
 TIMEOUT_RESPONSE: int = 900
 """seconds to wait for response from API."""
 
+POOL_CONNECTIONS: int = 10
+"""number of urllib3 connection pools to cache per session."""
+
+POOL_MAXSIZE: int = 10
+"""maximum number of connections to keep open in each urllib3 connection pool."""
+
+POOL_BLOCK: bool = False
+"""block when no connections are free in a pool instead of opening a connection to discard."""
+
+ASYNC_WORKERS: int = 10
+"""number of threads used by :obj:`axonius_api_client.http.AsyncHttp` to send requests."""
+
+TAGS_CHUNK_SIZE: int = 1000
+"""number of assets to add or remove tags from in each request."""
+
+RETRY_MAX_ATTEMPTS: int = 3
+"""number of times to send an idempotent request before giving up (1 = no retries)."""
+
+RETRY_BACKOFF_FACTOR: float = 1.0
+"""seconds to wait before the first retry, doubled for each retry after that."""
+
+RETRY_BACKOFF_MAX: float = 120.0
+"""maximum seconds to wait between retries, including any Retry-After header."""
+
+RETRY_JITTER: float = 1.0
+"""maximum random seconds to add to the wait between retries."""
+
+RETRY_STATUSES: List[int] = [429, 502, 503, 504]
+"""response status codes that will cause an idempotent request to be retried."""
+
+RETRY_METHODS: List[str] = ["GET", "HEAD", "OPTIONS"]
+"""request methods that are always treated as idempotent."""
+
 DEFAULT_CALLBACKS_CLS: str = "base"
 """Default callback object to use"""
 
@@ -1,24 +1,52 @@
 # -*- coding: utf-8 -*-
 """HTTP client."""
+import asyncio
+import concurrent.futures
+import copy
+import datetime
+import email.utils
+import functools
 import logging
 import pathlib
+import random
+import threading
+import time
 import warnings
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import requests
 
 from . import cert_human
-from .constants.api import TIMEOUT_CONNECT, TIMEOUT_RESPONSE
+from .constants.api import (
+    ASYNC_WORKERS,
+    POOL_BLOCK,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_MAX,
+    RETRY_JITTER,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_METHODS,
+    RETRY_STATUSES,
+    TIMEOUT_CONNECT,
+    TIMEOUT_RESPONSE,
+)
 from .constants.logs import LOG_LEVEL_HTTP, MAX_BODY_LEN, REQUEST_ATTR_MAP, RESPONSE_ATTR_MAP
 from .exceptions import HttpError
 from .logs import get_obj_log, set_log_level
 from .parsers.url_parser import UrlParser
 from .setup_env import get_env_user_agent
-from .tools import coerce_str, join_url, json_log, listify, path_read
+from .tools import coerce_str, dt_now, join_url, json_log, listify, path_read
 from .version import __version__
 
 cert_human.ssl_capture.inject_into_urllib3()
 
+SHARED_ADAPTERS: Dict[tuple, requests.adapters.HTTPAdapter] = {}
+"""process wide registry of adapters used by :obj:`Http` objects with ``pool_shared=True``"""
+
+SHARED_ADAPTERS_LOCK: threading.Lock = threading.Lock()
+"""lock for :data:`SHARED_ADAPTERS`"""
+
 
 class Http:
     """HTTP client that wraps around around :obj:`requests.Session`."""
@@ -78,6 +106,41 @@ class Http:
         self.RESPONSE_TIMEOUT: int = kwargs.get("response_timeout", TIMEOUT_RESPONSE)
         """seconds to wait for responses from :attr:`url` ``kwargs=response_timeout``"""
 
+        self.RETRY_MAX_ATTEMPTS: int = kwargs.get("retry_max_attempts", RETRY_MAX_ATTEMPTS)
+        """number of times to send an idempotent request before giving up
+        ``kwargs=retry_max_attempts``"""
+
+        self.RETRY_BACKOFF_FACTOR: float = kwargs.get("retry_backoff_factor", RETRY_BACKOFF_FACTOR)
+        """seconds to wait before the first retry, doubled for each retry after that
+        ``kwargs=retry_backoff_factor``"""
+
+        self.RETRY_BACKOFF_MAX: float = kwargs.get("retry_backoff_max", RETRY_BACKOFF_MAX)
+        """maximum seconds to wait between retries ``kwargs=retry_backoff_max``"""
+
+        self.RETRY_JITTER: float = kwargs.get("retry_jitter", RETRY_JITTER)
+        """maximum random seconds to add to the wait between retries ``kwargs=retry_jitter``"""
+
+        self.RETRY_STATUSES: List[int] = listify(kwargs.get("retry_statuses", RETRY_STATUSES))
+        """response status codes to retry idempotent requests on ``kwargs=retry_statuses``"""
+
+        self.RETRY_METHODS: List[str] = [
+            x.upper() for x in listify(kwargs.get("retry_methods", RETRY_METHODS))
+        ]
+        """request methods that are always treated as idempotent ``kwargs=retry_methods``"""
+
+        self.POOL_CONNECTIONS: int = kwargs.get("pool_connections", POOL_CONNECTIONS)
+        """number of urllib3 connection pools to cache ``kwargs=pool_connections``"""
+
+        self.POOL_MAXSIZE: int = kwargs.get("pool_maxsize", POOL_MAXSIZE)
+        """maximum number of connections to keep open per pool ``kwargs=pool_maxsize``"""
+
+        self.POOL_BLOCK: bool = kwargs.get("pool_block", POOL_BLOCK)
+        """block when no connections are free in a pool ``kwargs=pool_block``"""
+
+        self.POOL_SHARED: bool = kwargs.get("pool_shared", False)
+        """share connection pools with all other objects with the same url, cert, proxy, and
+        pool settings ``kwargs=pool_shared``"""
+
         self.LOG_HIDE_HEADERS: List[str] = ["api-key", "api-secret"]
         """Headers to hide when logging."""
 
@@ -178,6 +241,81 @@ class Http:
         self.set_session_proxies()
         self.set_session_verify()
         self.set_session_cert()
+        self.set_session_adapter()
+
+    def set_session_adapter(self):
+        """Mount an adapter with the pool settings of this object to :attr:`session`.
+
+        Notes:
+            If :attr:`POOL_SHARED` is True, the adapter is taken from :data:`SHARED_ADAPTERS`
+            so that the connection pools are shared. Only the adapter is shared and not the
+            session, since the session holds the auth headers of its :obj:`Http` object.
+        """
+        adapter = self.get_shared_adapter() if self.POOL_SHARED else self.new_adapter()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def new_adapter(self) -> requests.adapters.HTTPAdapter:
+        """Create an adapter with the pool settings of this object."""
+        return requests.adapters.HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            pool_block=self.POOL_BLOCK,
+        )
+
+    @property
+    def shared_adapter_key(self) -> tuple:
+        """Get the key for this object in :data:`SHARED_ADAPTERS`."""
+        return (
+            self.url,
+            str(self.session.verify),
+            str(self.session.cert),
+            self.HTTPS_PROXY,
+            self.HTTP_PROXY,
+            self.POOL_CONNECTIONS,
+            self.POOL_MAXSIZE,
+            self.POOL_BLOCK,
+        )
+
+    def get_shared_adapter(self) -> requests.adapters.HTTPAdapter:
+        """Get or create the adapter for this object in :data:`SHARED_ADAPTERS`."""
+        key = self.shared_adapter_key
+        with SHARED_ADAPTERS_LOCK:
+            if key not in SHARED_ADAPTERS:
+                SHARED_ADAPTERS[key] = self.new_adapter()
+                self.LOG.debug(f"Created shared adapter for {key}")
+            return SHARED_ADAPTERS[key]
+
+    def clone(self) -> "Http":
+        """Create a copy of this object that uses its own :obj:`requests.Session`.
+
+        Notes:
+            Headers set on :attr:`session` after it was created (i.e. the auth headers) are
+            copied to the new session, so the copy can be used from another thread. If
+            :attr:`POOL_SHARED` is True, the copy uses the same adapter from
+            :data:`SHARED_ADAPTERS` (which is thread safe), otherwise it has its own adapter
+            and does not share connections with this object. Use :meth:`close` to close the
+            copy when done with it.
+        """
+        new = copy.copy(self)
+        new.LAST_REQUEST = None
+        new.LAST_RESPONSE = None
+        new.HISTORY = []
+        new.new_session()
+        new.session.headers.update(self.session.headers)
+        return new
+
+    def close(self):
+        """Close :attr:`session`.
+
+        Notes:
+            If :attr:`POOL_SHARED` is True, the adapters are unmounted before the session is
+            closed, so the connections pooled by the adapter from :data:`SHARED_ADAPTERS` stay
+            open for the other objects using it.
+        """
+        if self.POOL_SHARED:
+            self.session.adapters.clear()
+        self.session.close()
 
     def set_session_headers(self):
         """Pass."""
@@ -268,6 +406,14 @@ class Http:
                 * proxies: proxies for this request
                 * verify: verification of cert for this request
                 * cert: client cert to offer for this request
+                * idempotent: retry this request if it fails (default is True if method is in
+                  :attr:`RETRY_METHODS`)
+
+        Notes:
+            Idempotent requests are sent up to :attr:`RETRY_MAX_ATTEMPTS` times if a connection
+            error or timeout happens or if the response has a status code in
+            :attr:`RETRY_STATUSES`. The wait between attempts is an exponential backoff with
+            jitter, or the value of the Retry-After header of the response if it has one.
 
         Returns:
             :obj:`requests.Response`
@@ -304,8 +450,6 @@ class Http:
         if self.SAVE_LAST:
             self.LAST_REQUEST = prepped_request
 
-        self._do_log_request(request=prepped_request)
-
         pre_send_args = {
             "proxies": kwargs.get("proxies", self.session.proxies),
             "stream": kwargs.get("stream", self.session.stream),
@@ -321,17 +465,92 @@ class Http:
 
         self.LOG.debug(f"Request arguments after environment merge: {send_args}")
 
-        response = self.session.send(request=prepped_request, timeout=timeout, **send_args)
+        idempotent = kwargs.get("idempotent", method.upper() in self.RETRY_METHODS)
+        attempts = max(1, self.RETRY_MAX_ATTEMPTS) if idempotent else 1
+        attempt = 1
 
-        if self.SAVE_LAST:
-            self.LAST_RESPONSE = response
+        while True:
+            self._do_log_request(request=prepped_request)
+
+            try:
+                response = self.session.send(request=prepped_request, timeout=timeout, **send_args)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+                if attempt >= attempts:
+                    raise
+                self._do_retry(attempt=attempt, attempts=attempts, reason=f"{exc!r}")
+                attempt += 1
+                continue
+
+            if self.SAVE_LAST:
+                self.LAST_RESPONSE = response
+
+            if self.SAVE_HISTORY:
+                self.HISTORY.append(response)
+
+            self._do_log_response(response=response)
+
+            if attempt >= attempts or response.status_code not in self.RETRY_STATUSES:
+                return response
+
+            reason = f"response status code {response.status_code}"
+            self._do_retry(attempt=attempt, attempts=attempts, reason=reason, response=response)
+            attempt += 1
+
+    def get_retry_wait(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Get the seconds to wait before retrying a request.
+
+        Args:
+            attempt: number of the attempt that failed
+            response: response of the attempt that failed, if any
+        """
+        retry_after = self.get_retry_after(response=response)
+
+        if retry_after is None:
+            wait = self.RETRY_BACKOFF_FACTOR * (2 ** (attempt - 1))
+            wait += random.uniform(0, self.RETRY_JITTER)
+        else:
+            wait = retry_after
+        return max(0, min(wait, self.RETRY_BACKOFF_MAX))
 
-        if self.SAVE_HISTORY:
-            self.HISTORY.append(response)
+    @staticmethod
+    def get_retry_after(response: Optional[requests.Response] = None) -> Optional[float]:
+        """Get the seconds from the Retry-After header of a response as seconds or HTTP date.
 
-        self._do_log_response(response=response)
+        Args:
+            response: response to get Retry-After header from
+        """
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=datetime.timezone.utc)
+        return (date - dt_now()).total_seconds()
 
-        return response
+    def _do_retry(
+        self,
+        attempt: int,
+        attempts: int,
+        reason: str,
+        response: Optional[requests.Response] = None,
+    ):
+        """Log and wait before retrying a request."""
+        wait = self.get_retry_wait(attempt=attempt, response=response)
+        self.LOG.warning(
+            f"Attempt {attempt} of {attempts} failed due to {reason}, "
+            f"retrying in {wait:.2f} seconds"
+        )
+        time.sleep(wait)
 
     def __str__(self) -> str:
         """Show object info."""
@@ -469,3 +688,116 @@ class Http:
         """
         body = json_log(obj=coerce_str(value=body), trim=self.LOG_BODY_MAX_LEN)
         return f"{body_type} BODY:\n{body}"
+
+
+class AsyncHttp:
+    """Asyncio HTTP client that sends requests using clones of an :obj:`Http` object in threads."""
+
+    def __init__(self, http: Http, workers: int = ASYNC_WORKERS):
+        """Asyncio HTTP client that sends requests using clones of an :obj:`Http` object in threads.
+
+        Notes:
+            This is not a native asyncio transport. :obj:`requests.Session` has no asyncio
+            support and this package does not depend on an asyncio HTTP library, so each request
+            is still a blocking call to :meth:`Http.__call__` that is sent in a thread pool and
+            awaited using :meth:`asyncio.AbstractEventLoop.run_in_executor`. The event loop is
+            not blocked while a request is sent, and up to ``workers`` requests can be sent at
+            the same time, but each request still holds a thread while it waits.
+
+            Each thread sends requests with its own :meth:`Http.clone` of :attr:`http`, so
+            threads do not share a :obj:`requests.Session`, and :attr:`Http.LAST_RESPONSE` and
+            :attr:`Http.HISTORY` of :attr:`http` are not updated by requests sent by this object.
+
+            Blocking calls made with :meth:`run` (i.e. methods of API models) use :attr:`http`
+            itself, so only one of them runs at a time.
+
+        Args:
+            http: HTTP client to clone for each thread
+            workers: number of threads to use for sending requests
+        """
+        self.http: Http = http
+        """:obj:`Http` client that is cloned for each thread and used by :meth:`run`"""
+
+        self.workers: int = workers
+        """number of threads to use for sending requests ``kwargs=workers``"""
+
+        self.executor: concurrent.futures.ThreadPoolExecutor = (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix=f"{self.__class__.__name__}"
+            )
+        )
+        """thread pool used to send requests and run blocking calls"""
+
+        self.clones: List[Http] = []
+        """clones of :attr:`http` created for the threads of :attr:`executor`"""
+
+        self._local: threading.local = threading.local()
+        self._clones_lock: threading.Lock = threading.Lock()
+        self._run_lock: threading.Lock = threading.Lock()
+
+    async def __call__(self, **kwargs) -> requests.Response:
+        """Send a request using :meth:`Http.__call__` of the clone for a thread.
+
+        Args:
+            **kwargs: passed to :meth:`Http.__call__`
+        """
+        return await self._submit(self._send, **kwargs)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking function in :attr:`executor` and await the result.
+
+        Notes:
+            func may use :attr:`http`, so only one function is run at a time.
+
+        Args:
+            func: function to run
+            *args: passed to func
+            **kwargs: passed to func
+        """
+        return await self._submit(self._run_locked, func, *args, **kwargs)
+
+    def get_http(self) -> Http:
+        """Get the clone of :attr:`http` for the current thread, creating it if needed."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = self.http.clone()
+            with self._clones_lock:
+                self.clones.append(http)
+        return http
+
+    def close(self):
+        """Shutdown :attr:`executor` and close the session of each clone of :attr:`http`."""
+        self.executor.shutdown(wait=True)
+        with self._clones_lock:
+            clones, self.clones = self.clones, []
+        for http in clones:
+            http.close()
+
+    async def _submit(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a function in :attr:`executor` and await the result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    def _send(self, **kwargs) -> requests.Response:
+        """Send a request using the clone of :attr:`http` for the current thread."""
+        return self.get_http()(**kwargs)
+
+    def _run_locked(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a function while no other function is being run by :meth:`run`."""
+        with self._run_lock:
+            return func(*args, **kwargs)
+
+    @property
+    def url(self) -> str:
+        """URL of :attr:`http`."""
+        return self.http.url
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return "{c.__module__}.{c.__name__}(url={url!r}, workers={workers})".format(
+            c=self.__class__, url=self.url, workers=self.workers
+        )
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
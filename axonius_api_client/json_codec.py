@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Pluggable JSON codec that uses a fast JSON library if one is installed."""
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from .exceptions import ToolsError
+from .setup_env import KEY_JSON_CODEC, get_env_json_codec
+
+LOGGER = logging.getLogger("axonius_api_client.json_codec")
+
+
+class JsonCodec:
+    """JSON codec that uses the :mod:`json` module from the standard library.
+
+    Notes:
+        :meth:`dumps` writes the same output as :obj:`OrjsonCodec`, so the bytes written by the
+        exporters do not change depending on which codec is installed: no spaces after
+        separators if indent is None, and non-ASCII characters as UTF-8 instead of escapes.
+    """
+
+    NAME: str = "json"
+    """name of this codec"""
+
+    SEPARATORS: Tuple[str, str] = (",", ":")
+    """separators used by :meth:`dumps` if indent is None, the same as orjson uses"""
+
+    def loads(self, obj: Union[bytes, str]) -> Any:
+        """Deserialize a JSON str or bytes into an object.
+
+        Args:
+            obj: JSON str or UTF-8 bytes to deserialize
+        """
+        return json.loads(obj)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None) -> str:
+        """Serialize an object into a JSON str.
+
+        Args:
+            obj: object to serialize
+            indent: indent level, None for no newlines or indentation
+        """
+        separators = self.SEPARATORS if indent is None else None
+        return json.dumps(obj, indent=indent, separators=separators, ensure_ascii=False)
+
+    def __str__(self) -> str:
+        """Show object info."""
+        return f"{self.__class__.__name__}(name={self.NAME!r})"
+
+    def __repr__(self) -> str:
+        """Show object info."""
+        return self.__str__()
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec that uses :mod:`orjson`.
+
+    Notes:
+        orjson decodes directly from bytes. Anything orjson can not write (indent other than
+        None or 2, integers larger than 64 bits) is handled by :obj:`JsonCodec` instead of
+        raising. The output of :meth:`dumps` is the same as :obj:`JsonCodec` except that
+        orjson writes NaN and Infinity as null (instead of NaN and Infinity) and writes floats
+        smaller than 1e-4 without an exponent (0.00001 instead of 1e-05).
+    """
+
+    NAME: str = "orjson"
+    """name of this codec"""
+
+    def __init__(self):
+        """JSON codec that uses :mod:`orjson`."""
+        import orjson
+
+        self.orjson = orjson
+        self.opt_dumps: int = orjson.OPT_NON_STR_KEYS
+        self.opt_dumps_indent: int = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    def loads(self, obj: Union[bytes, str]) -> Any:
+        """Deserialize a JSON str or bytes into an object.
+
+        Args:
+            obj: JSON str or UTF-8 bytes to deserialize
+        """
+        try:
+            return self.orjson.loads(obj)
+        except self.orjson.JSONDecodeError:
+            return super(OrjsonCodec, self).loads(obj)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None) -> str:
+        """Serialize an object into a JSON str.
+
+        Args:
+            obj: object to serialize
+            indent: indent level, None for no newlines or indentation
+        """
+        if indent in [None, 2]:
+            option = self.opt_dumps if indent is None else self.opt_dumps_indent
+            try:
+                return self.orjson.dumps(obj, option=option).decode("utf-8")
+            except self.orjson.JSONEncodeError:
+                pass
+        return super(OrjsonCodec, self).dumps(obj, indent=indent)
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {"orjson": OrjsonCodec, "json": JsonCodec}
+"""codecs that can be used by name, in order of preference for 'auto'"""
+
+CODEC: Optional[JsonCodec] = None
+"""codec returned by :func:`get_codec`, set on first use or by :func:`set_codec`"""
+
+
+def load_codec(name: str = "auto") -> JsonCodec:
+    """Create a JSON codec by name.
+
+    Args:
+        name: name of codec from :data:`CODECS`, or 'auto' to use the first codec that
+            can be imported
+
+    Raises:
+        :exc:`ToolsError`: if name is not a known codec or the codec could not be imported
+    """
+    name = str(name or "auto").strip().lower()
+    if name == "auto":
+        for codec_cls in CODECS.values():
+            try:
+                return codec_cls()
+            except ImportError:
+                continue
+
+    if name not in CODECS:
+        valid = ["auto", *CODECS]
+        raise ToolsError(f"Invalid JSON codec {name!r} from {KEY_JSON_CODEC}, valid: {valid}")
+
+    try:
+        return CODECS[name]()
+    except ImportError as exc:
+        raise ToolsError(
+            f"JSON codec {name!r} is not installed (pip install axonius_api_client[{name}]): {exc}"
+        )
+
+
+def set_codec(name: str = "auto") -> JsonCodec:
+    """Set the JSON codec used throughout the package.
+
+    Args:
+        name: name of codec to pass to :func:`load_codec`
+    """
+    global CODEC
+    CODEC = load_codec(name=name)
+    LOGGER.debug(f"Using JSON codec {CODEC}")
+    return CODEC
+
+
+def get_codec() -> JsonCodec:
+    """Get the JSON codec used throughout the package.
+
+    Notes:
+        The codec is loaded on first use using the name from the OS env var
+        :data:`axonius_api_client.setup_env.KEY_JSON_CODEC`.
+    """
+    return CODEC or set_codec(name=get_env_json_codec())
+
+
+def loads(obj: Union[bytes, str]) -> Any:
+    """Deserialize a JSON str or bytes into an object using :func:`get_codec`."""
+    return get_codec().loads(obj)
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize an object into a JSON str using :func:`get_codec`."""
+    return get_codec().dumps(obj, indent=indent)
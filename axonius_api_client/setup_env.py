@@ -59,6 +59,9 @@ KEY_DEBUG_PRINT: str = f"{KEY_PRE}DEBUG_PRINT"
 KEY_USER_AGENT: str = f"{KEY_PRE}USER_AGENT"
 """OS env to use a custom User Agent string."""
 
+KEY_JSON_CODEC: str = f"{KEY_PRE}JSON_CODEC"
+"""OS env to use for the name of the JSON codec to use (auto, orjson, json)"""
+
 DEFAULT_DEBUG: str = "no"
 """Default for :attr:`KEY_DEBUG`"""
 
@@ -74,6 +77,9 @@ DEFAULT_CERTWARN: str = "yes"
 DEFAULT_ENV_FILE: str = ".env"
 """Default for :attr:`KEY_ENV_FILE`"""
 
+DEFAULT_JSON_CODEC: str = "auto"
+"""Default for :attr:`KEY_JSON_CODEC`"""
+
 KEYS_HIDDEN: List[str] = [KEY_KEY, KEY_SECRET]
 """List of keys to hide in :meth:`get_env_ax`"""
 
@@ -242,6 +248,16 @@ def get_env_user_agent(**kwargs) -> str:
     return get_env_str(key=KEY_USER_AGENT, default="", empty_ok=True)
 
 
+def get_env_json_codec(**kwargs) -> str:
+    """Get the name of the JSON codec to use from OS env vars.
+
+    Args:
+        **kwargs: passed to :meth:`load_dotenv`
+    """
+    load_dotenv(**kwargs)
+    return get_env_str(key=KEY_JSON_CODEC, default=DEFAULT_JSON_CODEC)
+
+
 def get_env_connect(**kwargs) -> dict:
     """Get URL, API key, API secret, and certwarn from OS env vars.
 
@@ -1,12 +1,28 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
 import copy
+import gzip
 import io
+import json
 import logging
+import lzma
+import pickle
 import sys
 
 import pytest
 from axonius_api_client.api.asset_callbacks import get_callbacks_cls
+from axonius_api_client.api.asset_callbacks.compress import get_compression, open_compressed
+from axonius_api_client.api.asset_callbacks.plan import (
+    CallbackPlan,
+    SoftwareWhitelist,
+    get_excluded_keys,
+    is_excluded,
+)
+from axonius_api_client.api.asset_callbacks.rotate import (
+    get_manifest_path,
+    get_part_path,
+    write_manifest,
+)
 from axonius_api_client.constants.api import FIELD_TRIM_LEN
 from axonius_api_client.constants.fields import SCHEMAS_CUSTOM
 from axonius_api_client.exceptions import ApiError
@@ -57,6 +73,111 @@ def get_cbobj_main(apiobj, cbexport, getargs=None, state=None, store=None):
     return cbobj
 
 
+class TestCompress:
+    @pytest.mark.parametrize(
+        "value,path,expected",
+        [
+            (None, "x.csv.gz", "gzip"),
+            (None, "x.csv.ZST", "zstd"),
+            (None, "x.csv", None),
+            ("", None, None),
+            ("none", "x.csv.gz", None),
+            ("xz", "x.csv", "xz"),
+            (".bz2", "x.csv", "bz2"),
+        ],
+    )
+    def test_get_compression(self, value, path, expected):
+        assert get_compression(value=value, path=path) == expected
+
+    def test_get_compression_invalid(self):
+        with pytest.raises(ApiError):
+            get_compression(value="badwolf", path=None)
+
+    @pytest.mark.parametrize(
+        "name,decompress", [("gzip", gzip.decompress), ("xz", lzma.decompress)]
+    )
+    def test_open_compressed(self, name, decompress, tmp_path):
+        path = tmp_path / "badwolf"
+        fd = open_compressed(path=path, name=name, level=1)
+        for idx in range(1000):
+            fd.write(f"{idx},badwolf\n")
+        fd.close()
+        lines = decompress(path.read_bytes()).decode("utf-8").splitlines()
+        assert lines == [f"{idx},badwolf" for idx in range(1000)]
+
+    def test_compress_error(self, tmp_path):
+        fd = open_compressed(path=tmp_path / "badwolf", name="gzip")
+        fd.buffer.raw.compressor.close()
+        fd.write("badwolf")
+        with pytest.raises(ApiError):
+            fd.close()
+
+
+class TestRotate:
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("badwolf.csv", "badwolf.part0002.csv"),
+            ("badwolf.csv.gz", "badwolf.part0002.csv.gz"),
+            ("bad.wolf.json", "bad.wolf.part0002.json"),
+            ("badwolf", "badwolf.part0002"),
+        ],
+    )
+    def test_get_part_path(self, name, expected, tmp_path):
+        assert get_part_path(path=tmp_path / name, number=2) == tmp_path / expected
+
+    def test_get_manifest_path(self, tmp_path):
+        path = get_manifest_path(path=tmp_path / "badwolf.csv.zst")
+        assert path == tmp_path / "badwolf.manifest.json"
+
+    def test_write_manifest(self, tmp_path):
+        path = tmp_path / "badwolf.manifest.json"
+        parts = [{"file": "a", "rows": 2}, {"file": "b", "rows": 1}]
+        write_manifest(path=path, export="csv", parts=parts, finished=True)
+        manifest = json.loads(path.read_text())
+        assert manifest["rows_total"] == 3
+        assert manifest["parts_total"] == 2
+        assert manifest["finished"]
+        assert [x.name for x in tmp_path.iterdir()] == [path.name]
+
+
+class TestPlanExcludes:
+    def test_get_excluded_keys(self):
+        schemas = [{"name_qual": "a", "name": "x"}, {"name_qual": "b", "name": None}]
+        excluded_keys = get_excluded_keys(excluded_schemas=schemas, find_keys=["name_qual", "name"])
+        assert excluded_keys == {"name_qual": frozenset(["a", "b"]), "name": frozenset(["x"])}
+
+    def test_is_excluded(self):
+        excluded_keys = {"name_qual": frozenset(["a"]), "name": frozenset()}
+        assert is_excluded(schema={"name_qual": "a", "name": "z"}, excluded_keys=excluded_keys)
+        assert not is_excluded(schema={"name_qual": "b", "name": "z"}, excluded_keys=excluded_keys)
+        assert not is_excluded(schema={"name": ""}, excluded_keys=excluded_keys)
+
+
+class TestSoftwareWhitelist:
+    def test_get_report(self):
+        matcher = SoftwareWhitelist.from_whitelist(whitelist=["^chrome", "firefox", "zoom"])
+        names = ["Google Chrome", "Chrome 90", "Mozilla FIREFOX", "notepad", "notepad"]
+        missing, extras = matcher.get_report(names=names)
+        assert missing == ["zoom"]
+        assert extras == ["Google Chrome", "notepad"]
+        assert matcher.cache["Chrome 90"] == frozenset([0])
+        assert matcher.cache["notepad"] == frozenset()
+
+    def test_get_report_no_names(self):
+        matcher = SoftwareWhitelist.from_whitelist(whitelist=["chrome", "chrome"])
+        assert matcher.get_report(names=[]) == (["chrome"], [])
+
+    def test_get_report_groups(self):
+        matcher = SoftwareWhitelist.from_whitelist(whitelist=[r"(a)\1", r"(b)\1"])
+        assert matcher.combined is None
+        assert matcher.get_report(names=["xbb"]) == (["(a)\\1"], [])
+
+    def test_invalid_regex(self):
+        with pytest.raises(ApiError):
+            SoftwareWhitelist.from_whitelist(whitelist=["chrome", "[bad"])
+
+
 @pytest.mark.slow
 @pytest.mark.trylast
 class Callbacks:
@@ -112,6 +233,23 @@ class CallbacksFull(Callbacks):
             assert schema in cbobj.custom_schemas
             assert schema in cbobj.final_schemas
 
+    def test_add_report_adapters_missing_summary(self, cbexport, apiobj, caplog):
+        test_row = copy.deepcopy(get_rows_exist(apiobj=apiobj))
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj, cbexport=cbexport, getargs={"report_adapters_missing": True}
+        )
+
+        rows = cbobj.add_report_adapters_missing(rows=[test_row, copy.deepcopy(test_row)])
+        missing = rows[0][SCHEMAS_CUSTOM["report_adapters_missing"]["adapters_missing"]["name"]]
+        assert set(missing).isdisjoint(test_row["adapters"])
+
+        summary = cbobj.get_report_adapters_missing_summary()
+        assert summary == {"rows": 2, "adapters": {x: 2 for x in sorted(missing)}}
+
+        cbobj.echo_report_adapters_missing_summary()
+        log_check(caplog=caplog, entries=["missing adapters out of 2 assets"], exists=True)
+
     def test_echo_page_progress_0(self, cbexport, apiobj, caplog):
         cbobj = self.get_cbobj(
             apiobj=apiobj,
@@ -152,6 +290,26 @@ class CallbacksFull(Callbacks):
         cbobj.echo_page_progress()
         log_check(caplog=caplog, entries=["PROGRESS: "], exists=False)
 
+    def test_echo_page_progress_1000_match_page(self, cbexport, apiobj, caplog):
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"page_progress": 1000},
+            state={"rows_processed_total": 1010, "rows_to_fetch_total": 10000},
+        )
+        cbobj.echo_page_progress(row_count=20)
+        log_check(caplog=caplog, entries=["PROGRESS: "], exists=True)
+
+    def test_echo_page_progress_1000_no_match_page(self, cbexport, apiobj, caplog):
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"page_progress": 1000},
+            state={"rows_processed_total": 1030, "rows_to_fetch_total": 10000},
+        )
+        cbobj.echo_page_progress(row_count=20)
+        log_check(caplog=caplog, entries=["PROGRESS: "], exists=False)
+
     def test_do_add_null_values_true(self, cbexport, apiobj):
         field_complex = apiobj.FIELD_COMPLEX
         original_row = get_rows_exist(apiobj=apiobj, fields=field_complex)
@@ -269,6 +427,10 @@ class CallbacksFull(Callbacks):
         rows = cbobj.process_tags_to_add(rows=test_row)
         assert rows[0] == original_row
         assert {apiobj.FIELD_AXON_ID: row_id} in cbobj.TAG_ROWS_ADD
+        assert row_id in cbobj.TAG_IDS_ADD
+
+        cbobj.process_tags_to_add(rows=test_row)
+        assert len(cbobj.TAG_ROWS_ADD) == 1
 
         cbobj.do_tagging()
         log_entries = ["tags.*assets"]
@@ -302,6 +464,35 @@ class CallbacksFull(Callbacks):
         for tag in tags:
             assert tag not in row_tags
 
+    def test_process_tags_chunked(self, cbexport, apiobj, caplog):
+        original_row = get_rows_exist(apiobj=apiobj)
+        row_id = original_row[apiobj.FIELD_AXON_ID]
+        tags = [f"badwolf_{random_string(9)}"]
+
+        for tags_background in [False, True]:
+            getargs = {
+                "tags_add": tags,
+                "tags_remove": tags,
+                "tags_chunk_size": 1,
+                "tags_background": tags_background,
+            }
+            cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs=getargs)
+
+            cbobj.process_tags_to_add(rows=copy.deepcopy(original_row))
+            cbobj.process_tags_to_remove(rows=copy.deepcopy(original_row))
+            assert not cbobj.TAG_ROWS_ADD
+            assert not cbobj.TAG_ROWS_REMOVE
+            assert row_id in cbobj.TAG_IDS_ADD
+            assert row_id in cbobj.TAG_IDS_REMOVE
+
+            cbobj.do_tagging()
+            assert not cbobj.TAG_FUTURES
+            assert cbobj.STATE["tags_add_flushes"] == 1
+            assert cbobj.STATE["tags_add_assets"] == 1
+            assert cbobj.STATE["tags_remove_flushes"] == 1
+            assert cbobj.STATE["tags_remove_assets"] == 1
+            log_check(caplog=caplog, entries=["tags.*assets"], exists=True)
+
     def test_process_tags_to_add_empty(self, cbexport, apiobj, caplog):
         original_row = get_rows_exist(apiobj=apiobj)
         test_row = copy.deepcopy(original_row)
@@ -386,6 +577,54 @@ class CallbacksFull(Callbacks):
         for item in test_row[field_complex]:
             assert sub_name not in item
 
+    def test_plan(self, cbexport, apiobj):
+        field_complex = apiobj.FIELD_COMPLEX
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            store={"fields": [*apiobj.fields_default, field_complex]},
+            getargs={"field_excludes": [apiobj.FIELD_AXON_ID], "field_flatten": True},
+        )
+
+        plan = cbobj.plan
+        assert isinstance(plan, CallbackPlan)
+        assert cbobj.plan is plan
+        assert pickle.loads(pickle.dumps(plan)) == plan
+
+        assert apiobj.FIELD_AXON_ID in plan.excludes
+        assert field_complex in [x.name_qual for x in plan.flattens]
+        assert "do_flatten_fields" not in plan.callbacks_disabled
+        assert "do_join_values" in plan.callbacks_disabled
+
+        names = [x.__name__ for x in cbobj.callbacks_enabled]
+        assert "do_flatten_fields" in names
+        assert "do_join_values" not in names
+
+    def test_callback_workers(self, cbexport, apiobj):
+        field_complex = apiobj.FIELD_COMPLEX
+        original_rows = get_rows_exist(apiobj=apiobj, fields=field_complex, max_rows=5)
+        getargs = {"field_flatten": True, "field_join": True, "field_null": True}
+        store = {"fields": [*apiobj.fields_default, field_complex]}
+
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport="base", getargs=getargs, store=store)
+        rows = cbobj.do_row(rows=copy.deepcopy(original_rows))
+        assert cbobj.callback_workers is None
+
+        getargs_workers = {**getargs, "callback_workers": 2}
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport="base", getargs=getargs_workers, store=store)
+        assert not cbobj.resumable
+        rows_workers = []
+        for page in [original_rows[:3], original_rows[3:]]:
+            rows_workers += cbobj.do_row(rows=copy.deepcopy(page))
+        assert "do_flatten_fields" in cbobj.callback_workers.names
+        assert cbobj.callback_workers.executor
+        rows_workers += cbobj.process_pending()
+        assert not cbobj.callback_workers.pending
+        cbobj.close_callback_workers()
+        assert not cbobj.callback_workers.executor
+
+        assert rows_workers == rows
+
     def test_do_join_values_true(self, cbexport, apiobj):
         original_row = get_rows_exist(apiobj=apiobj)
         test_row = copy.deepcopy(original_row)
@@ -1072,6 +1311,40 @@ class Exports:
         cbobj._fd.close()
         assert export_file.read_text() == "\n "
 
+    def test_fd_path_compress(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.txt.gz"
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"export_file": export_file, "export_fd_close": False},
+        )
+
+        cbobj.open_fd()
+
+        assert cbobj._file_path.name == export_file.name
+        assert cbobj._file_mode == "Created new file, compressed with gzip"
+        assert cbobj._fd_close
+        assert not cbobj.resumable
+
+        cbobj._fd.write("badwolf")
+        cbobj.close_fd()
+        assert gzip.decompress(export_file.read_bytes()) == b"badwolf\n"
+
+    def test_fd_path_compress_added(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.txt"
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"export_file": export_file, "export_compress": "xz"},
+        )
+
+        cbobj.open_fd()
+        cbobj.close_fd()
+        assert cbobj._file_path.name == "badwolf.txt.xz"
+        assert lzma.decompress(cbobj._file_path.read_bytes()) == b"\n"
+
     def test_fd_path_backup_true(self, cbexport, apiobj, tmp_path):
         export_file = tmp_path / "badwolf.txt"
         export_file.touch()
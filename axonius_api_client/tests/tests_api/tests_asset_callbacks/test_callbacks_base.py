@@ -31,6 +31,17 @@ class TestCallbacksBase(CallbacksFull):
         assert rows_proc == rows_orig
         cbobj.stop()
 
+    def test_page_as_is(self, cbexport, apiobj, caplog):
+        cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport, getargs={})
+        cbobj.start()
+
+        rows_orig = get_rows_exist(apiobj=apiobj, max_rows=5)
+        rows_proc = cbobj.process_page(rows=copy.deepcopy(rows_orig))
+
+        assert rows_proc == rows_orig
+        assert cbobj.STATE["rows_processed_total"] == len(rows_orig)
+        cbobj.stop()
+
     def test_row_fully_loaded(self, cbexport, apiobj, caplog):
         getargs = {
             "field_excludes": ["adapters"],
@@ -56,6 +56,34 @@ class TestCallbacksCsv(Callbacks, Exports):
         output = io_fd.getvalue()
         assert output.endswith("\n\n")
 
+    def test_write_rows(self, cbexport, apiobj):
+        io_fd = io.StringIO()
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={
+                "export_fd": io_fd,
+                "export_fd_close": False,
+                "export_schema": False,
+                "csv_key_miss": "missing",
+            },
+        )
+        cbobj.start()
+        cbobj.do_start()
+        columns = list(cbobj._stream.fieldnames)
+        full = {x: "x" for x in columns}
+
+        cbobj.write_rows(rows=[full, {columns[0]: "y"}, {**full, "badwolf": "z"}, full])
+        assert cbobj._stream.fieldnames == [*columns, "badwolf"]
+        assert "badwolf" in cbobj._columns_known
+
+        lines = io_fd.getvalue().splitlines()[1:]
+        rest = len(columns) - 1
+        assert lines[0] == ",".join(['"x"'] * len(columns))
+        assert lines[1] == ",".join(['"y"', *['"missing"'] * rest])
+        assert lines[2] == ",".join(['"x"'] * len(columns) + ['"z"'])
+        assert lines[3] == ",".join(['"x"'] * len(columns) + ['"missing"'])
+
     def test_row_no_titles(self, cbexport, apiobj):
         rows = get_rows_exist(apiobj=apiobj, max_rows=5)
 
@@ -46,6 +46,50 @@ class TestCallbacksJson(Callbacks, Exports):
         stop_val = output.splitlines()[-2:]
         assert "]" in stop_val
 
+    def test_page_rotate_rows(self, cbexport, apiobj, tmp_path):
+        original_rows = get_rows_exist(apiobj=apiobj, max_rows=5)
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={
+                "export_file": "badwolf.json",
+                "export_path": tmp_path,
+                "export_rotate_rows": 2,
+            },
+        )
+        cbobj.start()
+        cbobj.process_page(rows=copy.deepcopy(original_rows))
+        cbobj.stop()
+
+        manifest = json.loads((tmp_path / "badwolf.manifest.json").read_text())
+        assert manifest["finished"]
+        assert manifest["rows_total"] == len(original_rows)
+        assert manifest["parts_total"] == (len(original_rows) + 1) // 2
+
+        rows = []
+        for part in manifest["parts"]:
+            part_rows = json.loads((tmp_path / part["file"]).read_text())
+            assert len(part_rows) == part["rows"]
+            rows += part_rows
+        assert rows == original_rows
+
+    def test_page_as_is(self, cbexport, apiobj):
+        io_fd = io.StringIO()
+        original_rows = get_rows_exist(apiobj=apiobj, max_rows=5)
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj, cbexport=cbexport, getargs={"export_fd": io_fd, "export_fd_close": False}
+        )
+        cbobj.start()
+
+        rows_ret = cbobj.process_page(rows=copy.deepcopy(original_rows))
+        assert rows_ret == [{"internal_axon_id": x["internal_axon_id"]} for x in original_rows]
+
+        cbobj.stop()
+        output_json = json.loads(io_fd.getvalue())
+        assert output_json == original_rows
+
     def test_row_fully_loaded(self, cbexport, apiobj):
         io_fd = io.StringIO()
         original_rows = get_rows_exist(apiobj=apiobj, max_rows=5)
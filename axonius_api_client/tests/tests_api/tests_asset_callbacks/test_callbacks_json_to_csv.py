@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
+import csv
 import io
 
 import pytest
@@ -39,3 +40,26 @@ class TestCallbacksJsonToCsv(Callbacks, Exports):
         start_val = io_fd.getvalue().splitlines()[0]
         for i in cbobj.final_columns:
             assert f'"{i}"' in start_val
+
+    def test_page_compress(self, cbexport, apiobj):
+        rows = get_rows_exist(apiobj=apiobj, max_rows=5)
+
+        io_fd = io.StringIO()
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            store={"fields": apiobj.fields_default},
+            getargs={"export_fd": io_fd, "export_fd_close": False, "json_to_csv_compress": "gzip"},
+        )
+        cbobj.start()
+        temp_path = cbobj._temp_path
+
+        new_rows = cbobj.process_page(rows=rows)
+        assert new_rows == [{apiobj.FIELD_AXON_ID: x[apiobj.FIELD_AXON_ID]} for x in rows]
+
+        cbobj.stop()
+        assert not temp_path.exists()
+
+        lines = [x for x in csv.reader(io.StringIO(io_fd.getvalue())) if x]
+        assert lines[0] == cbobj.csv_columns
+        assert len(lines[1:]) == len(rows)
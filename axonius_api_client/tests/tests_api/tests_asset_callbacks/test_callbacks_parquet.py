@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks.base_parquet import ParquetColumn
+from axonius_api_client.exceptions import ApiError
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class TestParquetColumn:
+    def test_scalar(self):
+        column = ParquetColumn(
+            pa=pa, schema={"name": "x", "type_norm": "integer"}, is_list=False, subs=[]
+        )
+        assert column.arrow_type == pa.int64()
+        assert column.convert("3") == 3
+        assert column.convert(["4"]) == 4
+        assert column.convert("badwolf") is None
+        assert column.convert(None) is None
+
+    def test_list(self):
+        column = ParquetColumn(
+            pa=pa, schema={"name": "x", "type_norm": "array_string"}, is_list=False, subs=[]
+        )
+        assert column.arrow_type == pa.list_(pa.string())
+        assert column.convert("a") == ["a"]
+        assert column.convert(["a", 1]) == ["a", "1"]
+
+    def test_complex(self):
+        sub = ParquetColumn(
+            pa=pa, schema={"name": "y", "type_norm": "boolean"}, is_list=False, subs=[]
+        )
+        column = ParquetColumn(
+            pa=pa,
+            schema={"name": "x", "type_norm": "array_object", "is_complex": True},
+            is_list=False,
+            subs=[sub],
+        )
+        assert column.arrow_type == pa.list_(pa.struct([pa.field("y", pa.bool_())]))
+        assert column.convert([{"y": True, "z": 1}, "badwolf"]) == [{"y": True}, None]
+
+
+class TestCallbacksParquet:
+    @pytest.fixture(params=["api_devices", "api_users"])
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        return "parquet"
+
+    def test_parquet(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.parquet"
+        rows = apiobj.get(max_rows=1, export=cbexport, export_file=export_file)
+        for row in rows:
+            assert row.pop(apiobj.FIELD_AXON_ID)
+            assert not row
+        assert export_file.is_file()
+        table = pq.read_table(export_file)
+        assert table.num_rows == 1
+        assert apiobj.FIELD_AXON_ID in table.column_names
+
+    def test_parquet_added(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf"
+        rows = apiobj.get(max_rows=1, export=cbexport, export_file=export_file)
+        for row in rows:
+            assert row.pop(apiobj.FIELD_AXON_ID)
+            assert not row
+        assert (tmp_path / "badwolf.parquet").is_file()
+
+    def test_fail_no_export_file(self, cbexport, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(max_rows=1, export=cbexport)
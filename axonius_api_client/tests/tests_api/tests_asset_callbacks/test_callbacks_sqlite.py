@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import json
+import sqlite3
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks.base_sqlite import Sqlite, quote
+from axonius_api_client.exceptions import ApiError
+
+
+class TestSqliteTools:
+    def test_quote(self):
+        assert quote('bad"wolf') == '"bad""wolf"'
+
+    @pytest.mark.parametrize("value", [[1, "a"], {"a": None}])
+    def test_get_sqlite_value_json(self, value):
+        assert json.loads(Sqlite.get_sqlite_value(value)) == value
+
+    def test_get_sqlite_value(self):
+        assert Sqlite.get_sqlite_value(1) == 1
+
+
+class TestCallbacksSqlite:
+    @pytest.fixture(params=["api_devices", "api_users"])
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        return "sqlite"
+
+    def test_sqlite(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.db"
+        table = apiobj.__class__.__name__.lower()
+        for _ in range(2):
+            rows = apiobj.get(
+                max_rows=2,
+                export=cbexport,
+                export_file=export_file,
+                sqlite_indexes=[apiobj.FIELD_ADAPTERS],
+            )
+            for row in rows:
+                assert row.pop(apiobj.FIELD_AXON_ID)
+                assert not row
+
+        conn = sqlite3.connect(str(export_file))
+        count = conn.execute(f"SELECT COUNT(*) FROM {quote(table)}").fetchone()[0]
+        indexes = [x[1] for x in conn.execute(f"PRAGMA index_list({quote(table)})")]
+        conn.close()
+        assert count == len(rows)
+        assert f"ix_{table}_{apiobj.FIELD_ADAPTERS}" in indexes
+
+    def test_sqlite_added(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf"
+        apiobj.get(max_rows=1, export=cbexport, export_file=export_file)
+        assert (tmp_path / "badwolf.sqlite").is_file()
+
+    def test_fail_no_export_file(self, cbexport, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(max_rows=1, export=cbexport)
+
+    def test_fail_explode(self, cbexport, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(
+                max_rows=1,
+                export=cbexport,
+                export_file=tmp_path / "badwolf.db",
+                field_explode=apiobj.FIELD_COMPLEX,
+            )
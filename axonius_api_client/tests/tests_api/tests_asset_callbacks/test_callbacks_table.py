@@ -59,6 +59,81 @@ class TestCallbacksTable(Callbacks, Exports):
         for i in sub_columns:
             assert i in checklines
 
+    def test_page_max_rows(self, cbexport, apiobj):
+        original_rows = get_rows_exist(apiobj=apiobj, max_rows=5)
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"export_fd": io.StringIO(), "export_fd_close": False, "table_max_rows": 4},
+        )
+        cbobj.start()
+
+        rows_ret = cbobj.process_page(rows=copy.deepcopy(original_rows))
+        assert len(rows_ret) == 3
+        assert cbobj.STATE["rows_processed_total"] == 4
+
+        with pytest.raises(StopFetch):
+            cbobj.check_stop()
+
+        with pytest.raises(StopFetch):
+            cbobj.process_page(rows=copy.deepcopy(original_rows))
+
+    def test_page_block_rows(self, cbexport, apiobj):
+        original_rows = get_rows_exist(apiobj=apiobj, max_rows=5)
+        io_fd = io.StringIO()
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={
+                "export_fd": io_fd,
+                "export_fd_close": False,
+                "table_max_rows": 0,
+                "table_block_rows": 2,
+            },
+        )
+        cbobj.start()
+        cbobj.process_page(rows=copy.deepcopy(original_rows[:3]))
+        assert cbobj._tables_written == 1
+        assert len(cbobj._rows) == 1
+
+        cbobj.stop()
+        assert cbobj._tables_written == 2
+        assert cbobj._rows == []
+        assert io_fd.getvalue()
+
+    def test_page_block_rows_default(self, cbexport, apiobj):
+        original_rows = get_rows_exist(apiobj=apiobj, max_rows=5)
+        io_fd = io.StringIO()
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"export_fd": io_fd, "export_fd_close": False, "table_max_rows": 0},
+        )
+        cbobj.start()
+        cbobj.process_page(rows=copy.deepcopy(original_rows))
+        assert cbobj._tables_written == 0
+        assert len(cbobj._rows) == len(original_rows)
+
+        cbobj.stop()
+        assert cbobj._tables_written == 1
+
+    def test_page_return_ids_only(self, cbexport, apiobj):
+        original_rows = get_rows_exist(apiobj=apiobj, max_rows=3)
+        io_fd = io.StringIO()
+
+        cbobj = self.get_cbobj(
+            apiobj=apiobj,
+            cbexport=cbexport,
+            getargs={"export_fd": io_fd, "export_fd_close": False, "table_max_rows": 0},
+        )
+        cbobj.start()
+        rows = cbobj.process_page(rows=copy.deepcopy(original_rows))
+        assert rows == [{"internal_axon_id": x["internal_axon_id"]} for x in original_rows]
+        cbobj.stop()
+
     def test_check_table_format(self, cbexport, apiobj):
         cbobj = self.get_cbobj(apiobj=apiobj, cbexport=cbexport)
         with pytest.raises(ApiError):
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Test suite for assets."""
+import json
+
+import pytest
+
+from axonius_api_client.api.asset_callbacks import Tee, get_callbacks_cls
+from axonius_api_client.api.asset_callbacks.base_tee import get_tee_spec
+from axonius_api_client.exceptions import ApiError
+
+
+class TestTeeTools:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ["csv", {"export": "csv"}],
+            ["csv=", {"export": "csv"}],
+            ["csv = a.csv", {"export": "csv", "export_file": "a.csv"}],
+            ["json=a=b.json", {"export": "json", "export_file": "a=b.json"}],
+            [{"export": "json", "json_flat": True}, {"export": "json", "json_flat": True}],
+        ],
+    )
+    def test_get_tee_spec(self, value, expected):
+        assert get_tee_spec(value) == expected
+
+    @pytest.mark.parametrize("value", ["", "=a.csv", {}, {"export_file": "a.csv"}, 1])
+    def test_get_tee_spec_invalid(self, value):
+        with pytest.raises(ApiError):
+            get_tee_spec(value)
+
+    def test_get_callbacks_cls_list(self):
+        assert get_callbacks_cls(export=["csv", "json"]) is Tee
+
+
+class TestCallbacksTee:
+    @pytest.fixture(params=["api_devices", "api_users"])
+    def apiobj(self, request):
+        return request.getfixturevalue(request.param)
+
+    @pytest.fixture(scope="class")
+    def cbexport(self):
+        return "tee"
+
+    def test_tee(self, apiobj, tmp_path):
+        rows = apiobj.get(
+            max_rows=2,
+            export_path=tmp_path,
+            export=["csv=badwolf.csv", {"export": "json", "export_file": "badwolf.json"}],
+        )
+        for row in rows:
+            assert row.pop(apiobj.FIELD_AXON_ID)
+            assert not row
+
+        assert (tmp_path / "badwolf.csv").is_file()
+        data = json.loads((tmp_path / "badwolf.json").read_text())
+        assert len(data) == len(rows)
+
+    def test_tee_stop(self, cbexport, apiobj, tmp_path):
+        rows = apiobj.get(
+            max_rows=4,
+            page_size=1,
+            export=cbexport,
+            export_path=tmp_path,
+            tee_exports=[
+                {"export": "table", "export_file": "badwolf.txt", "table_max_rows": 2},
+                {"export": "json", "export_file": "badwolf.json"},
+            ],
+        )
+        writers = apiobj.LAST_CALLBACKS.writers
+        assert writers[0].stopped
+        assert not writers[1].stopped
+
+        data = json.loads((tmp_path / "badwolf.json").read_text())
+        assert len(data) == len(rows)
+
+    def test_fail_no_exports(self, cbexport, apiobj):
+        with pytest.raises(ApiError):
+            apiobj.get(max_rows=1, export=cbexport)
+
+    def test_fail_nested(self, cbexport, apiobj):
+        with pytest.raises(ApiError):
+            apiobj.get(max_rows=1, export=cbexport, tee_exports=["tee"])
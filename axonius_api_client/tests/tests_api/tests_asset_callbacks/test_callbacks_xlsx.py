@@ -34,3 +34,11 @@ class TestCallbacksXlsx:
     def test_fail_no_export_file(self, cbexport, apiobj, tmp_path):
         with pytest.raises(ApiError):
             apiobj.get(max_rows=1, export=cbexport)
+
+    def test_xlsx_max_rows(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.xlsx"
+        rows = apiobj.get(max_rows=3, export=cbexport, export_file=export_file, xlsx_max_rows=2)
+        name = apiobj.__class__.__name__
+        worksheets = [x.name for x in apiobj.LAST_CALLBACKS._workbook.worksheets()]
+        assert worksheets == [name, f"{name} 2", f"{name} 3"][: len(rows)]
+        assert export_file.is_file()
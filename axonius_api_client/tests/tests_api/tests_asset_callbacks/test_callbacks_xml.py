@@ -2,6 +2,7 @@
 """Test suite for assets."""
 
 import pytest
+import xmltodict
 
 
 class TestCallbacksXml:
@@ -18,3 +19,18 @@ class TestCallbacksXml:
         rows = apiobj.get(max_rows=1, export=cbexport, export_file=export_file)
         assert isinstance(rows, list)
         assert export_file.is_file()
+
+    def test_stream_pages(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.xml"
+        rows = apiobj.get(max_rows=2, page_size=1, export=cbexport, export_file=export_file)
+        asset_type = apiobj.__class__.__name__.lower()
+        data = xmltodict.parse(export_file.read_text(), force_list=(asset_type,))
+        assert len(data["assets"][asset_type]) == len(rows)
+
+    def test_return_ids_only(self, cbexport, apiobj, tmp_path):
+        export_file = tmp_path / "badwolf.xml"
+        rows = apiobj.get(max_rows=2, export=cbexport, export_file=export_file)
+        assert rows
+        for row in rows:
+            assert row.pop(apiobj.FIELD_AXON_ID)
+            assert not row
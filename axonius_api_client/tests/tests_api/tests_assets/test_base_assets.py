@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 """Test suite for assets."""
 import datetime
+import json
 from typing import Any, List
 
 import pytest
 from axonius_api_client.api import json_api, mixins
+from axonius_api_client.api.api_endpoints import ApiEndpoints
 from axonius_api_client.constants.api import MAX_PAGE_SIZE
 from axonius_api_client.exceptions import ApiError, NotFoundError, StopFetch
 from axonius_api_client.tools import listify
@@ -163,6 +165,12 @@ class AssetsPrivate:
         page2.process_page(state=state1, start_dt=page1.page_start_dt, apiobj=apiobj)
         assert state1["page_number"] == 2
         page2.process_row(state=state1, apiobj=apiobj, row=page2.assets[0])
+        rows = page2.start_rows(state={**state1, "max_rows": 0}, apiobj=apiobj)
+        assert rows == page2.assets
+        state_max = {**state1, "max_rows": 1, "rows_processed_total": 1}
+        assert not page2.start_rows(state=state_max, apiobj=apiobj)
+        page2.process_rows(state=state1, apiobj=apiobj, rows=rows)
+        assert "process_seconds_page" in state1
         page2.process_loop(state=state1, apiobj=apiobj)
         assert state1["page_loop"] == 2
 
@@ -228,6 +236,16 @@ class AssetsPrivate:
         assert isinstance(data, json_api.assets.Count)
         assert isinstance(data.value, int)
 
+    def test_count_history_date(self, apiobj, monkeypatch):
+        history_date = "2022-01-01T00:00:00Z"
+        with monkeypatch.context() as m:
+            m.setattr(
+                ApiEndpoints.assets.count, "perform_request", lambda request_obj, **kw: request_obj
+            )
+            request_obj = apiobj._count(history_date=history_date)
+        assert isinstance(request_obj, json_api.assets.CountRequest)
+        assert request_obj.history == history_date
+
     def test_build_query(self, apiobj):
         pre_query = QUERIES["not_last_seen_day"]
         post_query = QUERIES["not_last_seen_day"]
@@ -348,6 +366,94 @@ class AssetsPublic:
         check_assets(rows)
         assert len(rows) == 20
 
+    def test_get_prefetch_pages(self, apiobj):
+        rows = apiobj.get(page_size=5, max_pages=3)
+        rows_prefetch = apiobj.get(page_size=5, max_pages=3, prefetch_pages=2)
+        check_assets(rows_prefetch)
+        assert len(rows_prefetch) == len(rows) == 15
+        assert [x["internal_axon_id"] for x in rows_prefetch] == [
+            x["internal_axon_id"] for x in rows
+        ]
+
+    def test_get_prefetch_pages_max_rows(self, apiobj):
+        gen = apiobj.get(generator=True, page_size=5, max_rows=7, prefetch_pages=4)
+        rows = [x for x in gen]
+        check_assets(rows)
+        assert len(rows) == 7
+
+    @pytest.mark.parametrize("workers_ordered", [True, False])
+    def test_get_workers(self, apiobj, workers_ordered):
+        rows = apiobj.get(page_size=5, max_pages=3, sort_field=apiobj.FIELD_AXON_ID)
+        rows_workers = apiobj.get(
+            page_size=5, max_pages=3, workers=3, workers_ordered=workers_ordered
+        )
+        check_assets(rows_workers)
+        ids = [x["internal_axon_id"] for x in rows]
+        ids_workers = [x["internal_axon_id"] for x in rows_workers]
+        assert len(ids_workers) == len(set(ids_workers)) == 15
+        if workers_ordered:
+            assert ids_workers == ids
+
+    def test_get_workers_history_days_ago(self, apiobj):
+        if not apiobj.history_dates():
+            pytest.skip(f"No history dates for {apiobj}")
+
+        apiobj.get(history_days_ago=1, page_size=5, max_pages=1, workers=2)
+        initial_count = apiobj.LAST_CALLBACKS.STORE["initial_count"]
+        assert initial_count == apiobj.count(history_days_ago=1)
+
+    def test_get_workers_sort(self, apiobj):
+        apiobj.get(page_size=5, max_pages=1, workers=2)
+        assert apiobj.LAST_CALLBACKS.STORE["sort_field_parsed"] == apiobj.FIELD_AXON_ID
+
+    def test_get_page_size_adaptive(self, apiobj):
+        rows = apiobj.get(page_size_adaptive=True, page_size=10, page_size_min=5, max_pages=3)
+        check_assets(rows)
+        page_sizes = apiobj.LAST_CALLBACKS.STATE["page_sizes"]
+        assert len(page_sizes) == 3
+        for item in page_sizes:
+            assert 5 <= item["page_size"] <= 10
+            assert item["bytes"] > 0
+
+    def test_get_page_size_adaptive_prefetch(self, apiobj):
+        rows = apiobj.get(
+            page_size_adaptive=True, page_size=10, page_size_min=5, max_pages=3, prefetch_pages=2
+        )
+        check_assets(rows)
+        page_sizes = apiobj.LAST_CALLBACKS.STATE["page_sizes"]
+        assert len(page_sizes) == 3
+        assert sum(x["rows"] for x in page_sizes) == len(rows)
+
+    def test_get_page_size_adaptive_workers(self, apiobj):
+        with pytest.raises(ApiError):
+            apiobj.get(page_size_adaptive=True, workers=2)
+
+    def test_get_checkpoint_resume(self, apiobj, tmp_path):
+        checkpoint_file = tmp_path / "checkpoint.json"
+        export_file = tmp_path / "export.json"
+        args = {"export": "json", "json_flat": True, "page_size": 5, "fields_default": True}
+
+        apiobj.get(max_pages=2, export_file=export_file, checkpoint_file=checkpoint_file, **args)
+        checkpoint = json.loads(checkpoint_file.read_text())
+        assert checkpoint["state"]["rows_offset"] == 10
+        assert checkpoint["callbacks"]["export_file"] == str(export_file)
+
+        apiobj.get(max_pages=3, resume_from=checkpoint_file, **args)
+        rows = [json.loads(x) for x in export_file.read_text().splitlines() if x.strip()]
+        ids = [x["internal_axon_id"] for x in rows]
+        assert len(ids) == len(set(ids)) == 15
+
+    def test_get_checkpoint_resume_query_mismatch(self, apiobj, tmp_path):
+        checkpoint_file = tmp_path / "checkpoint.json"
+        apiobj.get(max_pages=1, page_size=1, checkpoint_file=checkpoint_file)
+
+        with pytest.raises(ApiError):
+            apiobj.get(max_pages=1, page_size=1, resume_from=checkpoint_file, query="badwolf")
+
+    def test_get_checkpoint_not_resumable(self, apiobj, tmp_path):
+        with pytest.raises(ApiError):
+            apiobj.get(export="xlsx", checkpoint_file=tmp_path / "checkpoint.json")
+
     def test_get_all_agg(self, apiobj):
         rows = apiobj.get(fields="agg:all", max_rows=5)
         for row in rows:
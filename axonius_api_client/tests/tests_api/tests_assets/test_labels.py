@@ -3,6 +3,7 @@
 import pytest
 
 from axonius_api_client.api import json_api
+from axonius_api_client.exceptions import ApiError
 
 
 class LabelsPrivate:
@@ -13,6 +14,12 @@ class LabelsPrivate:
             assert isinstance(x, json_api.generic.StrValue)
             assert x.value
 
+    def test_private_get_chunks(self, apiobj):
+        rows = [{"internal_axon_id": "a"}, "b", {"internal_axon_id": "c"}]
+        assert apiobj.labels._get_chunks(rows=rows, chunk_size=0) == [["a", "b", "c"]]
+        assert apiobj.labels._get_chunks(rows=rows, chunk_size=3) == [["a", "b", "c"]]
+        assert apiobj.labels._get_chunks(rows=rows, chunk_size=2) == [["a", "b"], ["c"]]
+
     def test_private_add_get_remove(self, apiobj):
         labels = ["badwolf1", "badwolf2"]
 
@@ -120,6 +127,52 @@ class LabelsPublic:
         for label in labels:
             assert label not in all_labels_post_remove
 
+    def test_add_remove_chunk_size(self, apiobj):
+        labels = ["badwolf4"]
+
+        assets = apiobj.get(max_rows=2)
+        asset_ids = [x["internal_axon_id"] for x in assets]
+
+        add_label_result = apiobj.labels.add(labels=labels, rows=assets, chunk_size=1)
+        assert add_label_result == len(assets)
+
+        assets_added = apiobj.get_by_values(values=labels, field="labels", fields="labels")
+        assert sorted(x["internal_axon_id"] for x in assets_added) == sorted(asset_ids)
+
+        remove_label_result = apiobj.labels.remove(labels=labels, rows=assets, chunk_size=1)
+        assert remove_label_result == len(assets)
+
+        assets_removed = apiobj.get_by_values(values=labels, field="labels", fields="labels")
+        assert not assets_removed
+
+    @pytest.mark.parametrize("local", [False, True])
+    def test_add_remove_by_query(self, apiobj, local):
+        labels = ["badwolf3"]
+
+        asset = apiobj.get(max_rows=1)[0]
+        asset_id = asset["internal_axon_id"]
+        query = f'(internal_axon_id == "{asset_id}")'
+
+        add_label_result = apiobj.labels.add_by_query(query=query, labels=labels, local=local)
+        assert add_label_result == 1
+
+        assets_added = apiobj.get_by_values(values=labels, field="labels", fields="labels")
+        assert asset_id in [x["internal_axon_id"] for x in assets_added]
+
+        label_query = '(labels == "badwolf3")'
+        remove_label_result = apiobj.labels.remove_by_query(
+            query=label_query, labels=labels, local=local, chunk_size=1
+        )
+        assert remove_label_result >= 1
+
+        assets_removed = apiobj.get_by_values(values=labels, field="labels", fields="labels")
+        assert not assets_removed
+
+    @pytest.mark.parametrize("query", [None, "", "  "])
+    def test_add_by_query_empty(self, apiobj, query):
+        with pytest.raises(ApiError):
+            apiobj.labels.add_by_query(query=query, labels=["badwolf3"])
+
 
 class TestLabelsDevicesPrivate(LabelsPrivate):
     @pytest.fixture(scope="class")
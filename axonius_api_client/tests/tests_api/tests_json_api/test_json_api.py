@@ -212,3 +212,36 @@ class TestJsonApi:
         exp = {"page[limit]": 20, "page[offset]": 3, "get_metadata": True}
         ret = data.dump_request_params()
         assert ret == exp
+
+
+class TestAssetsPage:
+    DATA = {
+        "data": [{"type": "assets", "attributes": {"internal_axon_id": str(x)}} for x in range(3)],
+        "meta": {"page": {"number": 1, "size": 3, "totalPages": 1, "totalResources": 3}},
+    }
+
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_load_response(self, strict):
+        page = json_api.assets.AssetsPage.load_response(data=self.DATA, http=None, strict=strict)
+        assert isinstance(page, json_api.assets.AssetsPage)
+        assert page.assets == [x["attributes"] for x in self.DATA["data"]]
+        assert page.meta == self.DATA["meta"]
+        assert page.empty_response is False
+        assert page.asset_count_page == 3
+        assert page.page_number == 1
+        assert page.HTTP is None
+
+    def test_load_response_empty(self):
+        page = json_api.assets.AssetsPage.load_response(data={"data": None}, http=None)
+        assert page.empty_response is True
+        assert page.assets == []
+        assert page.meta == {}
+
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_load_response_invalid(self, strict):
+        data = {"data": [{"type": "assets", "attributes": "badwolf"}]}
+        with pytest.raises(SchemaError):
+            json_api.assets.AssetsPage.load_response(data=data, http=None, strict=strict)
+
+        with pytest.raises(SchemaError):
+            json_api.assets.AssetsPage.load_response(data={"data": ["x"]}, http=None)
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client.tools."""
+import asyncio
 import logging
 
 import pytest
 
+from axonius_api_client.async_connect import AsyncConnect
 from axonius_api_client.connect import Connect
-from axonius_api_client.exceptions import ConnectError, InvalidCredentials
+from axonius_api_client.exceptions import ApiError, ConnectError, InvalidCredentials
 from axonius_api_client.http import requests
 
 from ..utils import IS_LINUX, get_key_creds, get_url
@@ -126,3 +128,42 @@ class TestConnect:
         reason = Connect._get_exc_reason(exc)
 
         assert format(reason) == "badwolf"
+
+
+class TestAsyncConnect:
+    def test_no_start(self, request):
+        ax_url = get_url(request)
+
+        c = AsyncConnect(url=ax_url, key=BAD_CRED, secret=BAD_CRED, workers=2)
+
+        assert c.STARTED is False
+        assert c.HTTP.http is c.client.HTTP
+        assert "Not connected" in str(c)
+        with pytest.raises(ApiError):
+            c.devices
+        asyncio.run(c.close())
+
+    def test_start(self, request):
+        ax_url = get_url(request)
+
+        async def run():
+            async with AsyncConnect(url=ax_url, certwarn=False, **get_key_creds(request)) as c:
+                assert c.STARTED is True
+                count = await c.devices.count()
+                rows = [row async for row in c.devices.aget(max_rows=1)]
+                return count, rows
+
+        count, rows = asyncio.run(run())
+        assert isinstance(count, int)
+        assert len(rows) == min(count, 1)
+
+    def test_aget_not_async(self, request):
+        ax_url = get_url(request)
+
+        async def run():
+            async with AsyncConnect(url=ax_url, certwarn=False, **get_key_creds(request)) as c:
+                async for row in c.devices.aget(workers=2):
+                    pass
+
+        with pytest.raises(ApiError):
+            asyncio.run(run())
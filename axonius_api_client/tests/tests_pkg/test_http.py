@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 """Test suite for axonius_api_client.http."""
+import asyncio
 import logging
 import sys
+import threading
 
 import pytest
 import requests
 
 from axonius_api_client.exceptions import HttpError
-from axonius_api_client.http import Http
+from axonius_api_client.http import AsyncHttp, Http
 from axonius_api_client.parsers.url_parser import UrlParser
 from axonius_api_client.version import __version__
 
@@ -47,6 +49,68 @@ class TestHttp:
         http = Http(url=ax_url)
         assert __version__ in http.user_agent
 
+    def test_clone(self, request):
+        """Test clone has its own session with the same headers."""
+        ax_url = get_url(request)
+
+        http = Http(url=ax_url)
+        http.session.headers["api-key"] = "x"
+        new = http.clone()
+
+        assert new.session is not http.session
+        assert new.session.headers["api-key"] == "x"
+        assert new.url == http.url
+        assert new.HISTORY is not http.HISTORY
+
+    def test_pool_settings(self, request):
+        """Test pool settings are used by the adapter mounted to the session."""
+        ax_url = get_url(request)
+
+        http = Http(url=ax_url, pool_connections=3, pool_maxsize=20, pool_block=True)
+        adapter = http.session.get_adapter(http.url)
+
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 20
+        assert adapter._pool_block is True
+        assert adapter is not Http(url=ax_url).session.get_adapter(http.url)
+
+    def test_pool_shared(self, request):
+        """Test pool_shared=True shares the adapter but not the session."""
+        ax_url = get_url(request)
+
+        http1 = Http(url=ax_url, pool_shared=True, pool_maxsize=11)
+        http2 = Http(url=ax_url, pool_shared=True, pool_maxsize=11)
+        http3 = Http(url=ax_url, pool_shared=True, pool_maxsize=12)
+
+        adapter1 = http1.session.get_adapter(http1.url)
+        assert adapter1 is http2.session.get_adapter(http2.url)
+        assert adapter1 is http1.clone().session.get_adapter(http1.url)
+        assert adapter1 is not http3.session.get_adapter(http3.url)
+        assert http1.session is not http2.session
+
+    def test_pool_shared_close_clone(self, request):
+        """Test closing a clone with pool_shared=True keeps the pools of the shared adapter."""
+        ax_url = get_url(request)
+
+        http = Http(url=ax_url, pool_shared=True, pool_maxsize=13)
+        adapter = http.session.get_adapter(http.url)
+        adapter.poolmanager.connection_from_url(http.url)
+        assert len(adapter.poolmanager.pools) == 1
+
+        http.clone().close()
+        assert len(adapter.poolmanager.pools) == 1
+        assert http.session.get_adapter(http.url) is adapter
+
+    def test_close_clone(self, request):
+        """Test closing a clone with pool_shared=False closes the pools of its own adapter."""
+        ax_url = get_url(request)
+
+        new = Http(url=ax_url).clone()
+        adapter = new.session.get_adapter(new.url)
+        adapter.poolmanager.connection_from_url(new.url)
+        new.close()
+        assert len(adapter.poolmanager.pools) == 0
+
     def test_certwarn_true(self, request, httpbin_secure):
         """Test quiet_urllib=False shows warning from urllib3."""
         url = httpbin_secure.url
@@ -266,3 +330,151 @@ class TestHttp:
 
         entries = ["REQUEST BODY:.*"]
         log_check(caplog, entries, exists=False)
+
+
+class TestHttpRetry:
+    """Test Http retries."""
+
+    @pytest.fixture
+    def http(self, request):
+        """Http with no wait between retries."""
+        return Http(url=get_url(request), retry_backoff_factor=0, retry_jitter=0)
+
+    @staticmethod
+    def mock_send(monkeypatch, http, results):
+        sent = []
+
+        def send(request, **kwargs):
+            sent.append(request)
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+
+            response = requests.Response()
+            response.status_code = result
+            response.request = request
+            response.url = request.url
+            response._content = b"{}"
+            return response
+
+        monkeypatch.setattr(http.session, "send", send)
+        return sent
+
+    def test_retry_status(self, http, monkeypatch):
+        """Test idempotent request is retried on retry status codes."""
+        sent = self.mock_send(monkeypatch, http, [503, 502, 200])
+        response = http(method="get")
+        assert response.status_code == 200
+        assert len(sent) == 3
+
+    def test_retry_exhausted(self, http, monkeypatch):
+        """Test last response is returned when attempts run out."""
+        http.RETRY_MAX_ATTEMPTS = 2
+        sent = self.mock_send(monkeypatch, http, [503, 503, 200])
+        response = http(method="get")
+        assert response.status_code == 503
+        assert len(sent) == 2
+
+    def test_retry_not_idempotent(self, http, monkeypatch):
+        """Test non idempotent request is not retried."""
+        sent = self.mock_send(monkeypatch, http, [503, 200])
+        response = http(method="post")
+        assert response.status_code == 503
+        assert len(sent) == 1
+
+    def test_retry_idempotent_post(self, http, monkeypatch):
+        """Test request with idempotent=True is retried."""
+        sent = self.mock_send(monkeypatch, http, [504, 200])
+        response = http(method="post", idempotent=True)
+        assert response.status_code == 200
+        assert len(sent) == 2
+
+    def test_retry_connection_error(self, http, monkeypatch):
+        """Test idempotent request is retried on connection errors."""
+        sent = self.mock_send(monkeypatch, http, [requests.exceptions.ConnectionError(), 200])
+        response = http(method="get")
+        assert response.status_code == 200
+        assert len(sent) == 2
+
+    def test_retry_connection_error_exhausted(self, http, monkeypatch):
+        """Test connection error is raised when attempts run out."""
+        http.RETRY_MAX_ATTEMPTS = 1
+        self.mock_send(monkeypatch, http, [requests.exceptions.ReadTimeout(), 200])
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            http(method="get")
+
+    def test_retry_after(self, http):
+        """Test Retry-After header as seconds and as HTTP date."""
+        response = requests.Response()
+        assert http.get_retry_after(response=response) is None
+
+        response.headers["Retry-After"] = "7"
+        assert http.get_retry_after(response=response) == 7
+        assert http.get_retry_wait(attempt=1, response=response) == 7
+
+        http.RETRY_BACKOFF_MAX = 5
+        assert http.get_retry_wait(attempt=1, response=response) == 5
+
+        response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert http.get_retry_after(response=response) < 0
+        assert http.get_retry_wait(attempt=1, response=response) == 0
+
+        response.headers["Retry-After"] = "badwolf"
+        assert http.get_retry_after(response=response) is None
+
+    def test_retry_wait_backoff(self, http):
+        """Test exponential backoff with no jitter."""
+        http.RETRY_BACKOFF_FACTOR = 2
+        assert http.get_retry_wait(attempt=1) == 2
+        assert http.get_retry_wait(attempt=3) == 8
+
+
+class TestAsyncHttp:
+    """Test AsyncHttp."""
+
+    def test_call(self, request, monkeypatch):
+        """Test requests are sent by a clone of the wrapped Http in a thread."""
+        http = Http(url=get_url(request), retry_backoff_factor=0, retry_jitter=0)
+        async_http = AsyncHttp(http=http, workers=1)
+        clone = async_http.executor.submit(async_http.get_http).result()
+        sent = TestHttpRetry.mock_send(monkeypatch, clone, [503, 200])
+
+        response = asyncio.run(async_http(method="get"))
+        async_http.close()
+
+        assert response.status_code == 200
+        assert len(sent) == 2
+        assert clone is not http
+        assert clone.session is not http.session
+        assert http.LAST_RESPONSE is None
+        assert not async_http.clones
+        assert async_http.url == http.url
+        assert "workers=1" in str(async_http)
+
+    def test_get_http_per_thread(self, request):
+        """Test each thread gets its own clone of the wrapped Http."""
+        http = Http(url=get_url(request))
+        async_http = AsyncHttp(http=http, workers=2)
+        barrier = threading.Barrier(2)
+
+        def get_http():
+            barrier.wait(timeout=5)
+            return async_http.get_http()
+
+        clones = [x.result() for x in [async_http.executor.submit(get_http) for _ in range(2)]]
+        assert clones[0] is not clones[1]
+        assert http not in clones
+        assert async_http.clones == clones or async_http.clones == clones[::-1]
+        async_http.close()
+
+    def test_run(self, request):
+        """Test blocking functions are run in the thread pool one at a time."""
+        async_http = AsyncHttp(http=Http(url=get_url(request)), workers=2)
+
+        async def run():
+            return await asyncio.gather(
+                async_http.run(sum, [1, 2]), async_http.run(max, 3, 4, key=None)
+            )
+
+        assert asyncio.run(run()) == [3, 4]
+        async_http.close()
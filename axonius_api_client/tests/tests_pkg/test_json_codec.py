@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.json_codec."""
+import json
+
+import pytest
+
+from axonius_api_client import json_codec
+from axonius_api_client.exceptions import ToolsError
+from axonius_api_client.setup_env import KEY_JSON_CODEC
+
+DATA = {"a": [1, 2.5, None, True], "b": {"c": "d"}, "e": "é"}
+
+
+def get_installed():
+    """Get the names of codecs that can be imported."""
+    installed = []
+    for name in json_codec.CODECS:
+        try:
+            json_codec.load_codec(name=name)
+        except ToolsError:
+            continue
+        installed.append(name)
+    return installed
+
+
+@pytest.fixture
+def reset_codec(monkeypatch):
+    monkeypatch.setattr(json_codec, "CODEC", None)
+
+
+class TestLoadCodec:
+    @pytest.mark.parametrize("name", get_installed())
+    def test_roundtrip(self, name):
+        codec = json_codec.load_codec(name=name)
+        assert codec.NAME == name
+        assert codec.loads(codec.dumps(DATA)) == DATA
+        assert codec.loads(codec.dumps(DATA).encode("utf-8")) == DATA
+        assert json.loads(codec.dumps(DATA, indent=2)) == DATA
+        assert codec.dumps(DATA, indent=2).startswith('{\n  "a": [\n    1,')
+
+    @pytest.mark.parametrize("name", get_installed())
+    def test_fallbacks(self, name):
+        codec = json_codec.load_codec(name=name)
+        big = {"x": 2**70}
+        assert codec.loads(codec.dumps(big)) == big
+        assert codec.dumps(DATA, indent=4) == json.dumps(DATA, indent=4, ensure_ascii=False)
+        assert codec.dumps(DATA, indent=0) == json.dumps(DATA, indent=0, ensure_ascii=False)
+        assert codec.loads("NaN") != codec.loads("NaN")
+
+    @pytest.mark.parametrize("name", get_installed())
+    def test_same_output(self, name):
+        codec = json_codec.load_codec(name=name)
+        assert codec.dumps(DATA) == '{"a":[1,2.5,null,true],"b":{"c":"d"},"e":"é"}'
+        assert codec.dumps(DATA, indent=2) == json.dumps(DATA, indent=2, ensure_ascii=False)
+        assert codec.dumps({1: 1}) == '{"1":1}'
+
+    def test_auto(self):
+        codec = json_codec.load_codec(name="auto")
+        assert codec.NAME == get_installed()[0]
+
+    def test_invalid(self):
+        with pytest.raises(ToolsError):
+            json_codec.load_codec(name="badwolf")
+
+
+class TestGetCodec:
+    def test_env(self, monkeypatch, reset_codec):
+        monkeypatch.setenv(KEY_JSON_CODEC, "json")
+        codec = json_codec.get_codec()
+        assert isinstance(codec, json_codec.JsonCodec)
+        assert codec.NAME == "json"
+        assert json_codec.get_codec() is codec
+        assert json_codec.loads(b'{"a": 1}') == {"a": 1}
+        assert json_codec.dumps({"a": 1}) == '{"a":1}'
+
+    def test_set(self, reset_codec):
+        codec = json_codec.set_codec(name="json")
+        assert json_codec.get_codec() is codec
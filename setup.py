@@ -30,6 +30,12 @@ CONTENTS = "\n".join(read(path=PATH_VERSION))
 exec(CONTENTS, ABOUT)
 README = "\n".join(read(path=PATH_README, clean=False))
 INSTALL_REQUIRES = [x.strip() for x in read(path=PATH_REQ)]
+EXTRAS_REQUIRE = {
+    "orjson": ["orjson"],
+    "parquet": ["pyarrow"],
+    "zstd": ["zstandard"],
+}
+EXTRAS_REQUIRE["all"] = sorted({x for v in EXTRAS_REQUIRE.values() for x in v})
 
 setup(
     name=ABOUT["__title__"],
@@ -45,6 +51,7 @@ setup(
     include_package_data=True,
     python_requires=">=3.5",
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     keywords=["Axonius", "API Library"],
     tests_require=["pytest", "pytest-cov", "pytest-httpbin", "coverage"],
     license=ABOUT["__license__"],